@@ -18,14 +18,17 @@ from components.ats_optimizer import render_ats_optimizer
 from components.europass_complete import render_europass_complete
 from components.ats_optimizer import render_jd_ml_offline_panel
 from components.job_profile_manager import render_job_profile_manager
+from components.page_fit_panel import render_page_fit
+from components.autofill_timing_panel import render_autofill_timing
 
 from utils.json_io import import_cv_json, export_cv_json
 from utils.profiles import ProfileError, load_profile
-from utils.pdf_autofill import file_to_cv
+from utils.pdf_autofill import file_to_cv, warm_extract_pool
 from utils.session import init_session_state, reset_everything, clear_runtime_only, reset_ats_only
 
-from exporters.pdf_generator import generate_pdf_modern, generate_pdf_europass
-from exporters.docx_generator import generate_docx_modern, generate_docx_europass
+from exporters.bundle import export_bundle, warm_bundle_pool
+from exporters.export_cache import export_cache_stats, export_document
+from exporters.txt_generator import generate_txt_ats
 
 
 # ====== Optional PDF Autofill ======
@@ -41,6 +44,11 @@ st.set_page_config(page_title="Coseus - CV Builder - Modern & Europass", page_ic
 init_session_state()
 cv = st.session_state.cv
 
+# worker pools start in the background (spawned once per server process), so
+# the first multi-page import or "Export all" does not pay for it
+warm_extract_pool()
+warm_bundle_pool()
+
 st.title("Coseus - CV Builder - Modern (ATS) vs Europass")
 
 # ==========================
@@ -199,18 +207,41 @@ with tab_import:
             with open(path, "wb") as f:
                 f.write(up.getvalue())
 
-            # ✅ dispatcher: pdf OR docx
-            from utils.pdf_autofill import file_to_cv
-
-            new_cv = file_to_cv(path, lang_hint=lang_hint)
+            # ✅ dispatcher: pdf OR docx; PDFs show page-1 contact fields while the rest is read
+            from utils.pdf_autofill import file_to_cv_staged
+            from utils.autofill_timing import AutofillTimer, log_timing
+
+            preview = st.empty()
+            new_cv = {}
+            timer = AutofillTimer()
+            for stage, data in file_to_cv_staged(path, lang_hint=lang_hint, timing=timer):
+                if stage == "preview":
+                    with preview.container():
+                        st.caption("Prima pagină citită – se procesează restul documentului…")
+                        st.markdown("  \n".join(
+                            f"**{label}:** {data[k]}"
+                            for label, k in (("Nume", "nume_prenume"), ("Poziție", "pozitie_vizata"),
+                                             ("Email", "email"), ("Telefon", "telefon"),
+                                             ("Adresă", "adresa"), ("LinkedIn", "linkedin"))
+                            if data.get(k)
+                        ) or "—")
+                else:
+                    new_cv = data
+            preview.empty()
+            timing = timer.report()
+            log_timing(timing)
 
             # ✅ merge safe (doesn't overwrite user's existing content)
             merge_cv_safe(cv, new_cv)
 
             clear_runtime_only()
+            st.session_state["autofill_timing"] = timing
             st.success("Autofill completed. Check Modern/Europass tabs.")
             st.rerun()
 
+        if st.session_state.get("autofill_timing"):
+            render_autofill_timing(st.session_state["autofill_timing"])
+
 # --------------------------
 # TAB: Modern (ATS-friendly)
 # --------------------------
@@ -319,12 +350,15 @@ with tab_europass:
 # ==========================
 st.sidebar.header("Export")
 
+# live page-count estimate (runs after every tab, so it sees this rerun's edits)
+render_page_fit(cv)
+
 col_pdf, col_docx = st.sidebar.columns(2)
 
 with col_pdf:
     if st.button("PDF Modern", use_container_width=True):
         try:
-            pdf_bytes = generate_pdf_modern(cv, lang=st.session_state.get("export_lang", "en")) if "lang" in generate_pdf_modern.__code__.co_varnames else generate_pdf_modern(cv)
+            pdf_bytes = export_document(cv, "pdf_modern", lang=st.session_state.get("export_lang", "en"))
             st.sidebar.download_button(
                 label="Descarcă PDF Modern",
                 data=pdf_bytes,
@@ -337,7 +371,7 @@ with col_pdf:
 
     if st.button("PDF Europass", use_container_width=True):
         try:
-            pdf_bytes = generate_pdf_europass(cv, lang=st.session_state.get("export_lang", "en")) if "lang" in generate_pdf_europass.__code__.co_varnames else generate_pdf_europass(cv)
+            pdf_bytes = export_document(cv, "pdf_europass", lang=st.session_state.get("export_lang", "en"))
             st.sidebar.download_button(
                 label="Descarcă PDF Europass",
                 data=pdf_bytes,
@@ -351,7 +385,7 @@ with col_pdf:
 with col_docx:
     if st.button("Word Modern", use_container_width=True):
         try:
-            docx_bytes = generate_docx_modern(cv, lang=st.session_state.get("export_lang", "en")) if "lang" in generate_docx_modern.__code__.co_varnames else generate_docx_modern(cv)
+            docx_bytes = export_document(cv, "docx_modern", lang=st.session_state.get("export_lang", "en"))
             st.sidebar.download_button(
                 label="Descarcă Word Modern",
                 data=docx_bytes,
@@ -364,7 +398,7 @@ with col_docx:
 
     if st.button("Word Europass", use_container_width=True):
         try:
-            docx_bytes = generate_docx_europass(cv, lang=st.session_state.get("export_lang", "en")) if "lang" in generate_docx_europass.__code__.co_varnames else generate_docx_europass(cv)
+            docx_bytes = export_document(cv, "docx_europass", lang=st.session_state.get("export_lang", "en"))
             st.sidebar.download_button(
                 label="Descarcă Word Europass",
                 data=docx_bytes,
@@ -375,73 +409,28 @@ with col_docx:
         except Exception as e:
             st.sidebar.error(f"Eroare Word Europass: {str(e)}")
 
+if st.sidebar.button("Export all (ZIP)", use_container_width=True):
+    try:
+        zip_bytes = export_bundle(cv, lang=st.session_state.get("export_lang", "en"))
+        st.sidebar.download_button(
+            label="Descarcă toate (ZIP)",
+            data=zip_bytes,
+            file_name="cv_export_all.zip",
+            mime="application/zip",
+            use_container_width=True,
+        )
+    except Exception as e:
+        st.sidebar.error(f"Eroare export ZIP: {str(e)}")
+
+_xc = export_cache_stats()
+if _xc["hits"] or _xc["misses"]:
+    st.sidebar.caption(f"Export cache: {_xc['hits']} hits · {_xc['misses']} misses")
+
 st.sidebar.markdown("---")
 
 # Plain text export (kept, but updated to prefer rezumat_bullets)
 if st.sidebar.button("Export ATS .txt (plain)", use_container_width=True):
-    parts = []
-    parts.append(cv.get("nume_prenume", ""))
-    parts.append(cv.get("pozitie_vizata", ""))
-
-    parts.append(f"Phone: {cv.get('telefon','')}")
-    parts.append(f"Email: {cv.get('email','')}")
-    if cv.get("linkedin"):
-        parts.append(f"LinkedIn: {cv.get('linkedin')}")
-    if cv.get("github"):
-        parts.append(f"GitHub: {cv.get('github')}")
-    if cv.get("website"):
-        parts.append(f"Website: {cv.get('website')}")
-
-    parts.append("")
-
-    # Summary
-    bullets = cv.get("rezumat_bullets", [])
-    if isinstance(bullets, list) and bullets:
-        parts.append("SUMMARY")
-        for b in bullets:
-            b = str(b).strip()
-            if b:
-                parts.append(f"• {b}")
-        parts.append("")
-    elif cv.get("rezumat"):
-        parts.append("SUMMARY")
-        parts.append(str(cv.get("rezumat", "")).strip())
-        parts.append("")
-
-    parts.append("SKILLS")
-    for line in [
-        cv.get("modern_skills_headline", ""),
-        cv.get("modern_tools", ""),
-        cv.get("modern_certs", ""),
-        cv.get("modern_keywords_extra", ""),
-    ]:
-        if str(line).strip():
-            parts.append(str(line).strip())
-
-    parts.append("")
-
-    if cv.get("experienta"):
-        parts.append("EXPERIENCE / PROJECTS")
-        for e in cv.get("experienta", []):
-            parts.append(f"- {e.get('functie','')} ({e.get('perioada','')})")
-            if e.get("tehnologii"):
-                parts.append(f"  Tools: {e.get('tehnologii')}")
-            if e.get("link"):
-                parts.append(f"  Link: {e.get('link')}")
-            if e.get("activitati"):
-                for b in str(e.get("activitati", "")).splitlines():
-                    b = b.strip()
-                    if b:
-                        parts.append(f"  • {b.lstrip('-• ').strip()}")
-        parts.append("")
-
-    if cv.get("educatie"):
-        parts.append("EDUCATION")
-        for ed in cv.get("educatie", []):
-            # your schema uses titlu/organizatie/perioada in newer code
-            parts.append(f"- {ed.get('titlu','')} — {ed.get('organizatie','')} ({ed.get('perioada','')})")
-
-    text = "\n".join([p for p in parts if p is not None])
+    text = generate_txt_ats(cv)
     st.sidebar.download_button(
         "Descarcă ATS.txt",
         text,
@@ -0,0 +1,359 @@
+# batch_ingest.py - import a directory of PDF/DOCX CVs without the Streamlit UI
+"""
+Usage:
+    python batch_ingest.py INPUT_DIR -o OUT_DIR
+    python batch_ingest.py INPUT_DIR -o OUT_DIR --lang ro -j 4 --timeout 30
+    python batch_ingest.py INPUT_DIR -o OUT_DIR --force      # ignore the resume manifest
+
+Every INPUT_DIR/<name>.pdf|.docx goes through utils/pdf_autofill.file_to_cv
+(the same parser as the "Import PDF (Autofill)" tab) and is written as
+app-native JSON to OUT_DIR/<name>.json, ready for the JSON import or
+batch_render.py. Files are parsed by long-lived worker processes, one file
+at a time each; a worker that exceeds --timeout on a file is killed and
+replaced, so one pathological PDF cannot stall the batch. Inputs already
+parsed from the same hash, language and parser version (per the manifest of
+a previous run, and still on disk) are skipped, so an interrupted run
+resumes where it stopped. Throughput, failures and field-fill rates are
+written to OUT_DIR/ingest_report.json.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import statistics
+import sys
+import time
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from batch_render import _sha256_file, _write_atomic
+from utils import autofill_cache, pdf_autofill
+from utils.json_io import _ensure_defaults, export_cv_json
+
+
+MANIFEST_NAME = ".ingest_manifest.json"
+REPORT_NAME = "ingest_report.json"
+EXTENSIONS = (".pdf", ".docx")
+
+# fields counted in the fill-rate summary (what the parser tries to find)
+FILL_FIELDS = (
+    "nume_prenume",
+    "pozitie_vizata",
+    "email",
+    "telefon",
+    "adresa",
+    "linkedin",
+    "github",
+    "website",
+    "rezumat_bullets",
+    "experienta",
+    "educatie",
+    "limbi_straine",
+    "permis_conducere",
+)
+
+# (input file name, source path, output path, fingerprint)
+Task = Tuple[str, str, str, Dict]
+
+
+def _parser_fingerprint() -> str:
+    return f"{autofill_cache._extractor_version()}|{autofill_cache._parser_version()}"
+
+
+def _filled(cv: Dict) -> List[str]:
+    out = []
+    for k in FILL_FIELDS:
+        v = cv.get(k)
+        if isinstance(v, str):
+            v = v.strip()
+        if v:
+            out.append(k)
+    return out
+
+
+def _failed(stage: str, message: str) -> Dict:
+    return {"timings_ms": {}, "errors": {stage: message}, "output": "", "filled": []}
+
+
+def _ingest_one(src: str, dest: str, lang: str, use_cache: bool) -> Dict:
+    """Worker: parse one CV file and write its JSON. Never raises."""
+    result: Dict = {"timings_ms": {}, "errors": {}, "output": "", "filled": []}
+    t0 = time.perf_counter()
+    try:
+        cv = _ensure_defaults(pdf_autofill.file_to_cv(src, lang_hint=lang, use_cache=use_cache))
+    except Exception as e:
+        result["errors"]["parse"] = f"{type(e).__name__}: {e}"
+        return result
+    result["timings_ms"]["parse"] = round((time.perf_counter() - t0) * 1000, 2)
+
+    t0 = time.perf_counter()
+    try:
+        _write_atomic(dest, export_cv_json(cv).encode("utf-8"))
+        result["output"] = dest
+        result["filled"] = _filled(cv)
+    except Exception as e:
+        result["errors"]["write"] = f"{type(e).__name__}: {e}"
+    result["timings_ms"]["write"] = round((time.perf_counter() - t0) * 1000, 2)
+    return result
+
+
+def _worker_main(conn, lang: str, use_cache: bool) -> None:
+    # files are the unit of parallelism here; no nested page-extraction pool
+    pdf_autofill.MAX_EXTRACT_WORKERS = 1
+    # Ctrl-C is handled by the parent, which stops the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        src, dest = task
+        conn.send(_ingest_one(src, dest, lang, use_cache))
+
+
+class _Worker:
+    """One worker process fed over a Pipe, so a stuck file can be killed on its own."""
+
+    def __init__(self, lang: str, use_cache: bool) -> None:
+        self.conn, child = multiprocessing.Pipe()
+        self.proc = multiprocessing.Process(target=_worker_main, args=(child, lang, use_cache), daemon=True)
+        self.proc.start()
+        child.close()
+        self.task: Optional[Task] = None
+        self.deadline = float("inf")
+
+    def submit(self, task: Task, timeout: float) -> None:
+        self.task = task
+        self.deadline = time.monotonic() + timeout if timeout > 0 else float("inf")
+        self.conn.send((task[1], task[2]))
+
+    def kill(self) -> None:
+        self.proc.terminate()
+        self.proc.join(1)
+        if self.proc.is_alive():
+            self.proc.kill()
+            self.proc.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.kill()
+            return
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.proc.join(2)
+        if self.proc.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+def _run_workers(
+    todo: List[Task],
+    jobs: int,
+    lang: str,
+    use_cache: bool,
+    timeout: float,
+    record: Callable[[Task, Dict], None],
+) -> None:
+    queue: Deque[Task] = deque(todo)
+    workers = [_Worker(lang, use_cache) for _ in range(min(jobs, len(todo)))]
+    try:
+        while True:
+            for w in workers:
+                if w.task is None and queue:
+                    w.submit(queue.popleft(), timeout)
+            busy = [w for w in workers if w.task is not None]
+            if not busy:
+                break
+
+            wait_s = min(w.deadline for w in busy) - time.monotonic()
+            ready = wait([w.conn for w in busy], timeout=None if wait_s == float("inf") else max(0.0, wait_s))
+
+            for w in busy:
+                if w.conn in ready:
+                    try:
+                        res = w.conn.recv()
+                    except (EOFError, OSError):
+                        res = _failed("worker", f"worker exited (code {w.proc.exitcode})")
+                    else:
+                        record(w.task, res)
+                        w.task = None
+                        continue
+                elif time.monotonic() < w.deadline:
+                    continue
+                else:
+                    res = _failed("timeout", f"no result after {timeout:g}s")
+
+                # crashed or stuck: record the file, replace the process
+                task = w.task
+                w.kill()
+                workers[workers.index(w)] = _Worker(lang, use_cache)
+                record(task, res)
+    finally:
+        for w in workers:
+            w.stop()
+
+
+def _output_names(files: List[str]) -> Dict[str, str]:
+    """<name>.json per input; <name>_<ext>.json when cv.pdf and cv.docx sit side by side."""
+    stems: Dict[str, int] = {}
+    for fn in files:
+        stem = os.path.splitext(fn)[0]
+        stems[stem] = stems.get(stem, 0) + 1
+    out = {}
+    for fn in files:
+        stem, ext = os.path.splitext(fn)
+        out[fn] = f"{stem}.json" if stems[stem] == 1 else f"{stem}_{ext.lstrip('.').lower()}.json"
+    return out
+
+
+def _load_manifest(path: str) -> Dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _up_to_date(entry: Optional[Dict], fingerprint: Dict, dest: str) -> bool:
+    if not entry or any(entry.get(k) != v for k, v in fingerprint.items()):
+        return False
+    return os.path.isfile(dest)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def _summary(report: Dict[str, Dict], processed_bytes: int, wall: float) -> Dict:
+    counts = {s: sum(1 for r in report.values() if r["status"] == s) for s in ("ok", "skipped", "error", "timeout")}
+    processed = [r for r in report.values() if r["status"] != "skipped"]
+    per_file = [sum(r.get("timings_ms", {}).values()) for r in processed if r["status"] == "ok"]
+    with_output = [r for r in report.values() if r["status"] in ("ok", "skipped")]
+
+    fill_rates = {}
+    for k in FILL_FIELDS:
+        n = sum(1 for r in with_output if k in (r.get("filled") or []))
+        fill_rates[k] = round(n / len(with_output), 3) if with_output else 0.0
+
+    return {
+        **counts,
+        "wall_s": round(wall, 3),
+        "files_per_s": round(len(processed) / wall, 2) if wall > 0 else 0.0,
+        "mb_per_s": round(processed_bytes / (1024 * 1024) / wall, 2) if wall > 0 else 0.0,
+        "file_ms": {
+            "median": round(statistics.median(per_file), 2) if per_file else 0.0,
+            "p95": round(_percentile(per_file, 0.95), 2),
+            "max": round(max(per_file), 2) if per_file else 0.0,
+        },
+        "fill_rates": fill_rates,
+        "failures": {fn: r["errors"] for fn, r in sorted(report.items()) if r["status"] in ("error", "timeout")},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Import a directory of PDF/DOCX CVs into app JSON headlessly.")
+    ap.add_argument("input_dir")
+    ap.add_argument("-o", "--out", required=True, help="output directory")
+    ap.add_argument("--lang", default="en", help="language hint for the parser (en/ro)")
+    ap.add_argument("-j", "--jobs", type=int, default=0, help="worker processes (default: all cores)")
+    ap.add_argument("--timeout", type=float, default=60.0, help="seconds per file before its worker is killed (0: none)")
+    ap.add_argument("--no-cache", action="store_true", help="bypass the autofill text/CV cache")
+    ap.add_argument("--force", action="store_true", help="re-parse even if outputs are up to date")
+    ap.add_argument("--report", default="", help=f"report path (default: OUT/{REPORT_NAME})")
+    args = ap.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        print(f"Input directory not found: {args.input_dir}", file=sys.stderr)
+        return 2
+    os.makedirs(args.out, exist_ok=True)
+
+    manifest_path = os.path.join(args.out, MANIFEST_NAME)
+    manifest = {} if args.force else _load_manifest(manifest_path)
+    report_path = args.report or os.path.join(args.out, REPORT_NAME)
+    parser_version = _parser_fingerprint()
+
+    files = sorted(fn for fn in os.listdir(args.input_dir) if fn.lower().endswith(EXTENSIONS))
+    names = _output_names(files)
+    report: Dict[str, Dict] = {}
+    todo: List[Task] = []
+    processed_bytes = 0
+    for fn in files:
+        src = os.path.join(args.input_dir, fn)
+        dest = os.path.join(args.out, names[fn])
+        fingerprint = {"sha256": _sha256_file(src), "lang": args.lang, "parser": parser_version}
+        entry = manifest.get(fn)
+        if _up_to_date(entry, fingerprint, dest):
+            report[fn] = {"status": "skipped", "sha256": fingerprint["sha256"], "filled": entry.get("filled") or []}
+            continue
+        todo.append((fn, src, dest, fingerprint))
+        processed_bytes += os.path.getsize(src)
+
+    jobs = max(1, args.jobs or os.cpu_count() or 1)
+    print(f"{len(files)} file(s): {len(todo)} to parse, {len(files) - len(todo)} up to date; {jobs} worker(s).")
+
+    t_start = time.perf_counter()
+    done = 0
+
+    def record(task: Task, res: Dict) -> None:
+        nonlocal done
+        fn, _, dest, fingerprint = task
+        done += 1
+        status = "ok" if not res["errors"] else ("timeout" if "timeout" in res["errors"] else "error")
+        report[fn] = {"status": status, "sha256": fingerprint["sha256"], **res}
+        if status == "ok":
+            manifest[fn] = dict(fingerprint, output=os.path.basename(dest), filled=res["filled"])
+        else:
+            manifest.pop(fn, None)
+        # keep the manifest current so an interrupted run resumes where it stopped
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+        total = sum(res["timings_ms"].values())
+        print(f"[{done}/{len(todo)}] {status:7} {fn} ({total:.0f} ms)" + (f" - {res['errors']}" if res["errors"] else ""))
+
+    interrupted = False
+    if todo:
+        try:
+            _run_workers(todo, jobs, args.lang, not args.no_cache, args.timeout, record)
+        except KeyboardInterrupt:
+            interrupted = True
+            print(f"Interrupted after {done}/{len(todo)} file(s); run again to resume.")
+
+    wall = time.perf_counter() - t_start
+    summary = {
+        "input_dir": os.path.abspath(args.input_dir),
+        "out_dir": os.path.abspath(args.out),
+        "lang": args.lang,
+        "jobs": jobs,
+        "timeout_s": args.timeout,
+        **_summary(report, processed_bytes, wall),
+    }
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"summary": summary, "files": dict(sorted(report.items()))}, f, indent=2)
+
+    print(
+        f"Done in {wall:.1f}s ({summary['files_per_s']} files/s): {summary['ok']} ok, {summary['skipped']} skipped, "
+        f"{summary['error']} error(s), {summary['timeout']} timeout(s). Report: {report_path}"
+    )
+    if summary["ok"] or summary["skipped"]:
+        print("Field fill rates: " + ", ".join(f"{k} {v:.0%}" for k, v in summary["fill_rates"].items()))
+    if interrupted:
+        return 130
+    return 1 if summary["error"] or summary["timeout"] else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,207 @@
+# batch_render.py - render a directory of CV JSON files without the Streamlit UI
+"""
+Usage:
+    python batch_render.py INPUT_DIR -o OUT_DIR
+    python batch_render.py INPUT_DIR -o OUT_DIR -t pdf_modern,docx_modern --lang ro -j 4
+    python batch_render.py INPUT_DIR -o OUT_DIR --force      # ignore the resume manifest
+
+Each INPUT_DIR/<name>.json (as written by utils/json_io.export_cv_json) is
+imported with import_cv_json and rendered to OUT_DIR/<name>/<file> for every
+template. Outputs already rendered from the same input hash, language and
+exporter version (per the manifest of a previous run, and still on disk) are
+skipped, so an interrupted run resumes where it stopped. A per-file
+timing/error report is written to OUT_DIR/batch_report.json.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from exporters.bundle import BUNDLE_FILES
+from exporters.export_cache import EXPORTERS, _exporters_version
+from exporters.txt_generator import generate_txt_ats
+from utils.json_io import import_cv_json
+
+
+TEMPLATES: Dict[str, str] = dict(BUNDLE_FILES, txt="cv_ats_plain.txt")
+MANIFEST_NAME = ".batch_manifest.json"
+REPORT_NAME = "batch_report.json"
+
+
+def _sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _render_one(src: str, dest_dir: str, templates: List[str], lang: str) -> Dict:
+    """Worker: import one CV JSON and render every template. Never raises."""
+    result: Dict = {"timings_ms": {}, "errors": {}, "outputs": {}}
+    t0 = time.perf_counter()
+    try:
+        with open(src, "r", encoding="utf-8") as f:
+            cv = import_cv_json(f.read())
+    except Exception as e:
+        result["errors"]["import"] = f"{type(e).__name__}: {e}"
+        return result
+    result["timings_ms"]["import"] = round((time.perf_counter() - t0) * 1000, 2)
+
+    os.makedirs(dest_dir, exist_ok=True)
+    for template in templates:
+        t0 = time.perf_counter()
+        try:
+            if template == "txt":
+                data = generate_txt_ats(cv).encode("utf-8")
+            else:
+                data = EXPORTERS[template](cv, lang=lang)
+            out_path = os.path.join(dest_dir, TEMPLATES[template])
+            _write_atomic(out_path, data)
+            result["outputs"][template] = out_path
+        except Exception as e:
+            result["errors"][template] = f"{type(e).__name__}: {e}"
+        result["timings_ms"][template] = round((time.perf_counter() - t0) * 1000, 2)
+    return result
+
+
+def _load_manifest(path: str) -> Dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _missing_templates(entry: Optional[Dict], fingerprint: Dict, templates: List[str], dest_dir: str) -> List[str]:
+    """Templates that still need rendering for this input (all of them if the input changed)."""
+    if not entry or any(entry.get(k) != v for k, v in fingerprint.items()):
+        return list(templates)
+    done = set(entry.get("rendered") or [])
+    return [t for t in templates if t not in done or not os.path.isfile(os.path.join(dest_dir, TEMPLATES[t]))]
+
+
+def _parse_templates(raw: str) -> List[str]:
+    if raw.strip().lower() == "all":
+        return list(TEMPLATES)
+    out = []
+    for t in (x.strip() for x in raw.split(",")):
+        if not t:
+            continue
+        if t not in TEMPLATES:
+            raise SystemExit(f"Unknown template '{t}'. Choose from: {', '.join(TEMPLATES)} (or 'all').")
+        out.append(t)
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Render a directory of CV JSON files (PDF/DOCX/TXT) headlessly.")
+    ap.add_argument("input_dir")
+    ap.add_argument("-o", "--out", required=True, help="output directory")
+    ap.add_argument("-t", "--templates", default="all", help=f"comma list of {', '.join(TEMPLATES)} (default: all)")
+    ap.add_argument("--lang", default="en")
+    ap.add_argument("-j", "--jobs", type=int, default=0, help="worker processes (default: all cores)")
+    ap.add_argument("--force", action="store_true", help="re-render even if outputs are up to date")
+    ap.add_argument("--report", default="", help=f"report path (default: OUT/{REPORT_NAME})")
+    args = ap.parse_args(argv)
+
+    templates = _parse_templates(args.templates)
+    if not os.path.isdir(args.input_dir):
+        print(f"Input directory not found: {args.input_dir}", file=sys.stderr)
+        return 2
+    os.makedirs(args.out, exist_ok=True)
+
+    manifest_path = os.path.join(args.out, MANIFEST_NAME)
+    manifest = {} if args.force else _load_manifest(manifest_path)
+    report_path = args.report or os.path.join(args.out, REPORT_NAME)
+    exporters_version = _exporters_version()
+
+    files = sorted(fn for fn in os.listdir(args.input_dir) if fn.lower().endswith(".json"))
+    report: Dict[str, Dict] = {}
+    todo = []
+    for fn in files:
+        src = os.path.join(args.input_dir, fn)
+        dest = os.path.join(args.out, os.path.splitext(fn)[0])
+        fingerprint = {"sha256": _sha256_file(src), "lang": args.lang, "exporters": exporters_version}
+        missing = _missing_templates(manifest.get(fn), fingerprint, templates, dest)
+        if not missing:
+            report[fn] = {"status": "skipped", "sha256": fingerprint["sha256"]}
+            continue
+        todo.append((fn, src, dest, missing, fingerprint))
+
+    jobs = args.jobs or os.cpu_count() or 1
+    print(f"{len(files)} file(s): {len(todo)} to render, {len(files) - len(todo)} up to date; {jobs} worker(s).")
+
+    t_start = time.perf_counter()
+    done = 0
+
+    def record(fn: str, fingerprint: Dict, res: Dict) -> None:
+        nonlocal done
+        done += 1
+        status = "error" if res["errors"] else "ok"
+        report[fn] = {"status": status, "sha256": fingerprint["sha256"], **res}
+        prev = manifest.get(fn) or {}
+        rendered = set(prev.get("rendered") or []) if all(prev.get(k) == v for k, v in fingerprint.items()) else set()
+        rendered.update(res["outputs"])
+        if rendered:
+            manifest[fn] = dict(fingerprint, rendered=sorted(rendered))
+        else:
+            manifest.pop(fn, None)
+        # keep the manifest current so an interrupted run resumes where it stopped
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+        total = sum(res["timings_ms"].values())
+        print(f"[{done}/{len(todo)}] {status:5} {fn} ({total:.0f} ms)" + (f" - {res['errors']}" if res["errors"] else ""))
+
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(_render_one, src, dest, missing, args.lang): (fn, fp)
+                for fn, src, dest, missing, fp in todo
+            }
+            for fut in as_completed(futures):
+                fn, fp = futures[fut]
+                try:
+                    res = fut.result()
+                except Exception as e:  # worker crashed
+                    res = {"timings_ms": {}, "errors": {"worker": f"{type(e).__name__}: {e}"}, "outputs": {}}
+                record(fn, fp, res)
+    else:
+        for fn, src, dest, missing, fp in todo:
+            record(fn, fp, _render_one(src, dest, missing, args.lang))
+
+    wall = time.perf_counter() - t_start
+    counts = {s: sum(1 for r in report.values() if r["status"] == s) for s in ("ok", "skipped", "error")}
+    summary = {
+        "input_dir": os.path.abspath(args.input_dir),
+        "out_dir": os.path.abspath(args.out),
+        "templates": templates,
+        "lang": args.lang,
+        "jobs": jobs,
+        "wall_s": round(wall, 3),
+        **counts,
+    }
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"summary": summary, "files": dict(sorted(report.items()))}, f, indent=2)
+
+    print(f"Done in {wall:.1f}s: {counts['ok']} ok, {counts['skipped']} skipped, {counts['error']} error(s). Report: {report_path}")
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+"Autofill from file" with the SHA-256 keyed autofill cache: first upload,
+re-upload (memory hit), re-upload after a restart (disk hit) and after a
+parser change (text hit, parse only).
+
+    CVBUILDER_AUTOFILL_CACHE_MB=32 python -m benchmarks.bench_autofill_cache
+
+(the disk tier is opt-in; without the variable the "disk hit" is a full re-read)
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+from benchmarks.cv_corpus import generate_cv
+from exporters.pdf_generator import generate_pdf_europass
+from utils import autofill_cache
+from utils.pdf_autofill import file_to_cv
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1000.0
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in (1, 4):
+            path = os.path.join(tmp, f"europass_{scale}x.pdf")
+            with open(path, "wb") as f:
+                f.write(generate_pdf_europass(generate_cv(scale, seed=scale)))
+
+            autofill_cache.clear_autofill_cache()
+            ref, cold = timed(lambda: file_to_cv(path, use_cache=False))
+            _, first = timed(lambda: file_to_cv(path))
+            mem_cv, mem = timed(lambda: file_to_cv(path))
+
+            # restart: empty memory tiers, disk tier intact
+            for tier in (autofill_cache._text_cache, autofill_cache._cv_cache):
+                tier._mem.clear()
+                tier._mem_bytes = 0
+            disk_cv, disk = timed(lambda: file_to_cv(path))
+            disk_label = "disk hit" if autofill_cache._DISK_MB > 0 else "no disk tier"
+
+            # parser changed: parsed CVs stale, extracted text still valid
+            autofill_cache._cv_cache.clear()
+            _, reparse = timed(lambda: file_to_cv(path))
+
+            print(
+                f"{scale}x ({os.path.getsize(path) // 1024} kB): uncached {cold:.1f} ms | first {first:.1f} ms | "
+                f"memory hit {mem:.2f} ms | {disk_label} {disk:.2f} ms | parser change {reparse:.1f} ms | "
+                f"identical={mem_cv == ref and disk_cv == ref}"
+            )
+        autofill_cache.clear_autofill_cache()
+
+
+if __name__ == "__main__":
+    main()
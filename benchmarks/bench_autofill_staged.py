@@ -0,0 +1,60 @@
+"""
+Staged PDF autofill: time to the first-page preview vs the full parse,
+on generated Europass PDFs of growing length (autofill cache bypassed).
+
+    python -m benchmarks.bench_autofill_staged [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.cv_corpus import generate_cv
+from exporters.pdf_generator import generate_pdf_europass
+from utils import pdf_autofill
+
+
+def staged_timings(path: str):
+    t0 = time.perf_counter()
+    stages = {}
+    for stage, data in pdf_autofill.file_to_cv_staged(path, use_cache=False):
+        stages[stage] = ((time.perf_counter() - t0) * 1000.0, data)
+    return stages
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    print(f"cpu_count={os.cpu_count()}")
+    print(f"{'scale':>5} {'pages':>5} {'file_to_cv ms':>14} {'preview ms':>11} {'staged full ms':>15} {'preview share':>14}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in (1, 2, 4, 6):
+            path = os.path.join(tmp, f"cv{scale}.pdf")
+            with open(path, "wb") as f:
+                f.write(generate_pdf_europass(generate_cv(scale=scale)))
+            _, pages = pdf_autofill._read_pdf_first_page(path)
+
+            ref = pdf_autofill.file_to_cv(path, use_cache=False)
+            stages = staged_timings(path)
+            assert stages["full"][1] == ref, "staged result differs from file_to_cv"
+            assert stages["preview"][1]["email"] == ref["email"]
+
+            full, first, staged = [], [], []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                pdf_autofill.file_to_cv(path, use_cache=False)
+                full.append((time.perf_counter() - t0) * 1000.0)
+                st = staged_timings(path)
+                first.append(st["preview"][0])
+                staged.append(st["full"][0])
+            t_full, t_first, t_staged = (statistics.median(x) for x in (full, first, staged))
+            print(f"{scale:>5} {pages:>5} {t_full:>14.1f} {t_first:>11.1f} {t_staged:>15.1f} {t_first / t_full:>13.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+pdf_autofill contact fields: per-field regex searches vs the one-pass contact
+scan, on CV texts of growing length.
+
+    python -m benchmarks.bench_contacts [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+from typing import Dict
+
+from benchmarks.bench_segmenter import cv_text
+from benchmarks.timing import best_of
+from utils import pdf_autofill as pa
+
+KEYS = ("email", "telefon", "adresa", "linkedin", "github", "website")
+
+
+def legacy_contacts(text: str) -> Dict[str, str]:
+    """The original searches, kept as the reference result."""
+    find = pa._find_first
+    email = find(r"\bEmail:\s*([^\s]+)", text) or find(r"\bE-mail:\s*([^\s]+)", text)
+    if not email:
+        email = find(r"\b([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})\b", text)
+    phone = pa._normalize_phone(find(r"(?:Tel|Telefon|Phone):\s*([+\d][\d\s\-\(\)]+)", text) or "")
+    location = pa._clean(
+        find(r"(?:City|Oraș|Oras|Locație|Locatie):\s*([^\n]+)", text)
+        or find(r"(?:Address|Adresa|Adresă):\s*([^\n]+)", text)
+        or ""
+    )
+
+    def find_full(rx: str) -> str:
+        m = re.search(rx, text, flags=re.IGNORECASE)
+        return pa._normalize_url(m.group(0)).replace("https://", "").replace("http://", "").rstrip("/") if m else ""
+
+    linkedin = find_full(r"(?:https?://)?(?:www\.)?linkedin\.com/[^\s\)\],;]+")
+    github = find_full(r"(?:https?://)?(?:www\.)?github\.com/[^\s\)\],;]+")
+    website = ""
+    for c in re.findall(
+        r"(?<!@)\b(?:https?://)?(?:www\.)?[a-z0-9][a-z0-9\-]+\.[a-z]{2,}(?:/[^\s\)\],;]+)?\b", text.lower()
+    ):
+        if "linkedin.com" in c or "github.com" in c:
+            continue
+        website = pa._normalize_url(c).replace("https://", "").replace("http://", "").rstrip("/")
+        break
+    if website and website.lower().replace("www.", "").split("/")[0] in pa._MAIL_DOMAINS:
+        website = ""
+    return {"email": email or "", "telefon": phone, "adresa": location,
+            "linkedin": linkedin, "github": github, "website": website}
+
+
+def onepass_contacts(text: str) -> Dict[str, str]:
+    header = pa._extract_header(text, lines=[])  # no lines: skip the name/headline guess
+    return {k: header[k] for k in KEYS}
+
+
+def unlabelled(text: str) -> str:
+    """No contact labels or addresses: every legacy search scans to the end."""
+    text = re.sub(r"(?im)^(phone|email|linkedin):.*$", "", text)
+    return text.replace("@", " at ")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    cases = [(f"cv x{s}", cv_text(s)) for s in (1, 4, 16, 64)]
+    cases += [(f"unlabelled x{s}", unlabelled(cv_text(s))) for s in (1, 16, 64)]
+
+    print(f"{'text':>15} {'chars':>9} {'legacy ms':>10} {'one-pass ms':>12} {'speedup':>8}")
+    for label, text in cases:
+        assert onepass_contacts(text) == legacy_contacts(text), f"contact mismatch: {label}"
+        t_ref = best_of(lambda: legacy_contacts(text), args.repeat)
+        t_new = best_of(lambda: onepass_contacts(text), args.repeat)
+        print(f"{label:>15} {len(text):>9} {t_ref:>10.2f} {t_new:>12.2f} {t_ref / max(t_new, 1e-9):>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
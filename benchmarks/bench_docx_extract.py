@@ -0,0 +1,89 @@
+"""
+DOCX autofill text extraction: python-docx object walk vs the streaming
+document.xml reader, on Europass-style table CVs of growing length.
+
+    python -m benchmarks.bench_docx_extract [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+from docx import Document
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.timing import best_of
+from utils import pdf_autofill
+
+
+def python_docx_text(path: str) -> str:
+    """The original reader: body paragraphs, then every cell of every table row."""
+    doc = Document(path)
+    parts = [p.text for p in doc.paragraphs if p.text]
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                txt = cell.text.strip()
+                if txt:
+                    parts.append(txt)
+    return "\n".join(parts)
+
+
+def europass_table_docx(path: str, scale: int) -> None:
+    """Label column on the left, vertically merged over each section's rows (Europass layout)."""
+    cv = generate_cv(scale=scale)
+    doc = Document()
+    doc.add_paragraph(cv["nume_prenume"])
+    doc.add_paragraph(cv["pozitie_vizata"])
+    for title, rows in (
+        ("WORK EXPERIENCE", [
+            [f"{e['functie']} - {e['angajator']}", e["perioada"], *e["activitati"].splitlines()]
+            for e in cv["experienta"]
+        ]),
+        ("EDUCATION AND TRAINING", [[f"{e['perioada']} {e['titlu']} - {e['organizatie']}"] for e in cv["educatie"]]),
+    ):
+        lines = [ln for entry in rows for ln in entry]
+        table = doc.add_table(rows=len(lines), cols=2)
+        label = table.cell(0, 0).merge(table.cell(len(lines) - 1, 0))
+        label.text = title
+        for i, ln in enumerate(lines):
+            table.cell(i, 1).text = ln
+    doc.save(path)
+
+
+def peak_kb(fn) -> float:
+    # Python-heap peak only: lxml's C-side tree (python-docx) is not traced
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'scale':>5} {'docx kB':>8} {'python-docx ms':>15} {'stream ms':>10} {'speedup':>8} "
+          f"{'peak kB old/new':>16} {'chars old/new':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in (1, 2, 4, 10):
+            path = os.path.join(tmp, f"cv{scale}.docx")
+            europass_table_docx(path, scale)
+            old_text = python_docx_text(path)
+            new_text = pdf_autofill._read_docx_text(path)
+            # same lines, minus the repeated merged label cells
+            assert set(new_text.splitlines()) == set(old_text.splitlines())
+            t_old = best_of(lambda: python_docx_text(path), args.repeat)
+            t_new = best_of(lambda: pdf_autofill._read_docx_text(path), args.repeat)
+            m_old = peak_kb(lambda: python_docx_text(path))
+            m_new = peak_kb(lambda: pdf_autofill._read_docx_text(path))
+            print(f"{scale:>5} {os.path.getsize(path) / 1024:>8.0f} {t_old:>15.1f} {t_new:>10.1f} "
+                  f"{t_old / max(t_new, 1e-9):>7.1f}x {m_old:>8.0f}/{m_new:<7.0f} {len(old_text):>8}/{len(new_text):<7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+extract_keywords near-duplicate merge: trigram-blocked vs all-pairs.
+
+    python -m benchmarks.bench_keyword_merge [--words 5000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+from typing import List, Tuple
+
+from benchmarks.jd_corpus import generate_jd, vocabulary
+from benchmarks.timing import best_of
+from utils import jd_ml_offline as jd
+
+
+def merge_all_pairs(items: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+    """The original O(n^2) merge, kept as the reference result."""
+    merged: List[Tuple[str, float]] = []
+    for k, sc in items:
+        placed = False
+        for i, (mk, msc) in enumerate(merged):
+            if jd._similar(k, mk) >= jd.MERGE_SIMILARITY:
+                merged[i] = (mk, msc + sc)
+                placed = True
+                break
+        if not placed:
+            merged.append((k, float(sc)))
+    return merged
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--words", type=int, default=5000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    text = generate_jd(args.words, vocab=vocabulary())
+    counter = jd._candidate_counts(text)
+    print(f"JD: {len(text.split())} words, {len(counter)} distinct candidates")
+    print(f"{'max_keywords':>12} {'items':>6} {'all-pairs ms':>13} {'blocked ms':>11} {'speedup':>8}")
+
+    for max_kw in (50, 200, 500):
+        items = counter.most_common(max_kw * 2)
+        ref = merge_all_pairs(items)
+        got = jd._merge_near_duplicates(items)
+        assert got == ref, f"merge mismatch at max_keywords={max_kw}"
+        t_ref = best_of(lambda: merge_all_pairs(items), args.repeat)
+        t_new = best_of(lambda: jd._merge_near_duplicates(items), args.repeat)
+        print(f"{max_kw:>12} {len(items):>6} {t_ref:>13.1f} {t_new:>11.1f} {t_ref / max(t_new, 1e-9):>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
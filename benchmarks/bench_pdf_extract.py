@@ -0,0 +1,69 @@
+"""
+PDF autofill text extraction: sequential pdfplumber vs the page-range
+process pool, on generated multi-page Europass PDFs. The pool is the app's
+spawn pool, timed cold (workers started by the import itself, as before the
+app warmed it at start) and warm.
+
+    python -m benchmarks.bench_pdf_extract [--workers N] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.timing import median_ms
+from exporters.pdf_generator import generate_pdf_europass
+from utils import pdf_autofill
+
+
+def spawn_pool(workers: int) -> ProcessPoolExecutor:
+    """Same pool as pdf_autofill._start_pool, without the cpu_count cap."""
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=pdf_autofill._warm_worker
+    )
+
+
+def cold_ms(path: str, n: int, workers: int) -> float:
+    """Fresh pool per run: spawn + imports + extraction."""
+    t0 = time.perf_counter()
+    with spawn_pool(workers) as pool:
+        pdf_autofill._extract_parallel(pool, path, n)
+        t = time.perf_counter() - t0
+    return t * 1000.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--workers", type=int, default=min(pdf_autofill.MAX_EXTRACT_WORKERS, os.cpu_count() or 1))
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    workers = max(2, args.workers)
+    print(f"cpu_count={os.cpu_count()} workers={workers} PARALLEL_MIN_PAGES={pdf_autofill.PARALLEL_MIN_PAGES}")
+
+    with tempfile.TemporaryDirectory() as tmp, spawn_pool(workers) as pool:
+        for f in [pool.submit(pdf_autofill._warm_worker) for _ in range(workers)]:
+            f.result()  # start + warm the workers
+        for scale in (1, 2, 4, 10):
+            path = os.path.join(tmp, f"europass_{scale}x.pdf")
+            with open(path, "wb") as f:
+                f.write(generate_pdf_europass(generate_cv(scale, seed=scale)))
+            n = len(pdf_autofill._extract_pages(path, 0, 10_000))
+
+            seq = median_ms(lambda: pdf_autofill._extract_pages(path, 0, n), args.repeat)
+            cold = statistics.median(cold_ms(path, n, workers) for _ in range(args.repeat))
+            warm = median_ms(lambda: pdf_autofill._extract_parallel(pool, path, n), args.repeat)
+            same = pdf_autofill._extract_parallel(pool, path, n) == pdf_autofill._extract_pages(path, 0, n)
+            print(
+                f"{n:>2} pages: sequential {seq:7.1f} ms   cold pool({workers}) {cold:7.1f} ms   "
+                f"warm pool({workers}) {warm:7.1f} ms   identical={same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
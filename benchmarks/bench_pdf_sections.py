@@ -0,0 +1,71 @@
+"""
+Where a PDF export spends its time on a 4-page Europass CV: flowable
+construction vs platypus layout, and what the per-section flowable cache
+saves when a single bullet changes between exports.
+
+    python -m benchmarks.bench_pdf_sections [--repeat 10]
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+from io import BytesIO
+
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.timing import median_ms
+from exporters import pdf_generator, render_ir
+from exporters.pdf_styles import stylesheet
+
+
+def build_flowables(document):
+    ss = stylesheet()
+    out = [pdf_generator._header(document.header, ss)] if document.header else []
+    return out + pdf_generator._flowables(document.blocks, ss)
+
+
+def layout(flowables) -> int:
+    doc = SimpleDocTemplate(BytesIO(), pagesize=A4, leftMargin=36, rightMargin=36, topMargin=36, bottomMargin=36)
+    doc.build(flowables)
+    return doc.page
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=10)
+    args = ap.parse_args()
+
+    cv = generate_cv(4, seed=1)
+    document = render_ir.build_document(cv, "europass")
+    pages = layout(build_flowables(document))
+    print(f"Europass CV: {len(cv['experienta'])} roles, {pages} pages")
+
+    construct = median_ms(lambda: build_flowables(document), args.repeat)
+    prebuilt = []
+    lay = median_ms(lambda: layout(prebuilt.pop()), args.repeat, before=lambda: prebuilt.append(build_flowables(document)))
+    print(f"flowable construction {construct:6.1f} ms ({100 * construct / (construct + lay):.0f}%)")
+    print(f"layout + drawing      {lay:6.1f} ms ({100 * lay / (construct + lay):.0f}%)")
+
+    # edit one bullet per export; alternate between two versions so every export sees a change
+    edited = copy.deepcopy(cv)
+    edited["experienta"][3]["activitati"] += "\n- Reduced alert noise by 40% across 3 SIEM tenants."
+    docs = [document, render_ir.build_document(edited, "europass")]
+    state = {"i": 0}
+
+    def export(reuse: bool) -> None:
+        state["i"] ^= 1
+        pdf_generator.render_pdf(docs[state["i"]], reuse_sections=reuse)
+
+    pdf_generator.clear_section_cache()
+    export(True)
+    export(True)
+    full = median_ms(lambda: export(False), args.repeat)
+    incremental = median_ms(lambda: export(True), args.repeat)
+    print(f"export after a one-bullet edit: full rebuild {full:.1f} ms -> section cache {incremental:.1f} ms "
+          f"({full - incremental:.1f} ms saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Per-export ReportLab setup cost: rebuilt per export vs shared registry.
+
+    python -m benchmarks.bench_pdf_setup [--repeat 200]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from reportlab.pdfbase import pdfmetrics
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.timing import median_ms
+from exporters import pdf_styles
+from exporters.pdf_generator import generate_pdf_europass, generate_pdf_modern
+
+
+def setup_rebuilt() -> None:
+    """What every export used to do: sample stylesheet + custom styles + header TableStyle."""
+    pdf_styles._build_stylesheet(pdf_styles.base_font())
+    pdf_styles._build_header_table_style()
+
+
+def setup_shared() -> None:
+    pdf_styles.stylesheet()
+    pdf_styles.header_table_style()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    font = pdf_styles._register_font()
+    print(f"font probe + TTF registration ({font}): {(time.perf_counter() - t0) * 1000:.1f} ms (once per process, on first export)")
+    pdfmetrics.getFont(font)
+
+    before = median_ms(setup_rebuilt, args.repeat)
+    after = median_ms(setup_shared, args.repeat)
+    print(f"per-export setup: rebuilt {before:.3f} ms -> shared {after:.4f} ms")
+
+    for scale in (1, 10):
+        cv = generate_cv(scale, seed=scale)
+        for gen in (generate_pdf_modern, generate_pdf_europass):
+            gen(cv)  # warm
+            ms = median_ms(lambda: gen(cv), max(3, args.repeat // 40))
+            print(f"{gen.__name__}[cv{scale}x]: {ms:.1f} ms per export (setup saved: {before - after:.3f} ms, {100 * (before - after) / ms:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Export size / render time / session memory with a phone-sized photo,
+raw upload bytes vs the utils.photo pipeline.
+
+    python -m benchmarks.bench_photo [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from io import BytesIO
+
+from PIL import Image
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.timing import median_ms
+from exporters.docx_generator import generate_docx_europass, generate_docx_modern
+from exporters.pdf_generator import generate_pdf_europass, generate_pdf_modern
+from utils import photo as photo_mod
+
+
+def phone_photo(width: int = 4032, height: int = 3024, seed: int = 7) -> bytes:
+    """Noisy 12 MP JPEG with an EXIF 'rotate 90' tag, like a phone portrait shot."""
+    import random
+
+    rng = random.Random(seed)
+    noise = Image.frombytes("L", (width // 4, height // 4), rng.randbytes((width // 4) * (height // 4)))
+    img = Image.merge("RGB", [noise.resize((width, height), Image.BICUBIC)] * 3)
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    out = BytesIO()
+    img.save(out, format="JPEG", quality=95, exif=exif.tobytes())
+    return out.getvalue()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    raw = phone_photo()
+    t0 = time.perf_counter()
+    prepared = photo_mod.prepare_uploaded_photo(raw)
+    t_prep = (time.perf_counter() - t0) * 1000
+    print(f"upload: {len(raw) / 1e6:.2f} MB raw -> {len(prepared) / 1e3:.0f} kB prepared ({t_prep:.0f} ms, once per upload)")
+    print(f"session memory for cv['photo']: {len(raw) / 1e6:.2f} MB -> {len(prepared) / 1e3:.0f} kB")
+
+    gens = (generate_pdf_modern, generate_pdf_europass, generate_docx_modern, generate_docx_europass)
+    print(f"{'exporter':24} {'size raw':>10} {'size new':>10} {'ms raw':>8} {'ms new':>8}")
+    for gen in gens:
+        row = []
+        for label, data in (("raw", raw), ("prepared", prepared)):
+            cv = generate_cv(1, seed=1)
+            cv["photo"] = data
+            cv["include_photo_modern"] = True
+            if label == "raw":
+                # bypass the export-side normalization to reproduce the old behaviour
+                photo_mod_variant_off(True)
+            try:
+                out = gen(cv)
+                ms = median_ms(lambda: gen(cv), args.repeat)
+            finally:
+                if label == "raw":
+                    photo_mod_variant_off(False)
+            row.append((len(out), ms))
+        (s0, t0_), (s1, t1) = row
+        print(f"{gen.__name__:24} {s0 / 1e3:9.0f}k {s1 / 1e3:9.0f}k {t0_:8.1f} {t1:8.1f}")
+
+
+def photo_mod_variant_off(off: bool) -> None:
+    from exporters import render_ir
+
+    render_ir.photo_variant = (lambda b, variant="print": b) if off else photo_mod.photo_variant
+    render_ir.clear_document_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Render IR reuse: one document build per CV version vs one per format.
+
+    python -m benchmarks.bench_render_ir [--repeat 20]
+"""
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.timing import median_ms
+from exporters import render_ir
+from exporters.docx_generator import render_docx
+from exporters.pdf_generator import render_pdf
+from exporters.txt_generator import render_text
+
+FORMATS = (
+    ("modern", render_pdf),
+    ("europass", render_pdf),
+    ("modern", render_docx),
+    ("europass", render_docx),
+    ("ats", render_text),
+)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    for scale in (1, 10):
+        cv = generate_cv(scale, seed=scale)
+
+        def build_all_cold():
+            for template in ("modern", "europass", "modern", "europass", "ats"):
+                render_ir.clear_document_cache()
+                render_ir.build_document(cv, template)
+
+        def build_all_shared():
+            render_ir.clear_document_cache()
+            for template in ("modern", "europass", "modern", "europass", "ats"):
+                render_ir.build_document(cv, template)
+
+        def export_all(shared: bool):
+            render_ir.clear_document_cache()
+            for template, backend in FORMATS:
+                if not shared:
+                    render_ir.clear_document_cache()
+                backend(render_ir.build_document(cv, template))
+
+        per_format = median_ms(build_all_cold, args.repeat)
+        shared = median_ms(build_all_shared, args.repeat)
+        reps = max(3, args.repeat // 5)
+        full_cold = median_ms(lambda: export_all(False), reps)
+        full_shared = median_ms(lambda: export_all(True), reps)
+        print(
+            f"cv{scale}x: normalization for 5 formats {per_format:.2f} ms -> {shared:.2f} ms; "
+            f"full 5-format export {full_cold:.1f} ms -> {full_shared:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+pdf_autofill section extraction: per-section regex searches vs the one-pass
+section index, on CV texts of growing length.
+
+    python -m benchmarks.bench_segmenter [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+from typing import List, Optional
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.timing import best_of
+from exporters.txt_generator import generate_txt_ats
+from utils import pdf_autofill as pa
+
+_FLAGS = re.IGNORECASE | re.DOTALL
+
+# The original searches, kept as the reference result: (group, pattern) per section, first match wins.
+LEGACY = {
+    "about": [
+        (1, r"About me\s*(.+?)\s*(Professional experience|Work experience|Experience|Employment history)"),
+        (1, r"Summary\s*(.+?)\s*(Professional experience|Work experience|Experience|Employment history)"),
+        (1, r"Despre mine\s*(.+?)\s*(Experiență profesională|Experienta profesionala)"),
+        (1, r"Rezumat\s*(.+?)\s*(Experiență profesională|Experienta profesionala)"),
+    ],
+    "languages": [
+        (1, r"Foreign languages\s*(.+?)\s*(?:Other sections|Other information|www\.ejobs\.ro|$)"),
+        (1, r"Limbi străine\s*(.+?)\s*(?:Alte informații|Alte informatii|www\.ejobs\.ro|$)"),
+        (1, r"Languages\s*(.+?)\s*(?:Other sections|Other information|$)"),
+        (1, r"Limbi\s*(.+?)\s*(?:Alte informații|Alte informatii|$)"),
+    ],
+    "driving": [
+        (1, r"Driving license\s*(.+?)(?:www\.ejobs\.ro|$)"),
+        (1, r"Permis de conducere\s*(.+?)(?:www\.ejobs\.ro|$)"),
+    ],
+    "education": [
+        (2, r"(Education|Education and training)\s*(.+?)(?:Foreign languages|Languages|Other|www\.ejobs\.ro|$)"),
+        (2, r"(Educație|Educatie)\s*(.+?)(?:Limbi străine|Limbi straine|Limbi|Alte|www\.ejobs\.ro|$)"),
+    ],
+}
+
+INDEXED = {
+    "about": [(h, e, False) for h, e in pa._ABOUT_SECTIONS],
+    "languages": [(h, e, True) for h, e in pa._LANGUAGE_SECTIONS],
+    "driving": [(h, e, True) for h, e in pa._DRIVING_SECTIONS],
+    "education": [(h, e, True) for h, e in pa._EDUCATION_SECTIONS],
+}
+
+
+def legacy_sections(text: str) -> List[Optional[str]]:
+    out = []
+    for patterns in LEGACY.values():
+        sec = None
+        for group, pat in patterns:
+            m = re.search(pat, text, _FLAGS)
+            if m:
+                sec = m.group(group)
+                break
+        out.append(sec)
+    return out
+
+
+def indexed_sections(text: str) -> List[Optional[str]]:
+    index = pa._SectionIndex(text)
+    out = []
+    for specs in INDEXED.values():
+        sec = None
+        for heads, ends, to_eof in specs:
+            sec = index.section(heads, ends, to_eof)
+            if sec is not None:
+                break
+        out.append(sec)
+    return out
+
+
+def _norm(sections: List[Optional[str]]) -> List[Optional[str]]:
+    # the slices may keep whitespace the regex groups trim; every extractor cleans it
+    return [None if s is None else "\n".join(pa._clean_lines(s)) for s in sections]
+
+
+def cv_text(scale: int) -> str:
+    tail = (
+        "\nForeign languages\nEnglish: C1\nGerman: A2\nOther information\n"
+        "Driving license\nCategory B\nwww.ejobs.ro\n"
+    )
+    return generate_txt_ats(generate_cv(scale=scale)) + tail
+
+
+def adversarial_text(repeats: int) -> str:
+    """Many headers and no terminator: every legacy search rescans to the end."""
+    para = "About me\nI automate infrastructure and keep services running smoothly. " * 3
+    return (para + "Summary\n" + "Despre mine\n") * repeats
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    cases = [(f"cv x{s}", cv_text(s)) for s in (1, 4, 16, 64)]
+    cases += [(f"adversarial x{r}", adversarial_text(r)) for r in (25, 50, 100, 200)]
+
+    print(f"{'text':>17} {'chars':>9} {'legacy ms':>10} {'index ms':>9} {'speedup':>8} {'text_to_cv ms':>14}")
+    for label, text in cases:
+        assert _norm(indexed_sections(text)) == _norm(legacy_sections(text)), f"section mismatch: {label}"
+        t_ref = best_of(lambda: legacy_sections(text), args.repeat)
+        t_new = best_of(lambda: indexed_sections(text), args.repeat)
+        t_cv = best_of(lambda: pa.text_to_cv(text), args.repeat)
+        print(f"{label:>17} {len(text):>9} {t_ref:>10.2f} {t_new:>9.2f} {t_ref / max(t_new, 1e-9):>7.1f}x {t_cv:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
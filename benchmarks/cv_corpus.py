@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import random
+from typing import List, Optional
+
+from utils.session import _default_cv
+
+
+VERBS = [
+    "Implemented", "Automated", "Reduced", "Migrated", "Designed", "Led", "Deployed", "Monitored",
+    "Hardened", "Built", "Improved", "Configured", "Investigated", "Documented", "Optimized",
+]
+METRICS = ["by 30%", "for 1,200 users", "within 48 hours", "saving 6 hrs/week", "to 99.9% uptime", "across 14 sites"]
+EMPLOYERS = ["Contoso", "Fabrikam", "Northwind", "Tailspin", "Adatum", "Litware", "Proseware"]
+ROLES = ["Security Engineer", "SOC Analyst", "Systems Administrator", "Cloud Engineer", "IT Support Specialist"]
+
+
+def _bullet(rng: random.Random, vocab: List[str]) -> str:
+    a, b = rng.choice(vocab), rng.choice(vocab)
+    tail = f" {rng.choice(METRICS)}" if rng.random() < 0.6 else ""
+    return f"{rng.choice(VERBS)} {a} and {b} for internal teams{tail}."
+
+
+def generate_cv(scale: int = 1, seed: int = 0, vocab: Optional[List[str]] = None) -> dict:
+    """
+    App-native CV dict (utils.session._default_cv schema).
+
+    scale=1 is a realistic CV: 4 summary bullets, 5 roles x 5 bullets,
+    2 education entries. Larger scales multiply roles and bullets.
+    """
+    if vocab is None:
+        from benchmarks.jd_corpus import vocabulary
+        vocab = vocabulary()
+
+    rng = random.Random(seed)
+    cv = _default_cv()
+    cv.update({
+        "nume_prenume": "Jane Doe",
+        "full_name": "Jane Doe",
+        "pozitie_vizata": rng.choice(ROLES),
+        "email": "jane.doe@example.com",
+        "telefon": "+40 700 000 000",
+        "linkedin": "linkedin.com/in/janedoe",
+        "rezumat_bullets": [_bullet(rng, vocab) for _ in range(4 * scale)],
+        "modern_skills_headline": ", ".join(rng.sample(vocab, 8)),
+        "modern_tools": ", ".join(rng.choices(vocab, k=10 * scale)),
+        "modern_certs": "CompTIA Security+, AZ-500",
+        "modern_keywords_extra": ", ".join(rng.choices(vocab, k=6 * scale)),
+    })
+    cv["rezumat"] = "\n".join(cv["rezumat_bullets"])
+
+    for i in range(5 * scale):
+        cv["experienta"].append({
+            "perioada": f"{2024 - i} - {2025 - i}",
+            "functie": rng.choice(ROLES),
+            "angajator": rng.choice(EMPLOYERS),
+            "locatie": "Bucharest",
+            "activitati": "\n".join(f"- {_bullet(rng, vocab)}" for _ in range(5)),
+            "sector": "",
+            "tehnologii": ", ".join(rng.sample(vocab, 4)),
+            "link": "",
+        })
+
+    for i in range(2 * scale):
+        cv["educatie"].append({
+            "perioada": f"{2010 - 4 * i} - {2014 - 4 * i}",
+            "titlu": "BSc Computer Science",
+            "organizatie": "University of Bucharest",
+            "calificare": "BSc Computer Science",
+            "institutie": "University of Bucharest",
+            "locatie": "Bucharest",
+            "descriere": "",
+        })
+
+    cv["limbi_straine"] = [{"limba": "English", "nivel": "C1"}, {"limba": "French", "nivel": "B1"}]
+    return cv
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+from typing import List, Optional
+
+from utils.ats_scoring import flatten_keywords
+from utils.profiles import load_all_profiles
+
+
+FILLER = [
+    "support", "team", "customers", "daily", "operations", "across", "environment", "ensure",
+    "deliver", "projects", "stakeholders", "business", "quality", "reporting", "improve",
+    "processes", "maintain", "documentation", "collaborate", "internal", "external", "role",
+    "candidate", "years", "hands-on", "senior", "junior", "plan", "review", "lead",
+]
+
+TEMPLATES = [
+    "Experience with {a} and {b} in a {f1} {f2} setting.",
+    "You will {f1} {a}, {b} and {c} for our {f2} {f3}.",
+    "Hands-on knowledge of {a} / {b}; {c} is a plus.",
+    "• {A} and {B} administration",
+    "Strong {a} skills, familiarity with {B} and {c}.",
+    "{A}, {B}, {C} ({f1} {f2}).",
+]
+
+
+def vocabulary() -> List[str]:
+    """Every keyword from the bundled ATS profiles (a realistic multi-domain vocabulary)."""
+    seen = set()
+    out: List[str] = []
+    for prof in load_all_profiles():
+        for kw in flatten_keywords(prof.get("keywords", {})):
+            k = kw.lower()
+            if k not in seen and "{" not in k:
+                seen.add(k)
+                out.append(kw)
+    return out
+
+
+def _variant(rng: random.Random, term: str) -> str:
+    """Spelling noise real JDs contain: plurals, hyphen/space swaps, typos."""
+    r = rng.random()
+    if r < 0.15:
+        return term + "s"
+    if r < 0.25 and "-" in term:
+        return term.replace("-", " ")
+    if r < 0.35 and len(term) > 8:
+        i = rng.randrange(1, len(term) - 1)
+        return term[:i] + term[i + 1:]
+    return term
+
+
+def generate_jd(words: int = 5000, seed: int = 0, vocab: Optional[List[str]] = None) -> str:
+    """Synthetic job description of roughly `words` words."""
+    rng = random.Random(seed)
+    vocab = vocab or vocabulary()
+    out: List[str] = []
+    count = 0
+    while count < words:
+        tpl = rng.choice(TEMPLATES)
+        terms = {k: _variant(rng, rng.choice(vocab)) for k in "abc"}
+        sentence = tpl.format(
+            a=terms["a"].lower(), b=terms["b"].lower(), c=terms["c"].lower(),
+            A=terms["a"].title(), B=terms["b"].title(), C=terms["c"].title(),
+            f1=rng.choice(FILLER), f2=rng.choice(FILLER), f3=rng.choice(FILLER),
+        )
+        out.append(sentence)
+        count += len(sentence.split())
+    return "\n".join(out)
@@ -0,0 +1,182 @@
+"""
+Benchmark suite for the scoring, JD-analysis and page-fit hot paths.
+
+    python -m benchmarks.run                          # run, write bench_results.json
+    python -m benchmarks.run --save-baseline          # also store benchmarks/baseline.json
+    python -m benchmarks.run --compare                # flag regressions vs the stored baseline
+    python -m benchmarks.run --compare old.json --threshold 0.3 --filter score
+
+Every case is timed cold (caches cleared before each run) and warm (after a
+priming call). The reported figure is the median of --repeat runs, in ms.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.cv_corpus import generate_cv
+from benchmarks.jd_corpus import generate_jd, vocabulary
+from benchmarks.timing import median_ms
+from exporters import page_fit, render_ir
+from utils import jd_analysis, jd_ml_offline, keyword_matcher
+from utils.ats_scoring import ScoreCache, compute_score, flatten_keywords
+from utils.jd_ml_offline import categorize_keywords, compute_coverage, cv_text_for_coverage, extract_keywords
+from utils.profiles import load_profile
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+CV_SCALES = (1, 10, 100)
+JD_WORDS = (300, 1500, 5000)
+
+# Below this absolute difference a slowdown is treated as timer noise
+NOISE_FLOOR_MS = 0.05
+
+
+def clear_caches() -> None:
+    """Reset every process-wide cache the hot paths use."""
+    keyword_matcher.tokenize.cache_clear()
+    keyword_matcher._compiled.cache_clear()
+    jd_ml_offline._bucket_for.cache_clear()
+    jd_analysis._cache.clear()
+    page_fit._width.cache_clear()
+    render_ir.clear_document_cache()
+
+
+class Case:
+    def __init__(self, name: str, fn: Callable[[], object], reset: Callable[[], None] = clear_caches):
+        self.name = name
+        self.fn = fn
+        self.reset = reset
+
+
+def build_cases() -> List[Case]:
+    vocab = vocabulary()
+    profile = load_profile("cyber_security")
+    jds = {w: generate_jd(w, seed=w, vocab=vocab) for w in JD_WORDS}
+    jd_kw = jd_analysis.get_jd_analysis(jds[1500]).top_terms(35)
+    cases: List[Case] = []
+
+    for scale in CV_SCALES:
+        cv = generate_cv(scale, seed=scale, vocab=vocab)
+        holder = {"cache": ScoreCache()}
+
+        def fresh_cache(holder=holder) -> None:
+            clear_caches()
+            holder["cache"] = ScoreCache()
+
+        cases.append(Case(
+            f"compute_score[cv{scale}x]",
+            lambda cv=cv, holder=holder: compute_score(cv, profile, jd_kw, cache=holder["cache"]),
+            reset=fresh_cache,
+        ))
+
+        cv_text = cv_text_for_coverage(cv)
+        analyzer_kw = [k for k, _ in extract_keywords(jds[1500], max_keywords=60)][:40]
+        cases.append(Case(
+            f"compute_coverage[cv{scale}x]",
+            lambda cv_text=cv_text: compute_coverage(cv_text, analyzer_kw),
+        ))
+
+        if scale <= 10:
+            cases.append(Case(f"estimate_pages[cv{scale}x]", lambda cv=cv: page_fit.estimate_pages(cv, "modern")))
+
+    for words, text in jds.items():
+        cases.append(Case(f"extract_keywords[jd{words}w]", lambda text=text: extract_keywords(text, max_keywords=60)))
+
+    for words, text in jds.items():
+        kws = [k for k, _ in extract_keywords(text, max_keywords=300)]
+        cases.append(Case(f"categorize_keywords[jd{words}w]", lambda kws=kws: categorize_keywords(kws)))
+    cases.append(Case(f"categorize_keywords[vocab{len(vocab)}]", lambda: categorize_keywords(vocab)))
+
+    profile_kw = profile.get("keywords", {})
+    nested = {f"group{i}": list(vocab[i::20]) for i in range(20)}
+    cases.append(Case("flatten_keywords[profile]", lambda: flatten_keywords(profile_kw)))
+    cases.append(Case(f"flatten_keywords[{len(vocab)}kw]", lambda: flatten_keywords(nested)))
+    return cases
+
+
+def run(cases: List[Case], repeat: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for case in cases:
+        cold = median_ms(case.fn, repeat, before=case.reset)
+        case.reset()
+        case.fn()  # prime
+        warm = median_ms(case.fn, repeat)
+        results[case.name] = {"cold_ms": round(cold, 4), "warm_ms": round(warm, 4)}
+        print(f"{case.name:<36} cold {cold:>10.3f} ms   warm {warm:>10.3f} ms", flush=True)
+    return results
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[Tuple[str, str, float, float]]:
+    """(case, metric, baseline ms, current ms) for every slowdown beyond threshold."""
+    regressions = []
+    for name, metrics in current.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, now in metrics.items():
+            before = base.get(metric)
+            if before is None:
+                continue
+            if now > before * (1.0 + threshold) and now - before > NOISE_FLOOR_MS:
+                regressions.append((name, metric, before, now))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the scoring and JD-analysis hot paths.")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    ap.add_argument("--out", default="bench_results.json", help="where to write the JSON results")
+    ap.add_argument("--save-baseline", action="store_true", help=f"also write results to {BASELINE_PATH}")
+    ap.add_argument("--compare", nargs="?", const=BASELINE_PATH, default=None, metavar="BASELINE",
+                    help="compare against a results file (default: the stored baseline)")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown ratio before flagging (0.25 = 25%%)")
+    args = ap.parse_args(argv)
+
+    cases = [c for c in build_cases() if args.filter in c.name]
+    results = run(cases, args.repeat)
+
+    payload = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    print(f"\nResults written to {args.out}")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        print(f"Baseline stored in {BASELINE_PATH}")
+
+    if args.compare:
+        try:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f).get("results", {})
+        except FileNotFoundError:
+            print(f"No baseline at {args.compare} (run with --save-baseline first).")
+            return 2
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for name, metric, before, now in regressions:
+                print(f"  {name} [{metric}]: {before:.3f} -> {now:.3f} ms ({now / max(before, 1e-9):.2f}x)")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} vs {args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
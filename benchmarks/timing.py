@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Callable, Optional
+
+
+def median_ms(fn: Callable[[], object], repeat: int, before: Optional[Callable[[], None]] = None) -> float:
+    """Median wall time of fn() over repeat runs, in ms; before() runs untimed ahead of each run."""
+    samples = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000.0
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Fastest wall time of fn() over repeat runs, in ms."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
@@ -1,37 +1,11 @@
 from __future__ import annotations
 
-import re
-from collections import Counter
-from typing import Dict, List, Any
+from typing import Dict, Any
 
 import streamlit as st
 
-from utils.ats_scoring import compute_score
-
-_STOPWORDS = set("""a about above after again against all am an and any are as at be because been before being below between both but by
-can did do does doing down during each few for from further had has have having he her here hers herself him himself his how
-i if in into is it its itself just me more most my myself no nor not of off on once only or other our ours ourselves out over
-own same she should so some such than that the their theirs them themselves then there these they this those through to too
-under until up very was we were what when where which while who whom why with you your yours yourself yourselves
-""".split())
-
-
-def _normalize_text(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "").strip().lower())
-
-
-def extract_jd_keywords(text: str, top_n: int = 35) -> List[str]:
-    text = _normalize_text(text)
-    tokens = re.findall(r"[a-z0-9][a-z0-9\+\#\.\-/]{1,}", text)
-    cleaned = []
-    for t in tokens:
-        t = t.strip(".-/")
-        if len(t) < 3:
-            continue
-        if t in _STOPWORDS:
-            continue
-        cleaned.append(t)
-    return [w for w, _ in Counter(cleaned).most_common(top_n)]
+from utils.ats_scoring import ScoreCache, compute_score
+from utils.jd_analysis import get_jd_analysis
 
 
 def render_ats_score_dashboard(cv: Dict[str, Any], profile: Dict[str, Any]):
@@ -39,9 +13,13 @@ def render_ats_score_dashboard(cv: Dict[str, Any], profile: Dict[str, Any]):
     st.caption("Pragmatic scoring to help you improve readability for recruiters and match for ATS.")
 
     jd = (cv.get('job_description') or '').strip()
-    jd_keywords = extract_jd_keywords(jd, top_n=35) if jd else []
+    jd_keywords = get_jd_analysis(jd).top_terms(35)
 
-    score = compute_score(cv, profile, jd_keywords)
+    # Section-hash cache lives in the session: reruns only re-score edited sections
+    cache = st.session_state.get("_ats_score_cache")
+    if not isinstance(cache, ScoreCache):
+        cache = st.session_state["_ats_score_cache"] = ScoreCache()
+    score = compute_score(cv, profile, jd_keywords, cache=cache)
 
     cols = st.columns(5)
     cols[0].metric("Overall", f"{score.overall}%")
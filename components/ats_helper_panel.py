@@ -1,6 +1,8 @@
 import re
 import streamlit as st
 
+from utils.jd_analysis import get_jd_analysis
+
 
 def _flatten_text_from_cv(cv: dict) -> str:
     parts = []
@@ -56,11 +58,8 @@ def render_ats_helper_panel(cv: dict, key_prefix: str = "ats_help"):
 
     cv_text = _flatten_text_from_cv(cv).lower()
 
-    # Keywords: naive extraction (words >= 4) + user supplied list
-    words = re.findall(r"[a-zA-Z][a-zA-Z\+\#\.\-]{3,}", jd.lower()) if jd else []
-    # de-dup + filter noise
-    stop = {"with", "that", "this", "from", "will", "have", "your", "work", "team", "years", "year", "role"}
-    kws = sorted(set([w for w in words if w not in stop]))[:200]
+    # Keywords: naive extraction (words >= 4), shared with the other JD panels
+    kws = get_jd_analysis(jd).helper_terms if jd else []
 
     if jd:
         matched = [k for k in kws if k in cv_text]
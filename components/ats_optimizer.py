@@ -1,13 +1,11 @@
 import re
-from collections import Counter
 
 import streamlit as st
+from utils.jd_analysis import ANALYZER_FOCUS, get_jd_analysis
 from utils.jd_ml_offline import (
-    extract_keywords,
-    categorize_keywords,
     compute_coverage,
+    cv_text_for_coverage,
     build_technical_skills_lines_from_buckets,
-    suggested_bullet_templates,
 )
 
 def render_jd_ml_offline_panel(cv: dict):
@@ -44,34 +42,21 @@ def render_jd_ml_offline_panel(cv: dict):
         apply_templates = st.button("Update rewrite templates", use_container_width=True)
 
     if run:
-        kws = extract_keywords(cv["job_description"], max_keywords=60)
-        kw_list = [k for k, _ in kws]
-
-        buckets = categorize_keywords(kw_list)
+        analysis = get_jd_analysis(cv["job_description"])
+        kw_list = list(analysis.keyword_list)
+        buckets = {cat: list(items) for cat, items in analysis.buckets.items()}
 
         # Build a CV text blob to compare (simple but effective)
-        cv_blob = []
-        cv_blob.append(cv.get("rezumat",""))
-        cv_blob.extend(cv.get("rezumat_bullets", []) if isinstance(cv.get("rezumat_bullets", []), list) else [])
-        cv_blob.append(cv.get("modern_tools",""))
-        cv_blob.append(cv.get("modern_keywords_extra",""))
-        for e in cv.get("experienta", []) if isinstance(cv.get("experienta", []), list) else []:
-            if isinstance(e, dict):
-                cv_blob.append(e.get("functie",""))
-                cv_blob.append(e.get("angajator",""))
-                cv_blob.append(e.get("titlu",""))
-                cv_blob.append(e.get("activitati",""))
-                cv_blob.append(e.get("tehnologii",""))
-        cv_text = "\n".join([str(x) for x in cv_blob if x])
-
-        coverage, missing = compute_coverage(cv_text, kw_list[:40])  # focus on top 40
+        cv_text = cv_text_for_coverage(cv)
+
+        coverage, missing = compute_coverage(cv_text, kw_list[:ANALYZER_FOCUS])
 
         cv["jd_keywords"] = kw_list
         cv["jd_buckets"] = buckets
         cv["jd_missing"] = missing
         cv["jd_coverage"] = coverage
 
-        cv["jd_templates"] = suggested_bullet_templates(cv["jd_role_hint"], buckets)
+        cv["jd_templates"] = analysis.templates(cv["jd_role_hint"])
 
         st.success(f"JD analyzed. Coverage: {coverage*100:.0f}%")
 
@@ -108,31 +93,9 @@ def render_jd_ml_offline_panel(cv: dict):
         st.success("Updated rewrite templates for this job.")
 
 
-_STOPWORDS = set("""a about above after again against all am an and any are as at be because been before being below between both but by
-can did do does doing down during each few for from further had has have having he her here hers herself him himself his how
-i if in into is it its itself just me more most my myself no nor not of off on once only or other our ours ourselves out over
-own same she should so some such than that the their theirs them themselves then there these they this those through to too
-under until up very was we were what when where which while who whom why with you your yours yourself yourselves
-""".split())
-
 def _normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", (text or "").strip().lower())
 
-def _extract_keywords(text: str, top_n: int = 30):
-    """Simple keyword extraction (ATS-oriented): keeps tech tokens and longer words."""
-    text = _normalize_text(text)
-    # keep words + tech-ish tokens (c#, c++, .net, node.js, aws, etc.)
-    tokens = re.findall(r"[a-z0-9][a-z0-9\+\#\.\-/]{1,}", text)
-    cleaned = []
-    for t in tokens:
-        t = t.strip(".-/")
-        if len(t) < 3:
-            continue
-        if t in _STOPWORDS:
-            continue
-        cleaned.append(t)
-    return [w for w, _ in Counter(cleaned).most_common(top_n)]
-
 def render_ats_optimizer(cv):
     st.subheader("ATS Optimizer (keyword match)")
     st.caption("Lipește job description-ul și vezi ce cuvinte cheie lipsesc din CV. Nu e NLP 'magic'—e un ajutor practic pentru ATS.")
@@ -164,7 +127,7 @@ def render_ats_optimizer(cv):
         "\n".join([f"{e.get('calificare','')} {e.get('institutie','')}" for e in (cv.get('educatie') or [])]),
     ])
 
-    jd_kw = _extract_keywords(jd, top_n=35)
+    jd_kw = get_jd_analysis(jd).top_terms(35)
     cv_text = _normalize_text(cv_blob)
 
     present = [k for k in jd_kw if k in cv_text]
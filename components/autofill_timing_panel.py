@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import streamlit as st
+
+from utils.autofill_timing import timing_log_path
+
+
+def render_autofill_timing(report: Dict[str, Any], expanded: bool = False):
+    """Per-stage / per-page timings of the last autofill (AutofillTimer.report())."""
+    with st.expander("Timp Autofill (diagnostic)", expanded=expanded):
+        kb = report.get("bytes", 0) / 1024
+        st.caption(
+            f"Total {report.get('total_ms', 0):.0f} ms · {report.get('kind', '?').upper()} {kb:.0f} KB · "
+            f"cache: {report.get('cache', '?')} · {report.get('chars', 0)} caractere"
+        )
+        stages = report.get("stages") or []
+        if stages:
+            st.dataframe(stages, hide_index=True, use_container_width=True)
+        pages = report.get("pages") or []
+        if pages:
+            st.caption("Pagini PDF (extragere text)")
+            st.dataframe(pages, hide_index=True, use_container_width=True)
+        st.caption(f"Log JSONL: {timing_log_path()}")
@@ -1,4 +1,5 @@
 import streamlit as st
+from utils.job_fit import rank_job_fit
 from utils.job_profiles import list_job_profiles, save_job_profile, load_job_profile, delete_job_profile
 
 
@@ -97,3 +98,12 @@ def render_job_profile_manager(cv: dict):
     if selected:
         with st.expander("Preview selected profile", expanded=False):
             st.write(selected)
+
+    if profiles:
+        with st.expander("Job Fit (current CV vs all saved job profiles)", expanded=False):
+            fits = rank_job_fit(cv, top_n=25)
+            st.caption("Coverage of each saved job's top JD keywords (same measure as the JD analyzer).")
+            for f in fits:
+                st.markdown(f"**{f.name}** — {f.coverage*100:.0f}% ({f.matched}/{f.total})")
+                if f.missing:
+                    st.caption("Missing: " + ", ".join(f.missing[:12]))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import streamlit as st
+
+from exporters.page_fit import estimate_pages
+
+
+def _pages(n: int) -> str:
+    return f"{n} pagină" if n == 1 else f"{n} pagini"
+
+
+def render_page_fit(cv: Dict[str, Any], target_pages: int = 1, container=st.sidebar):
+    """Live 'fits on N pages' estimate for the PDF exports (no PDF is rendered)."""
+    try:
+        modern = estimate_pages(cv, "modern")
+        europass = estimate_pages(cv, "europass")
+    except Exception as e:
+        container.caption(f"Page estimate unavailable: {e}")
+        return
+
+    container.metric("PDF Modern (estimare)", _pages(modern.pages))
+    container.progress(min(100, max(0, int(modern.last_page_fill * 100))))
+
+    overflow = modern.overflow_sections(target_pages)
+    if overflow:
+        container.warning(f"Depășește {target_pages} pagină: " + ", ".join(overflow))
+    container.caption(f"PDF Europass (estimare): {_pages(europass.pages)}")
@@ -1,5 +1,9 @@
+import hashlib
+
 import streamlit as st
 
+from utils.photo import photo_variant, prepare_uploaded_photo
+
 def render_photo_upload(cv, prefix=""):
     st.subheader("Fotografie (optional)")
 
@@ -11,8 +15,14 @@ def render_photo_upload(cv, prefix=""):
 
     if uploaded is not None:
         try:
-            cv['photo'] = uploaded.read()
-            st.image(cv['photo'], width=180)
+            raw = uploaded.getvalue()
+            # the uploader keeps returning the same file on every rerun;
+            # only normalize it when it actually changed
+            digest = hashlib.sha256(raw).hexdigest()
+            if st.session_state.get(f"{prefix}photo_src_sha") != digest or not cv.get('photo'):
+                cv['photo'] = prepare_uploaded_photo(raw)
+                st.session_state[f"{prefix}photo_src_sha"] = digest
+            st.image(photo_variant(cv['photo'], "preview"), width=180)
             st.success("Fotografie incarcata")
         except Exception:
             st.error("Eroare la procesare")
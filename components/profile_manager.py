@@ -1,9 +1,12 @@
 import streamlit as st
 import yaml
 
+from utils.jd_analysis import get_jd_analysis
+from utils.ats_scoring import compute_score_many
 from utils.profiles import (
     ProfileError,
     list_profiles,
+    load_all_profiles,
     load_profile,
     save_profile_text,
     save_profile_dict,
@@ -18,6 +21,32 @@ def _pretty_label(p: dict) -> str:
     return title or pid or "profile"
 
 
+def _render_best_fit(cv: dict, top_n: int = 8):
+    """
+    Rank every ATS profile against the current CV (single batched pass)
+    and offer a one-click switch.
+    """
+    jd_keywords = get_jd_analysis(cv.get("job_description") or "").top_terms(35)
+    ranked = compute_score_many(cv, load_all_profiles(), jd_keywords)
+    if not ranked:
+        st.caption("No profiles to rank.")
+        return
+
+    st.caption("Ranked by overall ATS score for this CV (profile keyword coverage decides ties).")
+    for i, (p, score) in enumerate(ranked[:top_n]):
+        c1, c2, c3 = st.columns([3, 1, 1])
+        c1.write(f"**{_pretty_label(p)}**")
+        c2.write(f"{score.overall}% · kw {score.keyword_coverage}%")
+        with c3:
+            if p["id"] == cv.get("ats_profile"):
+                st.caption("current")
+            elif st.button("Use", use_container_width=True, key=f"profile_fit_use_{i}"):
+                cv["ats_profile"] = p["id"]
+                # drop the selectbox state so it follows cv["ats_profile"]
+                st.session_state.pop("profile_select_idx", None)
+                st.rerun()
+
+
 def render_profile_manager(cv: dict):
     """
     ATS Profile manager UI:
@@ -25,6 +54,7 @@ def render_profile_manager(cv: dict):
     - Preview normalized profile + warnings
     - Edit YAML and save
     - Duplicate as new profile (optional)
+    - Rank all profiles against the CV ("Best fit")
     Returns loaded normalized profile dict (or None).
     """
     if not isinstance(cv, dict):
@@ -76,7 +106,7 @@ def render_profile_manager(cv: dict):
             st.warning(w)
 
     # Buttons row
-    c1, c2, c3 = st.columns([1, 1, 1])
+    c1, c2, c3, c4 = st.columns([1, 1, 1, 1])
     with c1:
         if st.button("Reload profile", use_container_width=True, key="profile_reload_btn"):
             st.rerun()
@@ -86,6 +116,15 @@ def render_profile_manager(cv: dict):
     with c3:
         if st.button("Edit YAML", use_container_width=True, key="profile_edit_open_btn"):
             st.session_state["profile_editor_open"] = True
+    with c4:
+        if st.button("Best fit", use_container_width=True, key="profile_fit_btn"):
+            st.session_state["profile_fit_open"] = not st.session_state.get("profile_fit_open", False)
+
+    # Best-fitting profiles
+    if st.session_state.get("profile_fit_open", False):
+        with st.container(border=True):
+            st.markdown("**Best-fitting profiles**")
+            _render_best_fit(cv)
 
     # Preview
     if st.session_state.get("profile_preview_open", False):
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from exporters.export_cache import EXPORTERS, lookup_export, store_export
+from exporters.pdf_styles import stylesheet
+from exporters.txt_generator import generate_txt_ats
+from utils.json_io import _sync_primary_from_contact_items, export_cv_json
+
+
+# template id -> file name inside the ZIP
+BUNDLE_FILES: Dict[str, str] = {
+    "pdf_modern": "cv_modern.pdf",
+    "pdf_europass": "cv_europass.pdf",
+    "docx_modern": "cv_modern.docx",
+    "docx_europass": "cv_europass.docx",
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_warmup: List[Future] = []
+
+
+def _render(template: str, cv: dict, lang: str) -> bytes:
+    """Worker entry point (top-level so it pickles)."""
+    return EXPORTERS[template](cv, lang=lang)
+
+
+def _warm_worker() -> None:
+    """Pool initializer: imports the generators (via unpickling) and loads fonts/styles once per worker."""
+    stylesheet()
+
+
+def _start_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool, _pool_warmup
+    if _pool is None:
+        workers = min(len(BUNDLE_FILES), os.cpu_count() or 1)
+        if workers < 2:
+            return None
+        # spawn, not fork: forking the threaded Streamlit server can hand a worker locks held by another thread
+        _pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_warm_worker
+        )
+        atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        # one no-op per worker starts them all now instead of on the first bundle
+        _pool_warmup = [_pool.submit(_warm_worker) for _ in range(workers)]
+    return _pool
+
+
+def warm_bundle_pool() -> None:
+    """Start the export workers in the background; call once at app start."""
+    _start_pool()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Shared worker pool (kept alive so fonts/modules stay loaded) once its
+    workers are up; None while they are still starting (render in-process
+    meanwhile) and on single-core boxes.
+    """
+    pool = _start_pool()
+    if pool is None or not all(f.done() for f in _pool_warmup):
+        return None
+    return pool
+
+
+def _drop_pool() -> None:
+    global _pool, _pool_warmup
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool, _pool_warmup = None, []
+
+
+def export_bundle(cv: dict, lang: str = "en") -> bytes:
+    """
+    ZIP with every export format. PDF/DOCX misses render concurrently in a
+    process pool (ReportLab layout is CPU-bound); each file is written into
+    the archive as soon as it is ready. Renders in-process if the pool is
+    still starting or cannot be used.
+    """
+    _sync_primary_from_contact_items(cv)
+
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        pending: Dict[str, str] = {}
+        for template, fname in BUNDLE_FILES.items():
+            key, data = lookup_export(cv, template, lang)
+            if data is not None:
+                zf.writestr(fname, data)
+            else:
+                pending[template] = key
+
+        futures = {}
+        pool = _get_pool() if len(pending) > 1 else None
+        if pool is not None:
+            try:
+                futures = {pool.submit(_render, t, cv, lang): t for t in pending}
+            except (BrokenProcessPool, RuntimeError, OSError):
+                _drop_pool()
+                futures = {}
+
+        # cheap formats render here while the workers are busy
+        zf.writestr("cv_export.json", export_cv_json(cv, include_photo_base64=False))
+        zf.writestr("cv_ats_plain.txt", generate_txt_ats(cv))
+
+        for fut in as_completed(futures):
+            template = futures[fut]
+            try:
+                data = fut.result()
+            except BrokenProcessPool:
+                _drop_pool()
+                continue  # rendered in-process below
+            store_export(pending.pop(template), data)
+            zf.writestr(BUNDLE_FILES[template], data)
+
+        for template, key in pending.items():
+            data = _render(template, cv, lang)
+            store_export(key, data)
+            zf.writestr(BUNDLE_FILES[template], data)
+
+    return buf.getvalue()
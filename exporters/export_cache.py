@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from importlib import metadata
+from typing import Callable, Dict, Optional, Tuple
+
+from exporters.docx_generator import generate_docx_europass, generate_docx_modern
+from exporters.pdf_generator import generate_pdf_europass, generate_pdf_modern
+from utils.cache_store import TieredCache
+from utils.json_io import _sync_primary_from_contact_items, cv_digest
+from utils.paths import cache_dir
+
+
+# template id -> generator(cv, lang) -> bytes
+EXPORTERS: Dict[str, Callable[..., bytes]] = {
+    "pdf_modern": generate_pdf_modern,
+    "pdf_europass": generate_pdf_europass,
+    "docx_modern": generate_docx_modern,
+    "docx_europass": generate_docx_europass,
+}
+
+# Disk tier is off unless a size is configured: rendered CVs are personal data
+# and the memory tier already makes repeat downloads in a session instant.
+_DISK_MB = float(os.environ.get("CVBUILDER_EXPORT_DISK_CACHE_MB", "0") or 0)
+
+_cache = TieredCache(
+    max_items=16,
+    max_memory_bytes=64 * 1024 * 1024,
+    disk_dir=cache_dir("exports") if _DISK_MB > 0 else None,
+    max_disk_bytes=int(_DISK_MB * 1024 * 1024),
+)
+
+_exporters_digest = ""
+
+# Sources outside exporters/ whose changes alter the rendered bytes.
+_EXTRA_SOURCES = ("utils/photo.py", "utils/json_io.py")
+# Libraries whose upgrades alter the rendered bytes.
+_RENDER_LIBS = ("reportlab", "python-docx", "Pillow")
+
+
+def _lib_version(dist: str) -> str:
+    try:
+        return metadata.version(dist)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def _exporters_version() -> str:
+    """
+    Digest of the exporter sources, the utils they render through and the
+    rendering library versions, so a new app or library version never serves
+    stale disk entries.
+    """
+    global _exporters_digest
+    if not _exporters_digest:
+        h = hashlib.sha256()
+        here = os.path.dirname(os.path.abspath(__file__))
+        root = os.path.dirname(here)
+        paths = [os.path.join(here, fn) for fn in sorted(os.listdir(here)) if fn.endswith(".py")]
+        paths += [os.path.join(root, *rel.split("/")) for rel in _EXTRA_SOURCES]
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    h.update(os.path.relpath(path, root).encode("utf-8") + b"\0" + f.read())
+            except OSError:
+                pass
+        for dist in _RENDER_LIBS:
+            h.update(f"{dist}=={_lib_version(dist)}\0".encode("utf-8"))
+        _exporters_digest = h.hexdigest()[:16]
+    return _exporters_digest
+
+
+def export_key(cv: dict, template: str, lang: str = "en") -> str:
+    """Cache key for (canonical CV hash, template, lang)."""
+    raw = f"{cv_digest(cv)}|{template}|{lang}|{_exporters_version()}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def lookup_export(cv: dict, template: str, lang: str = "en") -> Tuple[str, Optional[bytes]]:
+    """(key, cached bytes or None). Callers rendering elsewhere hand the result to store_export."""
+    key = export_key(cv, template, lang)
+    return key, _cache.get(key)
+
+
+def store_export(key: str, data: bytes) -> None:
+    _cache.put(key, data)
+
+
+def export_document(cv: dict, template: str, lang: str = "en") -> bytes:
+    """
+    Render (or reuse) one export. Same CV content + template + lang returns
+    the cached bytes without touching ReportLab / python-docx.
+    """
+    gen = EXPORTERS.get(template)
+    if gen is None:
+        raise ValueError(f"Unknown export template: {template}")
+
+    # the generators backfill primary contact fields in place; do it up front
+    # so the session CV looks the same on a cache hit
+    _sync_primary_from_contact_items(cv)
+
+    key = export_key(cv, template, lang)
+    data = _cache.get(key)
+    if data is None:
+        data = gen(cv, lang=lang)
+        _cache.put(key, data)
+    return data
+
+
+def export_cache_stats() -> Dict[str, int]:
+    return _cache.stats()
+
+
+def clear_export_cache() -> None:
+    _cache.clear()
@@ -0,0 +1,216 @@
+"""
+Page-count estimate for the PDF exports without running ReportLab layout.
+
+Walks the same render IR as pdf_generator and wraps every paragraph and
+bullet greedily with (cached) pdfmetrics.stringWidth, using the exporter's
+page size, margins and stylesheet. Good enough for live "fits on N pages"
+feedback; the real PDF remains the reference.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Tuple
+
+from reportlab.lib.fonts import tt2ps
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from exporters import render_ir as ir
+from exporters.pdf_styles import stylesheet
+
+# SimpleDocTemplate(A4, margins 36) -> one frame with 6pt padding on each side
+MARGIN = 36
+FRAME_PADDING = 6
+FRAME_WIDTH = A4[0] - 2 * MARGIN - 2 * FRAME_PADDING
+FRAME_HEIGHT = A4[1] - 2 * MARGIN - 2 * FRAME_PADDING
+
+HEADER_LEFT_WIDTH = 5.9 * inch
+HEADER_BOTTOM_PADDING = 8
+BULLET_INDENT = 14
+
+_STYLE_NAMES = {
+    "normal": "Normal",
+    "small": "Small",
+    "muted": "Muted",
+    "title": "Title",
+    "profile": "ProfileLine",
+}
+
+_TAG_RE = re.compile(r"<[^>]*>")
+_ENTITIES = (("&lt;", "<"), ("&gt;", ">"), ("&quot;", '"'), ("&nbsp;", " "), ("&amp;", "&"))
+
+
+@lru_cache(maxsize=65536)
+def _width(word: str, font: str, size: float) -> float:
+    return stringWidth(word, font, size)
+
+
+@lru_cache(maxsize=None)
+def _bold_font(font: str) -> str:
+    try:
+        return tt2ps(font, 1, 0)
+    except Exception:
+        return font
+
+
+def _plain(text: str) -> str:
+    text = _TAG_RE.sub("", text)
+    for ent, ch in _ENTITIES:
+        text = text.replace(ent, ch)
+    return text
+
+
+def _count_lines(words: List[Tuple[str, bool]], width: float, font: str, size: float) -> int:
+    """Greedy word wrap, as Paragraph does for left-aligned text; long words overflow."""
+    if not words:
+        return 0
+    space = _width(" ", font, size)
+    lines = 1
+    cur = -space
+    for word, bold in words:
+        w = _width(word, _bold_font(font) if bold else font, size)
+        if cur + space + w <= width or cur < 0:
+            cur += space + w
+        else:
+            lines += 1
+            cur = w
+    return lines
+
+
+def _line_words(line: ir.Line) -> List[List[Tuple[str, bool]]]:
+    """Words of one IR line, split further on embedded newlines (rendered as <br/>)."""
+    out: List[List[Tuple[str, bool]]] = [[]]
+    for run in line:
+        parts = run.text.split("\n")
+        for i, part in enumerate(parts):
+            if i:
+                out.append([])
+            out[-1] += [(w, run.bold) for w in _plain(part).split()]
+    return out
+
+
+def _paragraph_lines(lines, width: float, font: str, size: float) -> int:
+    n = 0
+    for line in lines:
+        for words in _line_words(line):
+            n += _count_lines(words, width, font, size)
+    return n
+
+
+@dataclass
+class _Box:
+    section: str
+    height: float
+    space_before: float = 0.0
+    space_after: float = 0.0
+    leading: float = 0.0  # > 0: may split between lines at a page break
+
+
+@dataclass
+class PageFit:
+    pages: int
+    last_page_fill: float  # 0..1 share of the last page in use
+    # (section title, first page, last page), in document order
+    sections: List[Tuple[str, int, int]] = field(default_factory=list)
+
+    def overflow_sections(self, max_pages: int = 1) -> List[str]:
+        """Sections that reach past page `max_pages`."""
+        return [title for title, _, last in self.sections if last > max_pages]
+
+
+def _boxes(document: ir.Document, ss) -> List[_Box]:
+    boxes: List[_Box] = []
+    section = ""
+
+    if document.header is not None:
+        h = document.header
+        title = ss["Title"]
+        left = _paragraph_lines([(ir.Run(h.name),)], HEADER_LEFT_WIDTH, title.fontName, title.fontSize) * title.leading
+        left += title.spaceAfter
+        for b in h.blocks:
+            left += _block_height(b, ss, HEADER_LEFT_WIDTH)
+        photo = h.photo_size_in * inch if h.photo else 0
+        boxes.append(_Box(section, max(left, photo) + HEADER_BOTTOM_PADDING))
+
+    for b in document.blocks:
+        if isinstance(b, ir.Heading):
+            section = b.text
+            st = ss["H"]
+            n = _paragraph_lines([(ir.Run(b.text),)], FRAME_WIDTH, st.fontName, st.fontSize)
+            boxes.append(_Box(section, n * st.leading, st.spaceBefore, st.spaceAfter))
+        elif isinstance(b, ir.Paragraph):
+            st = ss[_STYLE_NAMES[b.style]]
+            n = _paragraph_lines(b.lines, FRAME_WIDTH, st.fontName, st.fontSize)
+            boxes.append(_Box(section, n * st.leading, st.spaceBefore, st.spaceAfter, st.leading))
+        elif isinstance(b, ir.BulletList):
+            st = ss["Normal"]
+            for item in b.items:
+                n = _paragraph_lines([item], FRAME_WIDTH - BULLET_INDENT, st.fontName, st.fontSize)
+                boxes.append(_Box(section, n * st.leading, st.spaceBefore, st.spaceAfter, st.leading))
+        elif isinstance(b, ir.Spacer):
+            boxes.append(_Box(section, b.height))
+    return boxes
+
+
+def _block_height(b, ss, width: float) -> float:
+    if isinstance(b, ir.Spacer):
+        return b.height
+    if isinstance(b, ir.Paragraph):
+        st = ss[_STYLE_NAMES[b.style]]
+        return _paragraph_lines(b.lines, width, st.fontName, st.fontSize) * st.leading + st.spaceBefore + st.spaceAfter
+    if isinstance(b, ir.Heading):
+        st = ss["H"]
+        return _paragraph_lines([(ir.Run(b.text),)], width, st.fontName, st.fontSize) * st.leading + st.spaceBefore + st.spaceAfter
+    if isinstance(b, ir.BulletList):
+        st = ss["Normal"]
+        return sum(_paragraph_lines([i], width - BULLET_INDENT, st.fontName, st.fontSize) for i in b.items) * st.leading
+    return 0.0
+
+
+def estimate_document(document: ir.Document) -> PageFit:
+    ss = stylesheet()
+    page = 1
+    y = 0.0  # height used on the current page
+    spans: List[List] = []
+
+    def mark(section: str) -> None:
+        if section and (not spans or spans[-1][0] != section):
+            spans.append([section, page, page])
+        elif spans and spans[-1][0] == section:
+            spans[-1][2] = page
+
+    for box in _boxes(document, ss):
+        before = box.space_before if y > 0 else 0.0  # dropped at the top of a frame
+        if y + before + box.height <= FRAME_HEIGHT:
+            y += before + box.height + box.space_after
+            mark(box.section)
+            continue
+
+        # split a paragraph between lines (no single orphan line at the bottom)
+        if box.leading:
+            fit = int((FRAME_HEIGHT - y - before) // box.leading)
+            total = int(round(box.height / box.leading))
+            if 2 <= fit < total:
+                mark(box.section)
+                page += 1
+                y = (total - fit) * box.leading + box.space_after
+                mark(box.section)
+                continue
+
+        page += 1
+        y = min(box.height, FRAME_HEIGHT) + box.space_after
+        mark(box.section)
+
+    return PageFit(
+        pages=page,
+        last_page_fill=min(1.0, y / FRAME_HEIGHT),
+        sections=[(s, first, last) for s, first, last in spans],
+    )
+
+
+def estimate_pages(cv: dict, template: str = "modern") -> PageFit:
+    """Predicted PDF page layout of `cv` for a template ("modern" / "europass")."""
+    return estimate_document(ir.build_document(cv, template))
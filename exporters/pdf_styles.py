@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterator, Optional
+
+from reportlab.lib import colors
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import TableStyle
+
+
+FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansCondensed.ttf",
+]
+
+_lock = threading.Lock()
+_base_font: Optional[str] = None
+_stylesheet: Optional["FrozenStyleSheet"] = None
+_header_table_style: Optional[TableStyle] = None
+
+
+def _register_font() -> str:
+    for p in FONT_CANDIDATES:
+        try:
+            pdfmetrics.registerFont(TTFont("DejaVuSans", p))
+            return "DejaVuSans"
+        except Exception:
+            continue
+    return "Helvetica"
+
+
+def base_font() -> str:
+    """Body font name; the TTF probe runs once per process, on first export."""
+    global _base_font
+    if _base_font is None:
+        with _lock:
+            if _base_font is None:
+                _base_font = _register_font()
+    return _base_font
+
+
+class FrozenStyleSheet:
+    """
+    Read-only view over the shared StyleSheet1. Exports only look styles up;
+    anything that needs a variant should derive one with
+    ParagraphStyle(name, parent=ss["Normal"], ...).
+    """
+
+    def __init__(self, sheet: StyleSheet1):
+        self._sheet = sheet
+
+    def __getitem__(self, key: str) -> ParagraphStyle:
+        return self._sheet[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sheet
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sheet.byName)
+
+    def get(self, key: str, default=None):
+        return self._sheet.get(key, default)
+
+    def add(self, *args, **kwargs):
+        raise TypeError("Shared PDF stylesheet is read-only; derive a new ParagraphStyle instead.")
+
+
+def _build_stylesheet(font: str) -> StyleSheet1:
+    ss = getSampleStyleSheet()
+
+    ss["Normal"].fontName = font
+    ss["Normal"].fontSize = 10
+    ss["Normal"].leading = 13
+
+    ss["Title"].fontName = font
+    ss["Title"].fontSize = 18
+    ss["Title"].leading = 22
+
+    h = ParagraphStyle(
+        "H",
+        parent=ss["Normal"],
+        fontName=font,
+        fontSize=12,
+        leading=16,
+        spaceBefore=10,
+        spaceAfter=6,
+        textColor=colors.black,
+    )
+    ss.add(h)
+
+    small = ParagraphStyle(
+        "Small",
+        parent=ss["Normal"],
+        fontName=font,
+        fontSize=9,
+        leading=12,
+        textColor=colors.black,
+    )
+    ss.add(small)
+
+    muted = ParagraphStyle(
+        "Muted",
+        parent=ss["Normal"],
+        fontName=font,
+        fontSize=9,
+        leading=12,
+        textColor=colors.grey,
+    )
+    ss.add(muted)
+
+    profile = ParagraphStyle(
+        "ProfileLine",
+        parent=ss["Normal"],
+        fontName=font,
+        fontSize=10,
+        leading=13,
+        textColor=colors.black,
+        spaceAfter=2,
+    )
+    ss.add(profile)
+
+    return ss
+
+
+def _build_header_table_style() -> TableStyle:
+    return TableStyle(
+        [
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("ALIGN", (1, 0), (1, 0), "RIGHT"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 0),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+        ]
+    )
+
+
+def stylesheet() -> FrozenStyleSheet:
+    """Process-wide stylesheet, built once and shared by every export/thread."""
+    global _stylesheet
+    if _stylesheet is None:
+        font = base_font()
+        with _lock:
+            if _stylesheet is None:
+                _stylesheet = FrozenStyleSheet(_build_stylesheet(font))
+    return _stylesheet
+
+
+def header_table_style() -> TableStyle:
+    """Shared TableStyle for the header table (Table.setStyle only reads it)."""
+    global _header_table_style
+    if _header_table_style is None:
+        with _lock:
+            if _header_table_style is None:
+                _header_table_style = _build_header_table_style()
+    return _header_table_style
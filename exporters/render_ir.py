@@ -0,0 +1,542 @@
+"""
+Format-neutral document model shared by the PDF, DOCX and TXT exporters.
+
+build_document(cv, template) normalizes the CV once and walks its sections
+into a small tree of immutable blocks (header, headings, paragraphs, bullet
+lists, spacers). The tree is cached per (CV content hash, template), so a
+multi-format export builds it once; the backends in pdf_generator,
+docx_generator and txt_generator only translate blocks:
+
+- Paragraph lines are joined with <br/> in PDF and become separate
+  paragraphs in DOCX / lines in TXT.
+- Runs carry bold/italic for PDF; DOCX keeps one run per paragraph and
+  only bolds all-bold lines (titles), TXT is plain.
+- Spacer is vertical space in PDF, ignored in DOCX, a blank line in TXT.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from utils.json_io import _sync_primary_from_contact_items, cv_digest
+from utils.photo import photo_variant
+
+
+@dataclass(frozen=True)
+class Run:
+    text: str
+    bold: bool = False
+    italic: bool = False
+
+
+Line = Tuple[Run, ...]
+
+
+@dataclass(frozen=True)
+class Paragraph:
+    lines: Tuple[Line, ...]
+    style: str = "normal"  # normal | small | muted | title | profile
+
+
+@dataclass(frozen=True)
+class BulletList:
+    items: Tuple[Line, ...]
+    indent: int = 0  # TXT indentation (spaces)
+
+
+@dataclass(frozen=True)
+class Heading:
+    text: str
+
+
+@dataclass(frozen=True)
+class Spacer:
+    height: float
+
+
+Block = Union[Paragraph, BulletList, Heading, Spacer]
+
+
+@dataclass(frozen=True)
+class Header:
+    name: str
+    blocks: Tuple[Block, ...]
+    photo: Optional[bytes] = None
+    photo_size_in: float = 0.0
+
+
+@dataclass(frozen=True)
+class Document:
+    template: str
+    title: str
+    header: Optional[Header]
+    blocks: Tuple[Block, ...]
+
+
+def line_text(line: Line) -> str:
+    return "".join(r.text for r in line)
+
+
+# ---------------- block helpers ----------------
+def _para(*lines: Union[str, Line], style: str = "normal", bold: bool = False) -> Paragraph:
+    out = []
+    for ln in lines:
+        out.append((Run(ln, bold=bold),) if isinstance(ln, str) else tuple(ln))
+    return Paragraph(tuple(out), style)
+
+
+def _split_lines(text: str) -> List[str]:
+    if not text:
+        return []
+    return [x.strip() for x in str(text).splitlines() if x.strip()]
+
+
+def _bullets(lines: List[Union[str, Line]]) -> BulletList:
+    """Bullet items with the exporters' usual cleanup (blank lines dropped, leading -•* removed)."""
+    items = []
+    for line in lines:
+        if not isinstance(line, str):
+            items.append(tuple(line))
+            continue
+        t = (line or "").strip()
+        if not t:
+            continue
+        items.append((Run(t.lstrip("-•* ").strip()),))
+    return BulletList(tuple(items))
+
+
+# ---------------- shared CV walking ----------------
+_CITY_LABELS = ("city", "oraș", "oras", "localitate")
+_AVAILABILITY_LABELS = ("availability", "disponibilitate")
+
+
+def _city_availability(cv: dict) -> Tuple[str, str]:
+    city = ""
+    availability = ""
+    extras = cv.get("personal_info_extra", [])
+    if isinstance(extras, list):
+        for it in extras:
+            if not isinstance(it, dict):
+                continue
+            lab = (it.get("label") or "").strip().lower()
+            if lab in _CITY_LABELS:
+                city = it.get("value", "") or ""
+            if lab in _AVAILABILITY_LABELS:
+                availability = it.get("value", "") or ""
+    return city, availability
+
+
+def _city_availability_parts(city: str, availability: str) -> List[str]:
+    parts = []
+    if city:
+        parts.append(f"City: {city}")
+    if availability:
+        parts.append(f"Availability: {availability}")
+    return parts
+
+
+def _contact_links(cv: dict, with_location: bool = False) -> List[str]:
+    links = []
+    if cv.get("email"):
+        links.append(f"Email: {cv.get('email')}")
+    if cv.get("telefon"):
+        links.append(f"Phone: {cv.get('telefon')}")
+    if with_location and cv.get("adresa"):
+        links.append(f"Location: {cv.get('adresa')}")
+    if cv.get("linkedin"):
+        links.append(f"LinkedIn: {cv.get('linkedin')}")
+    if cv.get("github"):
+        links.append(f"GitHub: {cv.get('github')}")
+    if cv.get("website"):
+        links.append(f"Website: {cv.get('website')}")
+    return links
+
+
+def _photo(cv: dict) -> Optional[bytes]:
+    b = cv.get("photo")
+    if isinstance(b, (bytes, bytearray)) and len(b) > 0:
+        # uploads are normalized already; this covers JSON imports/older sessions
+        return photo_variant(bytes(b), "print")
+    return None
+
+
+def _skills_map_from_ats(cv: dict) -> Dict[str, List[str]]:
+    out: Dict[str, List[str]] = {}
+    skills = cv.get("ats_skills", [])
+    if isinstance(skills, list):
+        for sec in skills:
+            if not isinstance(sec, dict):
+                continue
+            cat = (sec.get("category") or "").strip()
+            items = sec.get("items", [])
+            if cat and isinstance(items, list):
+                out[cat.lower()] = [str(x).strip() for x in items if str(x).strip()]
+    return out
+
+
+def _uniq(items: List[str]) -> List[str]:
+    seen = set()
+    out = []
+    for x in items:
+        k = x.strip()
+        if not k:
+            continue
+        lk = k.lower()
+        if lk in seen:
+            continue
+        seen.add(lk)
+        out.append(k)
+    return out
+
+
+def technical_skills_groups(cv: dict) -> List[Tuple[str, List[str]]]:
+    """
+    Grouped 'TECHNICAL SKILLS' as (title, items), e.g.
+    ("Cloud & Identity", ["Azure", "Azure AD", ...]).
+    """
+    m = _skills_map_from_ats(cv)
+
+    # Fallback: if ats_skills empty, try to derive from modern_* (best-effort)
+    if not m:
+        if cv.get("modern_tools"):
+            m["tools"] = _split_lines(cv.get("modern_tools", ""))
+        if cv.get("modern_certs"):
+            m["certifications"] = _split_lines(cv.get("modern_certs", ""))
+        if cv.get("modern_keywords_extra"):
+            # dump keywords into security/tools buckets later
+            m["keywords"] = _split_lines(cv.get("modern_keywords_extra", ""))
+
+    cloud_identity = _uniq(m.get("cloud", []) + m.get("identity", []) + m.get("cloud & identity", []))
+    security = _uniq(m.get("security", []) + m.get("keywords", []))
+    networking = _uniq(m.get("networking", []) + m.get("network", []))
+    os_servers = _uniq(m.get("windows/linux", []) + m.get("windows", []) + m.get("linux", []) + m.get("os & servers", []))
+    scripting = _uniq(m.get("scripting/automation", []) + m.get("automation", []) + m.get("scripting", []))
+    tools = _uniq(m.get("tools", []))
+    virtualization = _uniq(m.get("virtualization", []))
+
+    # Smart routing (so keywords don’t make Security explode)
+    sec_only, moved_to_net, moved_to_os = [], [], []
+    for x in security:
+        lx = x.lower()
+        if any(k in lx for k in ["cisco", "vlan", "vpn", "firewall", "routing", "switch"]):
+            moved_to_net.append(x)
+        elif any(k in lx for k in ["windows", "linux", "active directory", "ad", "gpo", "server", "hyper-v", "vmware", "virtual"]):
+            moved_to_os.append(x)
+        else:
+            sec_only.append(x)
+    security = _uniq(sec_only)
+    networking = _uniq(networking + moved_to_net)
+    os_servers = _uniq(os_servers + moved_to_os)
+
+    # Merge cloud tools (Azure AD / Entra, M365 admin) if they exist in Tools
+    for x in tools[:]:
+        lx = x.lower()
+        if any(k in lx for k in ["azure", "entra", "azure ad", "microsoft 365", "m365"]):
+            cloud_identity.append(x)
+            tools.remove(x)
+
+    groups = [
+        ("Cloud & Identity", cloud_identity),
+        ("Security", security),
+        ("Networking", networking),
+        ("OS & Servers", os_servers),
+        ("Scripting & Automation", scripting),
+        ("Tools", tools),
+        ("Virtualization", virtualization),
+        # Certifications: a line inside the same section (not a separate section)
+        ("Certifications", m.get("certifications", [])),
+    ]
+    return [(title, _uniq(items)) for title, items in groups if _uniq(items)]
+
+
+def _technical_skills_lines(cv: dict) -> List[Union[str, Line]]:
+    custom = cv.get("technical_skills_lines")
+    if custom:
+        return list(custom)
+    return [(Run(f"{title}:", bold=True), Run(" " + ", ".join(items))) for title, items in technical_skills_groups(cv)]
+
+
+def _education_blocks(cv: dict, heading: str, trailing_space: float = 0) -> List[Block]:
+    blocks: List[Block] = []
+    edu = cv.get("educatie", [])
+    if isinstance(edu, list) and edu:
+        blocks.append(Heading(heading))
+        for ed in edu:
+            if not isinstance(ed, dict):
+                continue
+            per = ed.get("perioada", "")
+            tit = ed.get("titlu", "")
+            org = ed.get("organizatie", "")
+            line = " — ".join([x for x in [per, tit] if x])
+            blocks.append(_para(*[x for x in [line, str(org) if org else ""] if x]))
+            blocks.append(Spacer(4))
+        if trailing_space:
+            blocks.append(Spacer(trailing_space))
+    return blocks
+
+
+# ---------------- templates ----------------
+def _build_modern(cv: dict) -> Document:
+    name = cv.get("nume_prenume") or cv.get("full_name") or "Full Name"
+    head: List[Block] = []
+
+    profile_line = (cv.get("profile_line") or "").strip()
+    if profile_line:
+        head.append(_para(profile_line, style="profile"))
+
+    headline = cv.get("pozitie_vizata", "")
+    if headline:
+        head.append(_para(str(headline), style="muted"))
+
+    head.append(Spacer(6))
+    city, availability = _city_availability(cv)
+    if not city:
+        city = cv.get("adresa", "") or ""
+    contact = [" | ".join(x) for x in (_city_availability_parts(city, availability), _contact_links(cv)) if x]
+    head.append(_para(*contact, style="small"))
+
+    photo = _photo(cv) if cv.get("include_photo_modern") else None
+    header = Header(str(name), tuple(head), photo, 1.15)
+
+    blocks: List[Block] = [Spacer(10)]
+
+    bullets = cv.get("rezumat_bullets", [])
+    if isinstance(bullets, list) and any(str(x).strip() for x in bullets):
+        blocks += [Heading("SUMMARY"), _bullets([str(x) for x in bullets]), Spacer(8)]
+    else:
+        rez = cv.get("rezumat", "")
+        if rez:
+            blocks += [Heading("SUMMARY"), _para(str(rez)), Spacer(8)]
+
+    tech_lines = _technical_skills_lines(cv)
+    if tech_lines:
+        blocks += [Heading("TECHNICAL SKILLS"), _bullets(tech_lines), Spacer(8)]
+
+    exp = cv.get("experienta", [])
+    if isinstance(exp, list) and exp:
+        blocks.append(Heading("PROFESSIONAL EXPERIENCE"))
+        for e in exp:
+            if not isinstance(e, dict):
+                continue
+            company = e.get("titlu") or e.get("angajator") or ""
+            period = e.get("perioada") or ""
+            role = e.get("functie") or ""
+
+            title_line = company
+            if role:
+                title_line = f"{role} — {company}" if company else role
+            if period:
+                title_line = f"{title_line} — {period}" if title_line else period
+            blocks.append(_para(str(title_line), bold=True))
+
+            loc = e.get("locatie", "")
+            if loc:
+                blocks.append(_para((Run("Location:", italic=True), Run(f" {loc}")), style="small"))
+
+            acts = _split_lines(e.get("activitati", ""))
+            if acts:
+                blocks.append(_bullets(acts))
+            blocks.append(Spacer(6))
+        blocks.append(Spacer(6))
+
+    blocks += _education_blocks(cv, "EDUCATION")
+    return Document("modern", "CV Modern", header, tuple(blocks))
+
+
+def _build_europass(cv: dict) -> Document:
+    name = cv.get("nume_prenume") or cv.get("full_name") or "Full Name"
+    head: List[Block] = [_para("CURRICULUM VITAE (Europass)", style="muted"), Spacer(6)]
+
+    profile_line = (cv.get("profile_line") or "").strip()
+    if profile_line:
+        head.append(_para(profile_line, style="profile"))
+
+    parts = _city_availability_parts(*_city_availability(cv))
+    if parts:
+        head.append(_para(" | ".join(parts), style="small"))
+
+    header = Header(str(name), tuple(head), _photo(cv), 1.25)
+
+    blocks: List[Block] = [Spacer(12), Heading("PERSONAL INFORMATION")]
+    info_lines = _contact_links(cv, with_location=True)
+    extras = cv.get("personal_info_extra", [])
+    if isinstance(extras, list):
+        for it in extras:
+            if not isinstance(it, dict):
+                continue
+            lab = (it.get("label") or "").strip()
+            val = (it.get("value") or "").strip()
+            if lab and val and lab.lower() not in _CITY_LABELS + _AVAILABILITY_LABELS:
+                info_lines.append(f"{lab}: {val}")
+    if info_lines:
+        blocks.append(_bullets(info_lines))
+    blocks.append(Spacer(8))
+
+    exp = cv.get("experienta", [])
+    if isinstance(exp, list) and exp:
+        blocks.append(Heading("WORK EXPERIENCE"))
+        for e in exp:
+            if not isinstance(e, dict):
+                continue
+            role = e.get("functie") or ""
+            company = e.get("angajator") or e.get("titlu") or ""
+            period = e.get("perioada") or ""
+            blocks.append(_para(" — ".join([x for x in [role, period] if x]), bold=True))
+            if company:
+                blocks.append(_para(str(company), style="small"))
+            loc = e.get("locatie") or ""
+            if loc:
+                blocks.append(_para(f"Location: {loc}", style="small"))
+            acts = _split_lines(e.get("activitati", ""))
+            if acts:
+                blocks.append(_bullets(acts))
+            blocks.append(Spacer(6))
+        blocks.append(Spacer(6))
+
+    blocks += _education_blocks(cv, "EDUCATION AND TRAINING", trailing_space=6)
+
+    blocks.append(Heading("LANGUAGE SKILLS"))
+    mother = cv.get("limba_materna", "")
+    if mother:
+        blocks.append(_para((Run("Mother tongue:", bold=True), Run(f" {mother}"))))
+    langs = cv.get("limbi_straine", [])
+    if isinstance(langs, list) and langs:
+        lines = []
+        for l in langs:
+            if not isinstance(l, dict):
+                continue
+            nm = l.get("limba", "")
+            lvl = l.get("nivel", "") or l.get("ascultare", "")
+            if nm:
+                lines.append(f"{nm}: {lvl}".strip())
+        if lines:
+            blocks.append(_bullets(lines))
+    blocks.append(Spacer(6))
+
+    blocks.append(Heading("PERSONAL SKILLS"))
+    secs = cv.get("aptitudini_sections", [])
+    if isinstance(secs, list) and secs:
+        for sec in secs:
+            if not isinstance(sec, dict):
+                continue
+            cat = sec.get("category", "")
+            items = sec.get("items", [])
+            if cat:
+                blocks.append(_para(str(cat), bold=True))
+            if isinstance(items, list) and items:
+                blocks.append(_bullets([str(x) for x in items]))
+            blocks.append(Spacer(4))
+
+    return Document("europass", "CV Europass", header, tuple(blocks))
+
+
+def _build_ats(cv: dict) -> Document:
+    """Plain ATS layout (copy-paste friendly); prefers rezumat_bullets."""
+    blocks: List[Block] = []
+
+    def text(value) -> None:
+        if value is not None:
+            blocks.append(_para(str(value)))
+
+    def bullets(items: List[str], indent: int = 0) -> None:
+        blocks.append(BulletList(tuple((Run(x),) for x in items), indent))
+
+    text(cv.get("nume_prenume", ""))
+    text(cv.get("pozitie_vizata", ""))
+    text(f"Phone: {cv.get('telefon','')}")
+    text(f"Email: {cv.get('email','')}")
+    if cv.get("linkedin"):
+        text(f"LinkedIn: {cv.get('linkedin')}")
+    if cv.get("github"):
+        text(f"GitHub: {cv.get('github')}")
+    if cv.get("website"):
+        text(f"Website: {cv.get('website')}")
+    blocks.append(Spacer(8))
+
+    bullets_raw = cv.get("rezumat_bullets", [])
+    if isinstance(bullets_raw, list) and bullets_raw:
+        blocks.append(Heading("SUMMARY"))
+        bullets([s for s in (str(b).strip() for b in bullets_raw) if s])
+        blocks.append(Spacer(8))
+    elif cv.get("rezumat"):
+        blocks.append(Heading("SUMMARY"))
+        text(str(cv.get("rezumat", "")).strip())
+        blocks.append(Spacer(8))
+
+    blocks.append(Heading("SKILLS"))
+    for line in [
+        cv.get("modern_skills_headline", ""),
+        cv.get("modern_tools", ""),
+        cv.get("modern_certs", ""),
+        cv.get("modern_keywords_extra", ""),
+    ]:
+        if str(line).strip():
+            text(str(line).strip())
+    blocks.append(Spacer(8))
+
+    if cv.get("experienta"):
+        blocks.append(Heading("EXPERIENCE / PROJECTS"))
+        for e in cv.get("experienta", []):
+            if not isinstance(e, dict):
+                continue
+            text(f"- {e.get('functie','')} ({e.get('perioada','')})")
+            if e.get("tehnologii"):
+                text(f"  Tools: {e.get('tehnologii')}")
+            if e.get("link"):
+                text(f"  Link: {e.get('link')}")
+            acts = [b.strip() for b in str(e.get("activitati", "") or "").splitlines()]
+            bullets([b.lstrip("-• ").strip() for b in acts if b], indent=2)
+        blocks.append(Spacer(8))
+
+    if cv.get("educatie"):
+        blocks.append(Heading("EDUCATION"))
+        for ed in cv.get("educatie", []):
+            if isinstance(ed, dict):
+                text(f"- {ed.get('titlu','')} — {ed.get('organizatie','')} ({ed.get('perioada','')})")
+
+    return Document("ats", "CV ATS", None, tuple(blocks))
+
+
+BUILDERS: Dict[str, Callable[[dict], Document]] = {
+    "modern": _build_modern,
+    "europass": _build_europass,
+    "ats": _build_ats,
+}
+
+_CACHE_SIZE = 16
+_cache: "OrderedDict[Tuple[str, str], Document]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def build_document(cv: dict, template: str) -> Document:
+    """
+    Normalized, format-neutral document for one template; cached per CV
+    content hash, so PDF + DOCX (+ TXT) of the same CV build it once.
+    Backfills primary contact fields on `cv` in place, as the exporters
+    always did.
+    """
+    builder = BUILDERS.get(template)
+    if builder is None:
+        raise ValueError(f"Unknown document template: {template}")
+
+    cv = _sync_primary_from_contact_items(cv)
+    key = (cv_digest(cv), template)
+    with _lock:
+        doc = _cache.get(key)
+        if doc is not None:
+            _cache.move_to_end(key)
+            return doc
+
+    doc = builder(cv)
+    with _lock:
+        _cache[key] = doc
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return doc
+
+
+def clear_document_cache() -> None:
+    with _lock:
+        _cache.clear()
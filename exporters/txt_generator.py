@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from exporters import render_ir as ir
+
+
+def render_text(document: ir.Document) -> str:
+    """Plain-text backend for the shared render IR."""
+    lines = []
+    if document.header is not None:
+        lines.append(document.header.name)
+        blocks = document.header.blocks + document.blocks
+    else:
+        blocks = document.blocks
+
+    for b in blocks:
+        if isinstance(b, ir.Paragraph):
+            lines += [ir.line_text(line) for line in b.lines]
+        elif isinstance(b, ir.BulletList):
+            pad = " " * b.indent
+            lines += [f"{pad}• {ir.line_text(line)}" for line in b.items]
+        elif isinstance(b, ir.Heading):
+            lines.append(b.text)
+        elif isinstance(b, ir.Spacer):
+            lines.append("")
+    return "\n".join(lines)
+
+
+def generate_txt_ats(cv: dict) -> str:
+    """
+    Plain-text ATS export (copy-paste friendly); prefers rezumat_bullets.
+    """
+    return render_text(ir.build_document(cv, "ats"))
@@ -1,6 +1,7 @@
 # run_desktop.py (Windows) - run Streamlit in-process (prevents process storm)
 from __future__ import annotations
 
+import multiprocessing
 import os
 import socket
 import sys
@@ -92,4 +93,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Frozen builds re-launch this exe for export worker processes
+    multiprocessing.freeze_support()
     main()
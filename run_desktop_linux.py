@@ -1,6 +1,7 @@
 # run_desktop_linux.py (Linux) - run Streamlit in-process (prevents process storm)
 from __future__ import annotations
 
+import multiprocessing
 import os
 import socket
 import sys
@@ -94,4 +95,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Frozen builds re-launch this exe for export worker processes
+    multiprocessing.freeze_support()
     main()
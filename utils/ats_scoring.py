@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from utils.keyword_matcher import get_matcher, tokenize
 
 _METRIC_UNITS = [
     "%", "ms", "s", "sec", "mins", "min", "hrs", "hour", "hours",
@@ -73,6 +76,14 @@ def flatten_keywords(profile_keywords: Dict[str, Any]) -> List[str]:
     return deduped
 
 
+def _profile_keywords(profile: Dict[str, Any]) -> List[str]:
+    """Flattened keywords; load_profile ships them precomputed in the profile index."""
+    flat = profile.get('_keywords_flat')
+    if flat is not None:
+        return flat
+    return flatten_keywords(profile.get('keywords', {}))
+
+
 @dataclass
 class ATSScore:
     keyword_coverage: int
@@ -89,74 +100,174 @@ class ATSScore:
     repeated_starting_verbs: List[Tuple[str, int]]
 
 
-def compute_score(cv: Dict[str, Any], profile: Dict[str, Any], jd_keywords: List[str]) -> ATSScore:
-    """Compute a practical ATS-oriented score (0-100)."""
-    # Build CV text blob
-    cv_blob = "\n".join([
-        cv.get('pozitie_vizata', ''),
-        cv.get('rezumat', ''),
-        cv.get('modern_skills_headline', ''),
-        cv.get('modern_tools', ''),
-        cv.get('modern_certs', ''),
-        cv.get('modern_keywords_extra', ''),
-        "\n".join([
-            f"{e.get('functie','')} {e.get('tehnologii','')} {e.get('activitati','')}"
-            for e in (cv.get('experienta') or [])
-        ]),
-        "\n".join([
-            f"{e.get('calificare','')} {e.get('institutie','')}"
-            for e in (cv.get('educatie') or [])
-        ]),
-    ])
-    cv_text = normalize(cv_blob)
-
-    profile_kw = flatten_keywords(profile.get('keywords', {}))
-    present_profile = [k for k in profile_kw if k.lower() in cv_text]
-    missing_profile = [k for k in profile_kw if k.lower() not in cv_text]
+def _cv_sections(cv: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """
+    Split the CV into independently scored sections: (key, text, bullets_text).
+    `text` feeds keyword matching, `bullets_text` feeds metric/verb checks.
+    """
+    sections = [
+        ("summary", f"{cv.get('pozitie_vizata', '')}\n{cv.get('rezumat', '')}", cv.get('rezumat', '')),
+        ("skills", "\n".join([
+            cv.get('modern_skills_headline', ''),
+            cv.get('modern_tools', ''),
+            cv.get('modern_certs', ''),
+            cv.get('modern_keywords_extra', ''),
+        ]), ""),
+    ]
+    for i, e in enumerate(cv.get('experienta') or []):
+        sections.append((
+            f"exp:{i}",
+            f"{e.get('functie','')} {e.get('tehnologii','')} {e.get('activitati','')}",
+            e.get('activitati', ''),
+        ))
+    sections.append(("education", "\n".join([
+        f"{e.get('calificare','')} {e.get('institutie','')}"
+        for e in (cv.get('educatie') or [])
+    ]), ""))
+    return sections
+
+
+def _completeness(cv: Dict[str, Any]) -> int:
+    checks = [
+        bool(cv.get('nume_prenume')),
+        bool(cv.get('email')),
+        bool(cv.get('telefon')),
+        bool(cv.get('rezumat')),
+        bool(cv.get('modern_tools') or cv.get('modern_skills_headline')),
+        bool(cv.get('experienta')),
+    ]
+    return int(round(100 * (sum(1 for c in checks if c) / len(checks))))
+
+
+class _SectionStats:
+    """Per-section contributions: tokens, bullet metrics, starting verbs, keyword hits."""
+
+    __slots__ = ("digest", "tokens", "bullets", "bullets_missing", "verbs", "hits")
+
+    def __init__(self, digest: str, text: str, bullets_text: str):
+        self.digest = digest
+        self.tokens = tokenize(text)
+        bullets = split_bullets(bullets_text)
+        self.bullets = len(bullets)
+        self.bullets_missing = [b for b in bullets if not bullet_has_metric(b)]
+        self.verbs = [v.lower() for v in (starting_verb(b) for b in bullets) if v]
+        # matcher -> keyword indices found in this section
+        self.hits: Dict[Any, Set[int]] = {}
+
+    def find(self, matcher) -> Set[int]:
+        found = self.hits.get(matcher)
+        if found is None:
+            if len(self.hits) >= 4:
+                self.hits.clear()
+            found = self.hits[matcher] = matcher.find_tokens(self.tokens)
+        return found
+
+
+class ScoreCache:
+    """
+    Incremental scoring cache, keyed by a content hash of every CV section
+    (summary, skills, each experienta item, education).
+
+    Keep one per session: after an edit only the changed section is
+    re-analyzed; totals are merged from the cached sections. If nothing that
+    affects the score changed (e.g. the photo toggle), the last ATSScore is
+    returned as-is.
+    """
+
+    def __init__(self, max_sections: int = 512):
+        self.max_sections = max_sections
+        self._sections: "OrderedDict[str, _SectionStats]" = OrderedDict()
+        self._last_key: Any = None
+        self._last_score: Any = None
+        self.hits = 0
+        self.misses = 0
+
+    def section(self, text: str, bullets_text: str) -> _SectionStats:
+        h = hashlib.sha1(f"{text}\x00{bullets_text}".encode("utf-8", "surrogatepass")).hexdigest()
+        stats = self._sections.get(h)
+        if stats is not None:
+            self._sections.move_to_end(h)
+            self.hits += 1
+            return stats
+        self.misses += 1
+        stats = self._sections[h] = _SectionStats(h, text, bullets_text)
+        while len(self._sections) > self.max_sections:
+            self._sections.popitem(last=False)
+        return stats
+
+    def analyze(self, cv: Dict[str, Any]) -> List[_SectionStats]:
+        return [self.section(text, bullets) for _, text, bullets in _cv_sections(cv)]
+
+    def score(self, cv: Dict[str, Any], profile: Dict[str, Any], jd_keywords: List[str]) -> ATSScore:
+        profile_kw = _profile_keywords(profile)
+        jd_keywords = list(jd_keywords or [])
+        matcher = get_matcher(profile_kw + jd_keywords)
+
+        stats = self.analyze(cv)
+        completeness = _completeness(cv)
+        # len(profile_kw): the same keyword union split differently scores differently
+        key = (matcher, len(profile_kw), tuple(st.digest for st in stats), completeness)
+        if key == self._last_key:
+            return self._last_score
+
+        merged = _merge_sections(stats, matcher)
+        score = _build_score(merged, profile_kw, jd_keywords, 0, len(profile_kw), completeness)
+        self._last_key, self._last_score = key, score
+        return score
+
+
+def _merge_sections(stats: List[_SectionStats], matcher) -> Dict[str, Any]:
+    """Merge per-section contributions into CV-level totals."""
+    hits: Set[int] = set()
+    bullets = 0
+    bullets_missing: List[str] = []
+    verbs: List[str] = []
+    for st in stats:
+        hits |= st.find(matcher)
+        bullets += st.bullets
+        bullets_missing += st.bullets_missing
+        verbs += st.verbs
+    return {"hits": hits, "bullets": bullets, "bullets_missing": bullets_missing, "verbs": verbs}
+
+
+def _build_score(
+    merged: Dict[str, Any],
+    profile_kw: List[str],
+    jd_keywords: List[str],
+    profile_offset: int,
+    jd_offset: int,
+    completeness: int,
+) -> ATSScore:
+    """Assemble an ATSScore from merged section totals (keyword indices shifted by offsets)."""
+    hits = merged["hits"]
+    present_profile = [k for i, k in enumerate(profile_kw) if profile_offset + i in hits]
+    missing_profile = [k for i, k in enumerate(profile_kw) if profile_offset + i not in hits]
     keyword_coverage = int(round(100 * (len(present_profile) / max(1, len(profile_kw)))))
 
-    present_jd = [k for k in jd_keywords if k in cv_text]
-    missing_jd = [k for k in jd_keywords if k not in cv_text]
+    present_jd = [k for i, k in enumerate(jd_keywords) if jd_offset + i in hits]
+    missing_jd = [k for i, k in enumerate(jd_keywords) if jd_offset + i not in hits]
     jd_match = int(round(100 * (len(present_jd) / max(1, len(jd_keywords)))))
 
     # Bullets: summary + each experience
-    all_bullets: List[str] = []
-    all_bullets += split_bullets(cv.get('rezumat', ''))
-    for e in (cv.get('experienta') or []):
-        all_bullets += split_bullets(e.get('activitati', ''))
-
-    if not all_bullets:
+    bullets_missing = merged["bullets_missing"]
+    if not merged["bullets"]:
         metrics_coverage = 0
-        bullets_missing = []
     else:
-        with_metrics = [b for b in all_bullets if bullet_has_metric(b)]
-        bullets_missing = [b for b in all_bullets if not bullet_has_metric(b)]
-        metrics_coverage = int(round(100 * (len(with_metrics) / len(all_bullets))))
+        with_metrics = merged["bullets"] - len(bullets_missing)
+        metrics_coverage = int(round(100 * (with_metrics / merged["bullets"])))
 
     # Verb variety
-    verbs = [starting_verb(b) for b in all_bullets if starting_verb(b)]
-    unique = len(set(v.lower() for v in verbs))
+    verbs = merged["verbs"]
+    unique = len(set(verbs))
     total = len(verbs) or 1
     verb_variety = int(round(100 * (unique / total)))
 
     # repeated verbs
     counts: Dict[str, int] = {}
     for v in verbs:
-        vl = v.lower()
-        counts[vl] = counts.get(vl, 0) + 1
+        counts[v] = counts.get(v, 0) + 1
     repeated = sorted([(v, c) for v, c in counts.items() if c >= 3], key=lambda x: (-x[1], x[0]))
 
-    # completeness
-    checks = [
-        bool(cv.get('nume_prenume')),
-        bool(cv.get('email')),
-        bool(cv.get('telefon')),
-        bool(cv.get('rezumat')),
-        bool(cv.get('modern_tools') or cv.get('modern_skills_headline')),
-        bool(cv.get('experienta')),
-    ]
-    completeness = int(round(100 * (sum(1 for c in checks if c) / len(checks))))
-
     # weighted overall
     overall = int(round(
         0.25 * keyword_coverage +
@@ -178,3 +289,51 @@ def compute_score(cv: Dict[str, Any], profile: Dict[str, Any], jd_keywords: List
         bullets_missing_metrics=bullets_missing[:20],
         repeated_starting_verbs=repeated[:10],
     )
+
+
+def compute_score(
+    cv: Dict[str, Any],
+    profile: Dict[str, Any],
+    jd_keywords: List[str],
+    cache: Optional[ScoreCache] = None,
+) -> ATSScore:
+    """
+    Compute a practical ATS-oriented score (0-100).
+    Pass a long-lived ScoreCache to only re-analyze sections that changed.
+    """
+    return (cache if cache is not None else ScoreCache()).score(cv, profile, jd_keywords)
+
+
+def compute_score_many(
+    cv: Dict[str, Any],
+    profiles: List[Dict[str, Any]],
+    jd_keywords: List[str],
+    cache: Optional[ScoreCache] = None,
+) -> List[Tuple[Dict[str, Any], ATSScore]]:
+    """
+    Score one CV against many profiles at once.
+    The CV sections, bullet analysis and keyword scan are computed once; every
+    profile's keywords go into a single automaton.
+    Returns [(profile, score)] ranked best fit first.
+    """
+    jd_keywords = list(jd_keywords or [])
+    kw_lists = [_profile_keywords(p) for p in profiles]
+
+    union: List[str] = []
+    offsets: List[int] = []
+    for kws in kw_lists:
+        offsets.append(len(union))
+        union.extend(kws)
+    jd_offset = len(union)
+    union.extend(jd_keywords)
+
+    cache = cache if cache is not None else ScoreCache()
+    merged = _merge_sections(cache.analyze(cv), get_matcher(union))
+    completeness = _completeness(cv)
+
+    ranked = [
+        (p, _build_score(merged, kws, jd_keywords, off, jd_offset, completeness))
+        for p, kws, off in zip(profiles, kw_lists, offsets)
+    ]
+    ranked.sort(key=lambda x: (-x[1].overall, -x[1].keyword_coverage, str(x[0].get('title', ''))))
+    return ranked
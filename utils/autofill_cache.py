@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from utils.cache_store import TieredCache
+from utils.paths import cache_dir
+
+# Bump when _read_pdf_text / _read_docx_text change what they extract.
+# (text_to_cv changes are picked up automatically via the source digest.)
+TEXT_EXTRACTOR_VERSION = 2
+
+# Local-only cache of parsed uploads so a re-upload skips pdfplumber. The disk
+# tier is off unless a size is configured (CVBUILDER_AUTOFILL_CACHE_MB): CV text
+# and parsed CVs are personal data, same policy as the export cache.
+_DISK_MB = float(os.environ.get("CVBUILDER_AUTOFILL_CACHE_MB", "0") or 0)
+
+
+def _tier(name: str, suffix: str) -> TieredCache:
+    return TieredCache(
+        max_items=16,
+        max_memory_bytes=16 * 1024 * 1024,
+        disk_dir=cache_dir(f"autofill/{name}") if _DISK_MB > 0 else None,
+        max_disk_bytes=int(_DISK_MB * 1024 * 1024 / 2),
+        suffix=suffix,
+    )
+
+
+_text_cache = _tier("text", ".txt")
+_cv_cache = _tier("cv", ".json")
+
+_parser_digest = ""
+
+
+def _extractor_version() -> str:
+    try:
+        import pdfplumber
+
+        plumber = getattr(pdfplumber, "__version__", "")
+    except Exception:
+        plumber = ""
+    return f"{TEXT_EXTRACTOR_VERSION}|{plumber}"
+
+
+def _parser_version() -> str:
+    """Digest of the parser source, so a parser change never serves stale CVs."""
+    global _parser_digest
+    if not _parser_digest:
+        here = os.path.dirname(os.path.abspath(__file__))
+        try:
+            with open(os.path.join(here, "pdf_autofill.py"), "rb") as f:
+                _parser_digest = hashlib.sha256(f.read()).hexdigest()[:16]
+        except OSError:
+            _parser_digest = "unknown"
+    return _parser_digest
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _key(*parts: str) -> str:
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_text(file_sha: str) -> Optional[str]:
+    data = _text_cache.get(_key(file_sha, "text", _extractor_version()))
+    return data.decode("utf-8") if data is not None else None
+
+
+def put_text(file_sha: str, text: str) -> None:
+    _text_cache.put(_key(file_sha, "text", _extractor_version()), text.encode("utf-8"))
+
+
+def get_cv(file_sha: str, lang_hint: str) -> Optional[Dict]:
+    """Parsed CV for a known file; a fresh dict on every call (callers merge into it)."""
+    data = _cv_cache.get(_key(file_sha, "cv", lang_hint, _extractor_version(), _parser_version()))
+    if data is None:
+        return None
+    try:
+        return json.loads(data.decode("utf-8"))
+    except ValueError:
+        return None
+
+
+def put_cv(file_sha: str, lang_hint: str, cv: Dict) -> None:
+    data = json.dumps(cv, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    _cv_cache.put(_key(file_sha, "cv", lang_hint, _extractor_version(), _parser_version()), data)
+
+
+def autofill_cache_stats() -> Dict[str, Dict[str, int]]:
+    return {"text": _text_cache.stats(), "cv": _cv_cache.stats()}
+
+
+def clear_autofill_cache() -> None:
+    _text_cache.clear()
+    _cv_cache.clear()
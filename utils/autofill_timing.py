@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from utils.paths import user_data_dir
+
+# One JSON line per autofill run under <data dir>/logs (no file names or CV content);
+# CVBUILDER_AUTOFILL_TIMING_LOG=0 turns the log off.
+_LOG_ENABLED = os.environ.get("CVBUILDER_AUTOFILL_TIMING_LOG", "1").strip() not in ("0", "")
+_LOG_NAME = "autofill_timing.jsonl"
+_LOG_MAX_BYTES = 1024 * 1024  # then rotated once to autofill_timing.jsonl.1
+
+
+class AutofillTimer:
+    """
+    Timing report for one autofill run: wall time per stage (with characters
+    processed and pattern matches), per PDF page, and run facts such as the
+    file kind and cache outcome. Pass one to file_to_cv(timing=...) and read
+    report() afterwards.
+    """
+
+    def __init__(self) -> None:
+        self.stages: List[Dict] = []
+        self.pages: List[Dict] = []
+        self.info: Dict = {}
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict]:
+        """Times the block; the yielded row takes extra fields (chars, matches)."""
+        row: Dict = {"stage": name, "ms": 0.0}
+        t0 = time.perf_counter()
+        try:
+            yield row
+        finally:
+            row["ms"] = round((time.perf_counter() - t0) * 1000.0, 3)
+            self.stages.append(row)
+
+    def add_pages(self, pages: Sequence[Tuple[str, float]], first: int = 0) -> List[str]:
+        """Records (text, ms) pairs from the page reader; returns the texts."""
+        for i, (text, ms) in enumerate(pages):
+            self.pages.append({"page": first + i + 1, "ms": round(ms, 3), "chars": len(text)})
+        return [text for text, _ in pages]
+
+    def report(self) -> Dict:
+        return {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            **self.info,
+            "total_ms": round((time.perf_counter() - self._t0) * 1000.0, 3),
+            "stages": list(self.stages),
+            "pages": list(self.pages),
+        }
+
+
+def timing_log_path() -> Path:
+    p = user_data_dir() / "logs"
+    p.mkdir(parents=True, exist_ok=True)
+    return p / _LOG_NAME
+
+
+def log_timing(report: Dict) -> bool:
+    """Appends the report as one JSON line; never raises (timing must not break an import)."""
+    if not _LOG_ENABLED:
+        return False
+    try:
+        path = timing_log_path()
+        if path.exists() and path.stat().st_size > _LOG_MAX_BYTES:
+            os.replace(path, path.with_name(_LOG_NAME + ".1"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report, ensure_ascii=False, separators=(",", ":")) + "\n")
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class TieredCache:
+    """
+    Bytes cache: in-memory LRU in front of an optional on-disk tier.
+
+    Keys are hex digests (they double as file names). The memory tier is
+    bounded by item count and total bytes; the disk tier by total bytes,
+    evicting least recently used files (mtime is bumped on every hit).
+    """
+
+    def __init__(
+        self,
+        max_items: int = 32,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[Path] = None,
+        max_disk_bytes: int = 0,
+        suffix: str = ".bin",
+    ):
+        self.max_items = max_items
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir and max_disk_bytes > 0 else None
+        self.max_disk_bytes = max_disk_bytes
+        self.suffix = suffix
+
+        self._mem: "OrderedDict[str, bytes]" = OrderedDict()
+        self._mem_bytes = 0
+        self._disk_bytes: Optional[int] = None  # lazily scanned
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    # ---- memory tier ----
+    def _mem_put(self, key: str, data: bytes) -> None:
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self._mem_bytes -= len(old)
+        if len(data) > self.max_memory_bytes:
+            return
+        self._mem[key] = data
+        self._mem_bytes += len(data)
+        while self._mem and (len(self._mem) > self.max_items or self._mem_bytes > self.max_memory_bytes):
+            _, evicted = self._mem.popitem(last=False)
+            self._mem_bytes -= len(evicted)
+
+    # ---- disk tier ----
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}{self.suffix}"  # type: ignore[operator]
+
+    def _disk_entries(self) -> Dict[Path, Tuple[float, int]]:
+        out = {}
+        for p in self.disk_dir.glob(f"*{self.suffix}"):  # type: ignore[union-attr]
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            out[p] = (st.st_mtime, st.st_size)
+        return out
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_disk_bytes:
+            return
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size in self._disk_entries().values())
+            path = self._path(key)
+            prev = path.stat().st_size if path.exists() else 0
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._disk_bytes += len(data) - prev
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+        except OSError:
+            # disk tier is best-effort
+            pass
+
+    def _evict_disk(self) -> None:
+        entries = sorted(self._disk_entries().items(), key=lambda kv: kv[1][0])
+        total = sum(size for _, (_, size) in entries)
+        for path, (_, size) in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    # ---- public API ----
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._mem.get(key)
+            if data is not None:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return data
+            if self.disk_dir is not None:
+                data = self._disk_get(key)
+                if data is not None:
+                    self._mem_put(key, data)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return data
+            self.misses += 1
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._mem_put(key, data)
+            if self.disk_dir is not None:
+                self._disk_put(key, data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+            self._mem_bytes = 0
+            if self.disk_dir is not None and self.disk_dir.exists():
+                for p in self._disk_entries():
+                    try:
+                        p.unlink()
+                    except OSError:
+                        pass
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_items": len(self._mem),
+                "memory_bytes": self._mem_bytes,
+                "disk_bytes": self._disk_bytes or 0,
+            }
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+from utils.jd_ml_offline import categorize_keywords, extract_keywords, suggested_bullet_templates
+
+
+# ATS panels: English stopwords for the frequency ranking
+_STOPWORDS = set("""a about above after again against all am an and any are as at be because been before being below between both but by
+can did do does doing down during each few for from further had has have having he her here hers herself him himself his how
+i if in into is it its itself just me more most my myself no nor not of off on once only or other our ours ourselves out over
+own same she should so some such than that the their theirs them themselves then there these they this those through to too
+under until up very was we were what when where which while who whom why with you your yours yourself yourselves
+""".split())
+
+# ATS helper panel: words >= 4 chars minus a few fillers
+_HELPER_WORD_RE = re.compile(r"[a-zA-Z][a-zA-Z\+\#\.\-]{3,}")
+_HELPER_STOP = {"with", "that", "this", "from", "will", "have", "your", "work", "team", "years", "year", "role"}
+
+# JD analyzer focus (extract_keywords size, coverage slice)
+ANALYZER_KEYWORDS = 60
+ANALYZER_FOCUS = 40
+
+_CACHE_SIZE = 16
+
+
+class JDAnalysis:
+    """
+    Everything the panels derive from one job description.
+
+    Built once per JD text (see get_jd_analysis); each view is computed on
+    first access and then reused by every panel on every rerun.
+    """
+
+    def __init__(self, text: str, digest: str):
+        self.text = text
+        self.digest = digest
+        self._templates: Dict[str, List[str]] = {}
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        """Lowercased tech-ish tokens (c#, c++, .net, node.js...) minus stopwords, in JD order."""
+        text = re.sub(r"\s+", " ", self.text.lower())
+        cleaned = []
+        for t in re.findall(r"[a-z0-9][a-z0-9\+\#\.\-/]{1,}", text):
+            t = t.strip(".-/")
+            if len(t) < 3 or t in _STOPWORDS:
+                continue
+            cleaned.append(t)
+        return tuple(cleaned)
+
+    @cached_property
+    def ranked_terms(self) -> List[str]:
+        """All tokens by frequency (ties keep JD order)."""
+        return [w for w, _ in Counter(self.tokens).most_common()]
+
+    def top_terms(self, n: int = 35) -> List[str]:
+        """ATS dashboard / optimizer keyword list."""
+        return self.ranked_terms[:n]
+
+    @cached_property
+    def helper_terms(self) -> List[str]:
+        """ATS helper panel keyword list (alphabetical, capped at 200)."""
+        words = _HELPER_WORD_RE.findall(self.text.lower())
+        return sorted(set(w for w in words if w not in _HELPER_STOP))[:200]
+
+    @cached_property
+    def keywords(self) -> List[Tuple[str, float]]:
+        """Ranked (keyword, score) pairs from the offline analyzer."""
+        return extract_keywords(self.text, max_keywords=ANALYZER_KEYWORDS)
+
+    @cached_property
+    def keyword_list(self) -> List[str]:
+        return [k for k, _ in self.keywords]
+
+    @cached_property
+    def buckets(self) -> Dict[str, List[str]]:
+        return categorize_keywords(self.keyword_list)
+
+    def templates(self, role_hint: str) -> List[str]:
+        t = self._templates.get(role_hint)
+        if t is None:
+            t = self._templates[role_hint] = suggested_bullet_templates(role_hint, self.buckets)
+        return list(t)
+
+
+_cache: "OrderedDict[str, JDAnalysis]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_jd_analysis(jd_text: str) -> JDAnalysis:
+    """Shared analysis for this JD (LRU keyed by SHA-256 of the stripped text)."""
+    text = (jd_text or "").strip()
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    with _lock:
+        a = _cache.get(digest)
+        if a is not None:
+            _cache.move_to_end(digest)
+            return a
+        a = _cache[digest] = JDAnalysis(text, digest)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return a
@@ -1,8 +1,11 @@
 import re
 from collections import Counter, defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+from utils.keyword_matcher import get_matcher
+
 # Minimal stopwords (EN) – keep short to avoid missing tech terms
 STOP = {
     "and","or","the","a","an","to","of","in","on","for","with","as","at","by",
@@ -94,13 +97,51 @@ def _similar(a: str, b: str) -> float:
     return SequenceMatcher(None, a, b).ratio()
 
 
-def extract_keywords(jd_text: str, max_keywords: int = 50) -> List[Tuple[str, float]]:
+MERGE_SIMILARITY = 0.92
+
+
+def _trigrams(s: str) -> set:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+def _merge_near_duplicates(items: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
     """
-    Offline keyword extraction:
-    - grabs tech phrases (Proper-case) and token words
-    - ranks by frequency + phrase bonus
-    Returns list of (keyword, score)
+    Fold each candidate into the first already-merged keyword with
+    _similar(k, mk) >= MERGE_SIMILARITY, else keep it as a new keyword.
+
+    Only merged keywords sharing a character trigram with the candidate (and
+    close enough in length) are scored. At 0.92 that blocking loses nothing:
+    distinct strings need 13+ chars combined and at most 8% unmatched, which
+    forces a matching block of 3+ chars.
     """
+    merged: List[Tuple[str, float]] = []
+    buckets: Dict[str, List[int]] = defaultdict(list)
+    for k, sc in items:
+        grams = _trigrams(k)
+        cand = set()
+        for g in grams:
+            cand.update(buckets.get(g, ()))
+
+        placed = False
+        for i in sorted(cand):
+            mk = merged[i][0]
+            # upper bounds first (length, then char multiset), same formula as ratio()
+            if 2.0 * min(len(k), len(mk)) / (len(k) + len(mk)) < MERGE_SIMILARITY:
+                continue
+            sm = SequenceMatcher(None, k, mk)
+            if sm.quick_ratio() >= MERGE_SIMILARITY and sm.ratio() >= MERGE_SIMILARITY:
+                merged[i] = (mk, merged[i][1] + sc)
+                placed = True
+                break
+        if not placed:
+            for g in grams:
+                buckets[g].append(len(merged))
+            merged.append((k, float(sc)))
+    return merged
+
+
+def _candidate_counts(jd_text: str) -> Counter:
+    """Phrase + token candidates with their raw scores (before near-duplicate merge)."""
     text = jd_text or ""
     # Normalize separators
     clean = re.sub(r"[•\u2022]", "\n", text)
@@ -127,60 +168,99 @@ def extract_keywords(jd_text: str, max_keywords: int = 50) -> List[Tuple[str, fl
         if bad in STOP or bad.isdigit():
             del c[bad]
 
+    return c
+
+
+def extract_keywords(jd_text: str, max_keywords: int = 50) -> List[Tuple[str, float]]:
+    """
+    Offline keyword extraction:
+    - grabs tech phrases (Proper-case) and token words
+    - ranks by frequency + phrase bonus
+    Returns list of (keyword, score)
+    """
     # Keep top N
-    items = c.most_common(max_keywords * 2)
+    items = _candidate_counts(jd_text).most_common(max_keywords * 2)
 
     # Merge near-duplicates (entra id vs azure ad, etc.) by similarity
-    merged: List[Tuple[str, float]] = []
-    for k, sc in items:
-        placed = False
-        for i, (mk, msc) in enumerate(merged):
-            if _similar(k, mk) >= 0.92:
-                merged[i] = (mk, msc + sc)
-                placed = True
-                break
-        if not placed:
-            merged.append((k, float(sc)))
+    merged = _merge_near_duplicates(items)
 
     merged.sort(key=lambda x: x[1], reverse=True)
     return merged[:max_keywords]
 
 
+# Fallback routing when no hint matches (first group with a substring hit wins)
+FALLBACK_HINTS = [
+    ("cloud_identity", ["azure", "aws", "entra", "iam", "microsoft 365", "intune", "sso"]),
+    ("security", ["mfa", "hardening", "incident", "siem", "edr", "vulnerability", "patch", "soc"]),
+    ("networking", ["cisco", "vlan", "vpn", "firewall", "routing", "switch", "dns", "dhcp"]),
+    ("os_servers", ["windows", "linux", "active directory", "gpo", "server"]),
+    ("scripting_automation", ["powershell", "bash", "python", "ansible", "terraform", "automation"]),
+    ("virtualization", ["vmware", "hyper-v", "kvm", "docker", "kubernetes", "virtual"]),
+]
+
+
+def _group_patterns(groups: List[Tuple[str, List[str]]]) -> List["re.Pattern[str]"]:
+    """One alternation regex per group: does any of its phrases occur in the keyword?"""
+    out = []
+    for _, phrases in groups:
+        alts = dict.fromkeys(ph.lower() for ph in phrases)
+        out.append(re.compile("|".join(re.escape(ph) for ph in alts)))
+    return out
+
+
+def _substring_table(groups: List[Tuple[str, List[str]]]) -> Dict[str, int]:
+    """Every substring of every phrase -> earliest group containing it."""
+    table: Dict[str, int] = {}
+    for gi, (_, phrases) in enumerate(groups):
+        for ph in phrases:
+            pl = ph.lower()
+            for i in range(len(pl)):
+                for j in range(i + 1, len(pl) + 1):
+                    table.setdefault(pl[i:j], gi)
+    return table
+
+
+_HINT_GROUPS = list(CATEGORY_HINTS.items())
+_HINT_RES = _group_patterns(_HINT_GROUPS)
+_ANY_HINT_RE = _group_patterns([("", [h for _, hs in _HINT_GROUPS for h in hs])])[0]
+_HINT_SUBSTRINGS = _substring_table(_HINT_GROUPS)
+_FALLBACK_RES = _group_patterns(FALLBACK_HINTS)
+
+
+@lru_cache(maxsize=4096)
+def _bucket_for(kwl: str) -> str:
+    """
+    Category for a lowercased keyword: the first CATEGORY_HINTS category with
+    a hint inside the keyword or containing it, else the FALLBACK_HINTS
+    chain, else "tools".
+    """
+    # "keyword in hint" is one dict lookup; only earlier categories can still win
+    n = len(_HINT_GROUPS)
+    limit = _HINT_SUBSTRINGS.get(kwl, n)
+    if limit < n or _ANY_HINT_RE.search(kwl):
+        for gi in range(limit):
+            if _HINT_RES[gi].search(kwl):
+                return _HINT_GROUPS[gi][0]
+        if limit < n:
+            return _HINT_GROUPS[limit][0]
+
+    for gi, rx in enumerate(_FALLBACK_RES):
+        if rx.search(kwl):
+            return FALLBACK_HINTS[gi][0]
+    return "tools"
+
+
 def categorize_keywords(keywords: List[str]) -> Dict[str, List[str]]:
     """
     Route keywords into categories using hint lists + fuzzy contains.
     """
     buckets = {k: [] for k in CATEGORY_LABELS.keys()}
 
-    def bucket_for(kw: str) -> str:
-        kwl = kw.lower()
-        # direct hints
-        for cat, hints in CATEGORY_HINTS.items():
-            for h in hints:
-                hl = h.lower()
-                if hl in kwl or kwl in hl:
-                    return cat
-        # fallback heuristics
-        if any(x in kwl for x in ["azure", "aws", "entra", "iam", "microsoft 365", "intune", "sso"]):
-            return "cloud_identity"
-        if any(x in kwl for x in ["mfa", "hardening", "incident", "siem", "edr", "vulnerability", "patch", "soc"]):
-            return "security"
-        if any(x in kwl for x in ["cisco", "vlan", "vpn", "firewall", "routing", "switch", "dns", "dhcp"]):
-            return "networking"
-        if any(x in kwl for x in ["windows", "linux", "active directory", "gpo", "server"]):
-            return "os_servers"
-        if any(x in kwl for x in ["powershell", "bash", "python", "ansible", "terraform", "automation"]):
-            return "scripting_automation"
-        if any(x in kwl for x in ["vmware", "hyper-v", "kvm", "docker", "kubernetes", "virtual"]):
-            return "virtualization"
-        return "tools"
-
     for kw in keywords:
         k = _norm(kw)
         if not k or k in STOP:
             continue
-        cat = bucket_for(k)
-        buckets[cat].append(k)
+        buckets[_bucket_for(k.lower())].append(k)
 
     # Dedup and keep order
     for cat in buckets:
@@ -196,22 +276,30 @@ def categorize_keywords(keywords: List[str]) -> Dict[str, List[str]]:
     return buckets
 
 
+def cv_text_for_coverage(cv: dict) -> str:
+    """Plain-text CV blob the JD analyzer compares against (summary, skills, experience)."""
+    cv_blob = []
+    cv_blob.append(cv.get("rezumat",""))
+    cv_blob.extend(cv.get("rezumat_bullets", []) if isinstance(cv.get("rezumat_bullets", []), list) else [])
+    cv_blob.append(cv.get("modern_tools",""))
+    cv_blob.append(cv.get("modern_keywords_extra",""))
+    for e in cv.get("experienta", []) if isinstance(cv.get("experienta", []), list) else []:
+        if isinstance(e, dict):
+            cv_blob.append(e.get("functie",""))
+            cv_blob.append(e.get("angajator",""))
+            cv_blob.append(e.get("titlu",""))
+            cv_blob.append(e.get("activitati",""))
+            cv_blob.append(e.get("tehnologii",""))
+    return "\n".join([str(x) for x in cv_blob if x])
+
+
 def compute_coverage(cv_text: str, jd_keywords: List[str]) -> Tuple[float, List[str]]:
     """
-    coverage = fraction of jd_keywords found in cv_text (simple contains).
+    coverage = fraction of jd_keywords found in cv_text (whole-word match).
     returns (coverage, missing_keywords)
     """
-    hay = (cv_text or "").lower()
-    found = []
-    missing = []
-    for kw in jd_keywords:
-        k = _norm(kw)
-        if not k:
-            continue
-        if k in hay:
-            found.append(k)
-        else:
-            missing.append(k)
+    keys = [k for k in (_norm(kw) for kw in jd_keywords) if k]
+    found, missing = get_matcher(keys).partition(cv_text)
     coverage = (len(found) / max(1, len(found) + len(missing)))
     return coverage, missing
 
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.jd_ml_offline import _norm, cv_text_for_coverage, extract_keywords
+from utils.job_profiles import JOB_PROFILES_DIR
+from utils.keyword_matcher import get_matcher
+
+# Same focus as the JD analyzer panel: coverage is measured on the top terms
+JOB_TERMS_LIMIT = 40
+
+
+@dataclass
+class JobFit:
+    filename: str
+    name: str
+    saved_at: str
+    coverage: float
+    matched: int
+    total: int
+    missing: List[str]
+
+
+def _job_terms(payload: Dict) -> List[str]:
+    """Normalized, de-duplicated keyword list for one saved job profile."""
+    kws = payload.get("jd_keywords") or []
+    if not kws and payload.get("job_description"):
+        kws = [k for k, _ in extract_keywords(payload.get("job_description", ""), max_keywords=60)]
+    out: List[str] = []
+    seen = set()
+    for kw in kws:
+        k = _norm(str(kw))
+        if not k or k in seen:
+            continue
+        seen.add(k)
+        out.append(k)
+        if len(out) >= JOB_TERMS_LIMIT:
+            break
+    return out
+
+
+class JobFitIndex:
+    """
+    Sparse job x term matrix over job_profiles/*.json (CSR layout in NumPy).
+
+    Rows are appended when a profile is saved and tombstoned when it is
+    deleted; the arrays are compacted once dead rows pile up. Scoring a CV is
+    one keyword scan over the shared vocabulary plus a few vectorized ops,
+    independent of how many jobs are stored.
+    """
+
+    def __init__(self, directory: str = JOB_PROFILES_DIR):
+        self.directory = directory
+        self.terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+
+        # CSR storage
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._entry_row = np.zeros(0, dtype=np.int32)
+        self._alive = np.zeros(0, dtype=bool)
+
+        # row metadata
+        self._files: List[str] = []
+        self._meta: List[Tuple[str, str]] = []  # (name, saved_at)
+        self._row_of: Dict[str, int] = {}
+        self._stamp: Dict[str, Tuple[int, int]] = {}  # filename -> (mtime_ns, size)
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    # ---- incremental updates ----
+    def add(self, filename: str, payload: Dict) -> None:
+        if filename in self._row_of:
+            self.remove(filename)
+
+        ids = []
+        for t in _job_terms(payload):
+            tid = self._term_ids.get(t)
+            if tid is None:
+                tid = self._term_ids[t] = len(self.terms)
+                self.terms.append(t)
+            ids.append(tid)
+
+        row = len(self._files)
+        self._files.append(filename)
+        self._meta.append((str(payload.get("name") or filename), str(payload.get("saved_at") or "")))
+        self._row_of[filename] = row
+
+        self._indices = np.concatenate([self._indices, np.asarray(ids, dtype=np.int32)])
+        self._entry_row = np.concatenate([self._entry_row, np.full(len(ids), row, dtype=np.int32)])
+        self._indptr = np.append(self._indptr, self._indptr[-1] + len(ids))
+        self._alive = np.append(self._alive, True)
+
+    def remove(self, filename: str) -> None:
+        row = self._row_of.pop(filename, None)
+        self._stamp.pop(filename, None)
+        if row is None:
+            return
+        self._alive[row] = False
+        if len(self._alive) >= 32 and self._alive.sum() < len(self._alive) * 0.75:
+            self._compact()
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive)
+        lengths = np.diff(self._indptr)[keep]
+        entry_keep = self._alive[self._entry_row]
+
+        new_row = np.full(len(self._alive), -1, dtype=np.int32)
+        new_row[keep] = np.arange(len(keep), dtype=np.int32)
+
+        self._indices = self._indices[entry_keep]
+        self._entry_row = new_row[self._entry_row[entry_keep]]
+        self._indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        self._alive = np.ones(len(keep), dtype=bool)
+        self._files = [self._files[r] for r in keep]
+        self._meta = [self._meta[r] for r in keep]
+        self._row_of = {fn: i for i, fn in enumerate(self._files)}
+
+    def note_saved(self, filename: str) -> None:
+        """Pick up one saved/overwritten job profile without rescanning the directory."""
+        path = os.path.join(self.directory, filename)
+        try:
+            st = os.stat(path)
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except Exception:
+            self.remove(filename)
+            return
+        self.add(filename, payload)
+        self._stamp[filename] = (st.st_mtime_ns, st.st_size)
+
+    def note_deleted(self, filename: str) -> None:
+        self.remove(filename)
+
+    def sync(self) -> None:
+        """Reconcile with the directory (cheap stat pass; only new/changed files are parsed)."""
+        if not os.path.isdir(self.directory):
+            for fn in list(self._row_of):
+                self.remove(fn)
+            return
+
+        seen = set()
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            seen.add(entry.name)
+            st = entry.stat()
+            if self._stamp.get(entry.name) != (st.st_mtime_ns, st.st_size):
+                self.note_saved(entry.name)
+
+        for fn in [fn for fn in self._row_of if fn not in seen]:
+            self.remove(fn)
+
+    # ---- scoring ----
+    def score(self, cv_text: str, top_n: Optional[int] = None, missing_cap: int = 20) -> List[JobFit]:
+        """Coverage of every saved job against the CV text, best fit first."""
+        n_rows = len(self._files)
+        if not self._row_of:
+            return []
+
+        present = np.zeros(len(self.terms), dtype=bool)
+        hits = get_matcher(self.terms).find(cv_text)
+        if hits:
+            present[np.fromiter(hits, dtype=np.int64, count=len(hits))] = True
+
+        entry_hit = present[self._indices]
+        matched = np.bincount(self._entry_row, weights=entry_hit, minlength=n_rows)
+        totals = np.diff(self._indptr)
+        coverage = matched / np.maximum(totals, 1)
+
+        rows = np.flatnonzero(self._alive)
+        order = rows[np.lexsort((-totals[rows], -coverage[rows]))]
+        if top_n is not None:
+            order = order[:top_n]
+
+        out: List[JobFit] = []
+        for r in order:
+            a, b = self._indptr[r], self._indptr[r + 1]
+            miss = self._indices[a:b][~entry_hit[a:b]][:missing_cap]
+            name, saved_at = self._meta[r]
+            out.append(JobFit(
+                filename=self._files[r],
+                name=name,
+                saved_at=saved_at,
+                coverage=float(coverage[r]),
+                matched=int(matched[r]),
+                total=int(totals[r]),
+                missing=[self.terms[t] for t in miss],
+            ))
+        return out
+
+
+_INDEX: Optional[JobFitIndex] = None
+
+
+def get_job_fit_index() -> JobFitIndex:
+    """Process-wide index, synced with job_profiles/ on every call."""
+    global _INDEX
+    if _INDEX is None or _INDEX.directory != JOB_PROFILES_DIR:
+        _INDEX = JobFitIndex(JOB_PROFILES_DIR)
+    _INDEX.sync()
+    return _INDEX
+
+
+def rank_job_fit(cv: dict, top_n: Optional[int] = None) -> List[JobFit]:
+    """Score the CV against every saved job profile in one call."""
+    return get_job_fit_index().score(cv_text_for_coverage(cv), top_n=top_n)
+
+
+def notify_job_profile_saved(filename: str) -> None:
+    if _INDEX is not None:
+        _INDEX.note_saved(filename)
+
+
+def notify_job_profile_deleted(filename: str) -> None:
+    if _INDEX is not None:
+        _INDEX.note_deleted(filename)
@@ -54,6 +54,7 @@ def save_job_profile(profile: Dict, name: str) -> str:
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
+    _notify_job_fit("saved", fn)
     return fn
 
 
@@ -80,6 +81,19 @@ def delete_job_profile(filename: str) -> bool:
         return False
     try:
         os.remove(path)
-        return True
     except Exception:
         return False
+    _notify_job_fit("deleted", filename)
+    return True
+
+
+def _notify_job_fit(event: str, filename: str) -> None:
+    """Keep the Job Fit matrix in step (imported lazily: job_fit depends on this module)."""
+    try:
+        from utils.job_fit import notify_job_profile_deleted, notify_job_profile_saved
+    except Exception:
+        return
+    if event == "saved":
+        notify_job_profile_saved(filename)
+    else:
+        notify_job_profile_deleted(filename)
@@ -1,5 +1,6 @@
 import json
 import base64
+import hashlib
 
 DEFAULT_PROFILE = "cyber_security"
 
@@ -413,3 +414,19 @@ def export_cv_json(cv: dict, include_photo_base64: bool = False) -> str:
     cv = _sync_primary_from_contact_items(cv)
     safe = _json_safe(cv, include_photo_base64=include_photo_base64)
     return json.dumps(safe, ensure_ascii=False, indent=2)
+
+
+def _digest_default(obj):
+    # binary blobs (photo) enter the hash by their own digest, not their bytes
+    if isinstance(obj, (bytes, bytearray)):
+        return {"__type__": "bytes_sha256", "sha256": hashlib.sha256(bytes(obj)).hexdigest()}
+    return str(obj)
+
+
+def cv_digest(cv: dict) -> str:
+    """
+    SHA-256 of the CV's canonical JSON (sorted keys, compact separators).
+    Equal CV content -> equal digest, regardless of key order.
+    """
+    blob = json.dumps(cv, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_digest_default)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+
+# Word runs ("azure", "365", "ipv6") or single punctuation chars ("+", "/", ".").
+# Matching on these tokens gives word boundaries for free: "ad" never hits
+# inside "adapt", while "c++", "ci/cd" and ".net" still match as written.
+TOKEN_RE = re.compile(r"[^\W_]+|[^\w\s]|_")
+
+
+@lru_cache(maxsize=256)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Lowercase + split into match tokens (cached: the same CV blob is scanned by several panels)."""
+    return tuple(TOKEN_RE.findall((text or "").lower()))
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over tokens.
+
+    Built once per keyword set; `find` walks the CV tokens a single time and
+    reports every keyword that occurs as a whole-token sequence, regardless of
+    how many keywords there are.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[List[int]] = [[]]
+        self._vocab: Set[str] = set()
+
+        for idx, kw in enumerate(self.keywords):
+            toks = tokenize(kw)
+            if not toks:
+                continue
+            state = 0
+            for tok in toks:
+                nxt = self._goto[state].get(tok)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._out.append([])
+                    self._goto[state][tok] = nxt
+                state = nxt
+                self._vocab.add(tok)
+            self._out[state].append(idx)
+
+        # failure links (BFS); outputs are merged along the fail chain so the
+        # scan never has to walk it to report matches
+        self._fail: List[int] = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and tok not in self._goto[f]:
+                    f = self._fail[f]
+                cand = self._goto[f].get(tok, 0)
+                self._fail[nxt] = cand if cand != nxt else 0
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find_tokens(self, tokens: Sequence[str]) -> Set[int]:
+        """Indices (into `keywords`) of every keyword present in `tokens`."""
+        goto, fail, out, vocab = self._goto, self._fail, self._out, self._vocab
+        found: Set[int] = set()
+        state = 0
+        for tok in tokens:
+            if tok not in vocab:
+                # no keyword contains this token -> every partial match dies here
+                state = 0
+                continue
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def find(self, text: str) -> Set[int]:
+        return self.find_tokens(tokenize(text))
+
+    def partition(self, text: str) -> Tuple[List[str], List[str]]:
+        """Split keywords into (present, missing), preserving keyword order."""
+        hits = self.find(text)
+        present = [k for i, k in enumerate(self.keywords) if i in hits]
+        missing = [k for i, k in enumerate(self.keywords) if i not in hits]
+        return present, missing
+
+
+@lru_cache(maxsize=128)
+def _compiled(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Return a compiled matcher for this keyword set (cached across reruns)."""
+    return _compiled(tuple(keywords))
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+APP_NAME = "CVBuilder"
+
+
+def user_data_dir() -> Path:
+    """
+    Per-user writable data dir (same location the desktop launchers use).
+    CVBUILDER_DATA_DIR overrides it (handy for tests / portable installs).
+    """
+    override = os.environ.get("CVBUILDER_DATA_DIR", "").strip()
+    if override:
+        p = Path(override)
+    elif sys.platform.startswith("win"):
+        base = os.environ.get("APPDATA") or str(Path.home() / "AppData" / "Roaming")
+        p = Path(base) / APP_NAME
+    else:
+        xdg = os.environ.get("XDG_DATA_HOME")
+        base = Path(xdg) if xdg else (Path.home() / ".local" / "share")
+        p = base / APP_NAME
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def cache_dir(name: str = "") -> Path:
+    """Cache folder under the user data dir (created on demand)."""
+    p = user_data_dir() / "cache"
+    if name:
+        p = p / name
+    p.mkdir(parents=True, exist_ok=True)
+    return p
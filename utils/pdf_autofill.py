@@ -1,12 +1,20 @@
+import atexit
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Tuple, Optional
+import time
+import zipfile
+from bisect import bisect_left
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from typing import Dict, Iterator, List, Tuple, Optional
+from xml.etree import ElementTree as ET
 
 import pdfplumber
 
-try:
-    from docx import Document  # python-docx
-except Exception:
-    Document = None
+from utils import autofill_cache
+from utils.autofill_timing import AutofillTimer
 
 
 # -----------------------------
@@ -63,63 +71,117 @@ def _looks_like_name(line: str) -> bool:
     return cap >= 2
 
 
-def _extract_contact_urls(text: str) -> Dict[str, str]:
+# -----------------------------
+# Contact fields (one pass)
+# -----------------------------
+# One branch per contact search; a field's value is its first match in the text.
+_CONTACT_BRANCHES = (
+    r"\bEmail:\s*(?P<email>[^\s]+)",
+    r"\bE-mail:\s*(?P<email_dash>[^\s]+)",
+    r"\b(?P<email_any>[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})\b",
+    r"(?:Tel|Telefon|Phone):\s*(?P<phone>[+\d][\d\s\-\(\)]+)",
+    r"(?:City|Oraș|Oras|Locație|Locatie):\s*(?P<city>[^\n]+)",
+    r"(?:Address|Adresa|Adresă):\s*(?P<address>[^\n]+)",
+    r"(?P<linkedin>(?:https?://)?(?:www\.)?linkedin\.com/[^\s\)\],;]+)",
+    r"(?P<github>(?:https?://)?(?:www\.)?github\.com/[^\s\)\],;]+)",
+)
+# Website candidates are matched case-sensitively on the lowercased text (emails excluded by the lookbehind)
+_WEBSITE = r"(?<!@)\b(?:https?://)?(?:www\.)?[a-z0-9][a-z0-9\-]+\.[a-z]{2,}(?:/[^\s\)\],;]+)?\b"
+
+
+def _contact_pattern() -> str:
     """
-    Extract linkedin/github/website from raw text using robust patterns.
-    Always returns a dict.
+    Website candidate (lookahead) and/or one of the branches, at the same position.
+    No two branches can match at one position, so a single alternation loses nothing.
     """
-    txt = text or ""
-    lower = txt.lower()
+    named = "|".join(_CONTACT_BRANCHES)
+    plain = re.sub(r"\(\?P<\w+>", "(?:", named)
+    return rf"(?:(?=(?-i:(?P<website>{_WEBSITE})))|(?={plain}))(?:{named})?"
+
 
-    def find_full(rx: str) -> str:
-        m = re.search(rx, txt, flags=re.IGNORECASE)
-        return _normalize_url(m.group(0)) if m else ""
+_CONTACT_RX = re.compile(_contact_pattern(), re.IGNORECASE)
+_CONTACT_NAMES = tuple(_CONTACT_RX.groupindex)
+# Every match has a ':' (labels), '@' (bare email) or '.xx' (URLs) before its first whitespace,
+# so only the token stretch up to each of those is tried
+_CONTACT_ANCHOR_RX = re.compile(r"[:@.](?:(?<=[:@])|[a-z]{2})", re.IGNORECASE)
+# Fields whose first match is final (the others only stand in for a missing one)
+_CONTACT_FINAL = frozenset({"email", "phone", "city", "linkedin", "github", "website"})
+_PROFILE_SITES = ("linkedin.com", "github.com")  # stored separately, never the website
+_MAIL_DOMAINS = frozenset({"yahoo.com", "gmail.com", "outlook.com", "hotmail.com", "live.com", "icloud.com"})
 
-    # LinkedIn / GitHub (full match, not group(1))
-    linkedin = find_full(r"(?:https?://)?(?:www\.)?linkedin\.com/[^\s\)\],;]+")
-    github = find_full(r"(?:https?://)?(?:www\.)?github\.com/[^\s\)\],;]+")
 
-    # Normalize display (keep without scheme to be ATS-friendly if you prefer)
+def _scan_contacts(s: str) -> Dict[str, Tuple[int, int]]:
+    """
+    First (start, end) span of each _CONTACT_RX group in s. Website candidates
+    follow each other without overlap (as re.findall) and LinkedIn/GitHub URLs
+    are skipped, so the website span is the first usable candidate.
+    """
+    found: Dict[str, Tuple[int, int]] = {}
+    web_from = 0
+    tried = 0  # every start position below this has been tried
+    for anchor in _CONTACT_ANCHOR_RX.finditer(s):
+        start = anchor.start()
+        while start > tried and not s[start - 1].isspace():
+            start -= 1
+        end, tried = anchor.start() + 1, anchor.start() + 1
+        for pos in range(start, end):
+            m = _CONTACT_RX.match(s, pos)
+            if m is None:
+                continue
+            for name in _CONTACT_NAMES:
+                if name in found or m.start(name) < 0:
+                    continue
+                if name == "website":
+                    if pos < web_from:
+                        continue
+                    if any(site in m.group(name) for site in _PROFILE_SITES):
+                        web_from = m.end(name)
+                        continue
+                found[name] = m.span(name)
+            if _CONTACT_FINAL <= found.keys():
+                return found
+    return found
+
+
+def _contact_matches(text: str) -> Dict[str, str]:
+    """Raw first match per contact field; website is taken from the lowercased text."""
+    lower = text.lower()
+    if len(lower) == len(text):
+        # same offsets in both ('İ' is the only character that lowercases to two)
+        spans = _scan_contacts(lower)
+        return {k: (lower if k == "website" else text)[a:b] for k, (a, b) in spans.items()}
+    out = {k: text[a:b] for k, (a, b) in _scan_contacts(text).items() if k != "website"}
+    web = _scan_contacts(lower).get("website")
+    if web:
+        out["website"] = lower[web[0]:web[1]]
+    return out
+
+
+def _extract_contact_urls(text: str, found: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Extract linkedin/github/website from raw text using robust patterns.
+    Always returns a dict.
+    """
+    if found is None:
+        found = _contact_matches(text or "")
+
+    # LinkedIn / GitHub (full match); display without scheme to stay ATS-friendly
+    linkedin = _normalize_url(found.get("linkedin", ""))
+    github = _normalize_url(found.get("github", ""))
     if linkedin:
         linkedin = linkedin.replace("https://", "").replace("http://", "").rstrip("/")
     if github:
         github = github.replace("https://", "").replace("http://", "").rstrip("/")
 
-    # Website:
-    # Avoid email domains: negative lookbehind for '@'
     website = ""
-    candidates = re.findall(
-        r"(?<!@)\b(?:https?://)?(?:www\.)?[a-z0-9][a-z0-9\-]+\.[a-z]{2,}(?:/[^\s\)\],;]+)?\b",
-        lower
-    )
-        # Blocklist for common CV platform footers / mail providers
-    blocked_domains = {
-        "ejobs.ro", "www.ejobs.ro",
-        "contact@ejobs.ro",
-        "linkedin.com", "github.com",  # we store these separately
-        "yahoo.com", "gmail.com", "outlook.com", "hotmail.com", "live.com", "icloud.com"
-    }
-
-    if website:
-        dom = website.lower().replace("https://", "").replace("http://", "")
-        dom = dom.replace("www.", "")
-        dom = dom.split("/")[0]
-        if dom in blocked_domains or "ejobs.ro" in dom:
-            website = ""
-
-    if candidates:
-        for c in candidates:
-            if "linkedin.com" in c or "github.com" in c:
-                continue
-            website = _normalize_url(c)
-            website = website.replace("https://", "").replace("http://", "").rstrip("/")
-            break
+    if "website" in found:
+        website = _normalize_url(found["website"])
+        website = website.replace("https://", "").replace("http://", "").rstrip("/")
 
     # Drop common mail providers that slip through
-    mail_domains = {"yahoo.com", "gmail.com", "outlook.com", "hotmail.com", "live.com", "icloud.com"}
     if website:
         dom = website.lower().replace("www.", "").split("/")[0]
-        if dom in mail_domains:
+        if dom in _MAIL_DOMAINS:
             website = ""
 
     return {
@@ -129,8 +191,6 @@ def _extract_contact_urls(text: str) -> Dict[str, str]:
     }
 
 
-
-
 def _make_contact_items(email: str, phone: str, location: str, linkedin: str, github: str, website: str) -> List[Dict]:
     items = []
     def add(t, v, label=None):
@@ -172,35 +232,181 @@ def _dedupe_doubled_chars(s: str) -> str:
     parts = [dedupe_token(p) if not p.isspace() else p for p in parts]
     return "".join(parts)
 
+# -----------------------------
+# Section index (one pass)
+# -----------------------------
+# Every EN/RO section header / terminator the extractors look for. Matched
+# anywhere and case-insensitively, like the per-section searches they replace.
+_SECTION_TOKENS: Dict[str, str] = {
+    "about_me": "about me",
+    "summary": "summary",
+    "despre_mine": "despre mine",
+    "rezumat": "rezumat",
+    "professional_experience": "professional experience",
+    "work_experience": "work experience",
+    "experience": "experience",
+    "employment_history": "employment history",
+    "experienta_diacritics": "experiență profesională",
+    "experienta": "experienta profesionala",
+    "foreign_languages": "foreign languages",
+    "languages": "languages",
+    "limbi_straine_diacritics": "limbi străine",
+    "limbi_straine": "limbi straine",
+    "limbi": "limbi",
+    "other_sections": "other sections",
+    "other_information": "other information",
+    "other": "other",
+    "alte_informatii_diacritics": "alte informații",
+    "alte_informatii": "alte informatii",
+    "alte": "alte",
+    "ejobs": "www.ejobs.ro",
+    "driving_license": "driving license",
+    "permis": "permis de conducere",
+    "education": "education",
+    "educatie_diacritics": "educație",
+    "educatie": "educatie",
+}
+
+_BY_LENGTH = sorted(_SECTION_TOKENS.items(), key=lambda kv: -len(kv[1]))
+
+
+def _scan_pattern() -> str:
+    # A case-sensitive first-character class lets re skip ahead like a plain
+    # literal search (an IGNORECASE alternation is tried at every offset);
+    # non-ASCII is always let through, since that is where the odd
+    # case-insensitive equivalents live (ſ ~ s, İ ~ i). Each branch then
+    # re-checks that first character case-insensitively and matches the rest.
+    by_first: Dict[str, List[str]] = {}
+    for _, tok in _BY_LENGTH:
+        by_first.setdefault(tok[0], []).append(tok[1:])
+    guard = "".join(sorted({c for f in by_first for c in (f, f.upper())}))
+    branches = "|".join(
+        f"(?<={re.escape(f)})(?:{'|'.join(re.escape(r) for r in rests)})"
+        for f, rests in sorted(by_first.items())
+    )
+    return f"[{re.escape(guard)}\\x80-\\U0010ffff](?i:{branches})"
+
+
+# finds where some token starts ...
+_SECTION_SCAN_RX = re.compile(_scan_pattern())
+# ... and names it (longest first); shorter tokens sharing that start
+# ("limbi" in "limbi străine") are added from _SECTION_PREFIXES
+_SECTION_RX = re.compile(
+    "|".join(f"(?P<{name}>{re.escape(tok)})" for name, tok in _BY_LENGTH),
+    re.IGNORECASE,
+)
+_SECTION_PREFIXES: Dict[str, Tuple[str, ...]] = {
+    name: tuple(o for o, t in _SECTION_TOKENS.items() if o != name and tok.startswith(t))
+    for name, tok in _SECTION_TOKENS.items()
+}
+_WS_RX = re.compile(r"\s*")
+
+
+class _SectionIndex:
+    """
+    Offsets of every section token in `text`, built with one scan; each
+    section is then a slice. section() reproduces
+    re.search(r"HEAD\\s*(.+?)\\s*(?:END|...|$)", text, re.I | re.S).
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.hits: Dict[str, List[int]] = {name: [] for name in _SECTION_TOKENS}
+        # restart one character after each hit, so overlapping tokens
+        # ("languages" inside "foreign languages") are all found
+        m = _SECTION_SCAN_RX.search(text)
+        while m is not None:
+            pos = m.start()
+            name = _SECTION_RX.match(text, pos).lastgroup
+            self.hits[name].append(pos)
+            for other in _SECTION_PREFIXES[name]:
+                self.hits[other].append(pos)
+            m = _SECTION_SCAN_RX.search(text, pos + 1)
+
+    def first(self, names: Tuple[str, ...], start: int = 0) -> Optional[int]:
+        best = None
+        for name in names:
+            hits = self.hits[name]
+            i = bisect_left(hits, start)
+            if i < len(hits) and (best is None or hits[i] < best):
+                best = hits[i]
+        return best
+
+    def section(self, heads: Tuple[str, ...], ends: Tuple[str, ...], to_eof: bool = True) -> Optional[str]:
+        """
+        Text between the first header and the next terminator (or the end of
+        the text when to_eof); None when the regex would not match.
+        """
+        h = self.first(heads)
+        if h is None:
+            return None
+        # the header alternatives have equal length, hits are case-insensitive literals
+        e = h + len(_SECTION_TOKENS[heads[0]])
+        s = _WS_RX.match(self.text, e).end()
+        n = len(self.text)
+
+        q = self.first(ends, s + 1)
+        if q is not None:
+            return self.text[s:q]
+        if to_eof and s < n:
+            return self.text[s:]
+        # `.+?` needs one character: \s* gives back its last one if a terminator
+        # (or the end) follows the whitespace directly
+        if s > e and (to_eof or self.first(ends, s) == s):
+            return self.text[s - 1:s]
+        return None
+
+
+_EN_EXPERIENCE = ("professional_experience", "work_experience", "experience", "employment_history")
+_RO_EXPERIENCE = ("experienta_diacritics", "experienta")
+
+# (header tokens, terminator tokens), tried in order; first match wins
+_ABOUT_SECTIONS = (
+    (("about_me",), _EN_EXPERIENCE),
+    (("summary",), _EN_EXPERIENCE),
+    (("despre_mine",), _RO_EXPERIENCE),
+    (("rezumat",), _RO_EXPERIENCE),
+)
+_LANGUAGE_SECTIONS = (
+    (("foreign_languages",), ("other_sections", "other_information", "ejobs")),
+    (("limbi_straine_diacritics",), ("alte_informatii_diacritics", "alte_informatii", "ejobs")),
+    (("languages",), ("other_sections", "other_information")),
+    (("limbi",), ("alte_informatii_diacritics", "alte_informatii")),
+)
+_DRIVING_SECTIONS = (
+    (("driving_license",), ("ejobs",)),
+    (("permis",), ("ejobs",)),
+)
+# "Education and training" starts with "Education", which always wins
+_EDUCATION_SECTIONS = (
+    (("education",), ("foreign_languages", "languages", "other", "ejobs")),
+    (("educatie_diacritics", "educatie"), ("limbi_straine_diacritics", "limbi_straine", "limbi", "alte", "ejobs")),
+)
+
+
 # -----------------------------
 # Block extraction (multi-layout)
 # -----------------------------
-def _extract_blocks(text: str) -> Dict[str, any]:
+def _extract_header(text: str, lines: Optional[List[str]] = None) -> Dict[str, any]:
     """
-    Works for eJobs-like CVs and also more general layouts.
-    Returns dict with keys:
-      name, headline, profile_line, email, phone, location,
-      about, education_lines (list), languages (list tuples), driving (list)
+    Name, headline and contact fields: keys nume, headline, profile_line,
+    email, telefon, adresa, linkedin, github, website. Needs only the top of
+    the CV (the first PDF page is enough for the staged preview).
     """
     blocks: Dict[str, any] = {}
 
-    # Email / phone / location (EN/RO)
-    email = _find_first(r"\bEmail:\s*([^\s]+)", text) or _find_first(r"\bE-mail:\s*([^\s]+)", text)
-    if not email:
-        email = _find_first(r"\b([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})\b", text)
+    # Email / phone / location (EN/RO), all from one contact scan
+    found = _contact_matches(text)
+    email = _clean(found.get("email")) or _clean(found.get("email_dash")) or _clean(found.get("email_any"))
 
-    phone = _find_first(r"(?:Tel|Telefon|Phone):\s*([+\d][\d\s\-\(\)]+)", text)
-    phone = _normalize_phone(phone or "")
+    phone = _normalize_phone(_clean(found.get("phone")))
 
-    location = (
-        _find_first(r"(?:City|Oraș|Oras|Locație|Locatie):\s*([^\n]+)", text)
-        or _find_first(r"(?:Address|Adresa|Adresă):\s*([^\n]+)", text)
-        or ""
-    )
+    location = _clean(found.get("city")) or _clean(found.get("address"))
     location = _clean(location)
 
     # Guess name/headline from top lines
-    lines = _clean_lines(text)
+    if lines is None:
+        lines = _clean_lines(text)
     top = lines[:25]
 
     name = ""
@@ -243,21 +449,28 @@ def _extract_blocks(text: str) -> Dict[str, any]:
     blocks["adresa"] = location or ""
 
     # URLs
-    urls = _extract_contact_urls(text)
-    blocks.update(urls if isinstance(urls, dict) else {})
+    blocks.update(_extract_contact_urls(text, found))
+    return blocks
+
+
+def _extract_blocks(text: str, sections: Optional[_SectionIndex] = None) -> Dict[str, any]:
+    """
+    Works for eJobs-like CVs and also more general layouts.
+    Returns dict with keys:
+      name, headline, profile_line, email, phone, location,
+      about, education_lines (list), languages (list tuples), driving (list)
+    """
+    lines = _clean_lines(text)
+    blocks = _extract_header(text, lines)
+    if sections is None:
+        sections = _SectionIndex(text)
 
     # About me / Despre mine / Summary
     about = ""
-    about_patterns = [
-        (r"About me\s*(.+?)\s*(Professional experience|Work experience|Experience|Employment history)", re.IGNORECASE | re.DOTALL),
-        (r"Summary\s*(.+?)\s*(Professional experience|Work experience|Experience|Employment history)", re.IGNORECASE | re.DOTALL),
-        (r"Despre mine\s*(.+?)\s*(Experiență profesională|Experienta profesionala)", re.IGNORECASE | re.DOTALL),
-        (r"Rezumat\s*(.+?)\s*(Experiență profesională|Experienta profesionala)", re.IGNORECASE | re.DOTALL),
-    ]
-    for pat, flags in about_patterns:
-        m = re.search(pat, text, flags)
-        if m:
-            about = _clean(m.group(1))
+    for heads, ends in _ABOUT_SECTIONS:
+        sec = sections.section(heads, ends, to_eof=False)
+        if sec is not None:
+            about = _clean(sec)
             break
     blocks["about"] = about or ""
 
@@ -272,15 +485,9 @@ def _extract_blocks(text: str) -> Dict[str, any]:
     # Foreign languages section
     langs: List[Tuple[str, str]] = []
     lang_section = None
-    for pat in [
-        r"Foreign languages\s*(.+?)\s*(?:Other sections|Other information|www\.ejobs\.ro|$)",
-        r"Limbi străine\s*(.+?)\s*(?:Alte informații|Alte informatii|www\.ejobs\.ro|$)",
-        r"Languages\s*(.+?)\s*(?:Other sections|Other information|$)",
-        r"Limbi\s*(.+?)\s*(?:Alte informații|Alte informatii|$)",
-    ]:
-        m = re.search(pat, text, re.IGNORECASE | re.DOTALL)
-        if m:
-            lang_section = m.group(1)
+    for heads, ends in _LANGUAGE_SECTIONS:
+        lang_section = sections.section(heads, ends)
+        if lang_section is not None:
             break
     if lang_section:
         for raw in lang_section.splitlines():
@@ -294,13 +501,9 @@ def _extract_blocks(text: str) -> Dict[str, any]:
 
     # Driving license
     dl = []
-    for pat in [
-        r"Driving license\s*(.+?)(?:www\.ejobs\.ro|$)",
-        r"Permis de conducere\s*(.+?)(?:www\.ejobs\.ro|$)",
-    ]:
-        m = re.search(pat, text, re.IGNORECASE | re.DOTALL)
-        if m:
-            seg = m.group(1)
+    for heads, ends in _DRIVING_SECTIONS:
+        seg = sections.section(heads, ends)
+        if seg is not None:
             for c in re.findall(r"\bCategory\s*([A-Z])\b|\bCategoria\s*([A-Z])\b", seg, re.IGNORECASE):
                 cat = (c[0] or c[1] or "").upper()
                 if cat and cat not in dl:
@@ -422,18 +625,18 @@ def _extract_experience_items(text: str) -> List[Dict]:
 # -----------------------------
 # Education extraction (improved)
 # -----------------------------
-def _extract_education(blocks: Dict[str, any], full_text: str) -> List[Dict]:
+def _extract_education(
+    blocks: Dict[str, any], full_text: str, sections: Optional[_SectionIndex] = None
+) -> List[Dict]:
     educatie: List[Dict] = []
 
     # 1) try "Education" section snippet (EN/RO)
     sec = None
-    for pat in [
-        r"(Education|Education and training)\s*(.+?)(?:Foreign languages|Languages|Other|www\.ejobs\.ro|$)",
-        r"(Educație|Educatie)\s*(.+?)(?:Limbi străine|Limbi straine|Limbi|Alte|www\.ejobs\.ro|$)",
-    ]:
-        m = re.search(pat, full_text, re.IGNORECASE | re.DOTALL)
-        if m:
-            sec = m.group(2)
+    if sections is None:
+        sections = _SectionIndex(full_text)
+    for heads, ends in _EDUCATION_SECTIONS:
+        sec = sections.section(heads, ends)
+        if sec is not None:
             break
 
     candidates = []
@@ -497,39 +700,295 @@ def _summary_to_bullets(about: str) -> List[str]:
 # -----------------------------
 # Text loaders (PDF / DOCX)
 # -----------------------------
-def _read_pdf_text(pdf_path: str) -> str:
-    pages_text = []
+# pdfplumber spends ~60-120 ms of CPU per CV page; documents with at least
+# this many pages are split across a process pool, smaller ones stay in-process
+# (at 3 pages the pool's IPC and per-worker open eat the gain).
+PARALLEL_MIN_PAGES = 4
+MAX_EXTRACT_WORKERS = 4
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_warmup: List[Future] = []
+
+
+def _page_texts(pages, timed: bool = False) -> List:
+    """extract_text() of each page; (text, ms) pairs when timed."""
+    if not timed:
+        return [p.extract_text() or "" for p in pages]
+    out = []
+    for p in pages:
+        t0 = time.perf_counter()
+        text = p.extract_text() or ""
+        out.append((text, (time.perf_counter() - t0) * 1000.0))
+    return out
+
+
+def _extract_pages(pdf_path: str, start: int, stop: int, timed: bool = False) -> List:
+    """Worker entry point (top-level so it pickles): text of pages [start, stop)."""
     with pdfplumber.open(pdf_path) as pdf:
-        for p in pdf.pages:
-            pages_text.append(p.extract_text() or "")
-    return "\n".join(pages_text)
+        return _page_texts(pdf.pages[start:stop], timed)
+
+
+def _warm_worker() -> None:
+    """Pool initializer: unpickling it in a fresh worker imports this module and pdfplumber."""
+
+
+def _start_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool, _pool_warmup
+    if _pool is None:
+        workers = min(MAX_EXTRACT_WORKERS, os.cpu_count() or 1)
+        if workers < 2:
+            return None
+        # spawn, not fork: forking the threaded Streamlit server can hand a worker locks held by another thread
+        _pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_warm_worker
+        )
+        atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        # one no-op per worker starts them all now instead of on the first PDF
+        _pool_warmup = [_pool.submit(_warm_worker) for _ in range(workers)]
+    return _pool
+
+
+def warm_extract_pool() -> None:
+    """Start the extraction workers in the background; call once at app start."""
+    _start_pool()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Shared extraction pool (kept alive between imports) once its workers are
+    up; None while they are still starting (extract in-process meanwhile) and
+    on single-core boxes.
+    """
+    pool = _start_pool()
+    if pool is None or not all(f.done() for f in _pool_warmup):
+        return None
+    return pool
+
+
+def _drop_pool() -> None:
+    global _pool, _pool_warmup
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool, _pool_warmup = None, []
+
+
+def _page_ranges(n_pages: int, parts: int, first: int = 0) -> List[Tuple[int, int]]:
+    """Contiguous, near-equal [start, stop) ranges covering pages first..n_pages-1."""
+    parts = max(1, min(parts, n_pages - first))
+    step, extra = divmod(n_pages - first, parts)
+    out, start = [], first
+    for i in range(parts):
+        stop = start + step + (1 if i < extra else 0)
+        out.append((start, stop))
+        start = stop
+    return out
+
+
+def _extract_parallel(
+    pool: ProcessPoolExecutor, pdf_path: str, n_pages: int, first: int = 0, timed: bool = False
+) -> List:
+    ranges = _page_ranges(n_pages, pool._max_workers, first)
+    futures = [pool.submit(_extract_pages, pdf_path, a, b, timed) for a, b in ranges]
+    pages: List = []
+    for fut in futures:  # submission order == page order
+        pages += fut.result()
+    return pages
+
+
+def _read_pdf_text(pdf_path: str, timing: Optional[AutofillTimer] = None) -> str:
+    timed = timing is not None
+    with pdfplumber.open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+        pool = _get_pool() if n_pages >= PARALLEL_MIN_PAGES else None
+        if pool is None:
+            pages = _page_texts(pdf.pages, timed)
+    if pool is not None:
+        pages = _read_pdf_pages(pdf_path, 0, n_pages, pool, timed)
+    if timed:
+        pages = timing.add_pages(pages)
+    return "\n".join(pages)
+
+
+def _read_pdf_pages(
+    pdf_path: str, first: int, n_pages: int, pool: Optional[ProcessPoolExecutor] = None, timed: bool = False
+) -> List:
+    """Text of pages first..n_pages-1 ((text, ms) pairs when timed), split over the pool when one is given."""
+    if pool is not None:
+        try:
+            return _extract_parallel(pool, os.path.abspath(pdf_path), n_pages, first, timed)
+        except (BrokenProcessPool, RuntimeError, OSError):
+            _drop_pool()
+    return _extract_pages(pdf_path, first, n_pages, timed)
+
+
+def _read_pdf_first_page(pdf_path: str, timing: Optional[AutofillTimer] = None) -> Tuple[str, int]:
+    """(text of page 1, page count) without touching the other pages."""
+    with pdfplumber.open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+        pages = _page_texts(pdf.pages[:1], timing is not None)
+    if timing is not None:
+        pages = timing.add_pages(pages)
+    return (pages[0] if pages else ""), n_pages
+
+
+# WordprocessingML (transitional + strict) and markup-compatibility namespaces
+_W_NS = (
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "http://purl.oclc.org/ooxml/wordprocessingml/main",
+)
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_RUN_TEXT = {"tab": "\t", "ptab": "\t", "br": "\n", "cr": "\n", "noBreakHyphen": "-"}
+# w:moveFrom is the old copy of moved text; mc:Fallback repeats mc:Choice (VML text boxes)
+_W_SKIP = {"moveFrom"}
+
+
+def _w(tag: str) -> Optional[str]:
+    """Local name of a w: element, None for other namespaces."""
+    ns, _, local = tag[1:].partition("}")
+    return local if ns in _W_NS else None
+
+
+def _w_attr(elem: ET.Element, name: str) -> Optional[str]:
+    for ns in _W_NS:
+        v = elem.get(f"{{{ns}}}{name}")
+        if v is not None:
+            return v
+    return None
+
+
+def _docx_main_part(zf: zipfile.ZipFile) -> str:
+    try:
+        rels = ET.fromstring(zf.read("_rels/.rels"))
+        for rel in rels.iter(f"{_REL_NS}Relationship"):
+            if rel.get("Type", "").endswith("/officeDocument"):
+                return rel.get("Target", "").lstrip("/")
+    except (KeyError, ET.ParseError):
+        pass
+    return "word/document.xml"
+
+
+def _iter_docx_blocks(docx_path: str) -> Iterator[str]:
+    """
+    Body paragraphs and table cells of a DOCX, in document order, streamed
+    from the main XML part (each element is dropped once read, so memory
+    stays flat on long files). Vertically merged continuation cells are
+    skipped instead of repeating the first cell's text.
+    """
+    with zipfile.ZipFile(docx_path) as zf, zf.open(_docx_main_part(zf)) as xml:
+        stack: List[str] = []  # local names of the open elements
+        parents: List[ET.Element] = []
+        paras: List[List[str]] = []  # open w:p (text boxes nest them)
+        cells: List[Dict] = []  # open w:tc: {"lines": [...], "merged": bool}
+        skip = 0  # depth inside skipped subtrees
+
+        for event, elem in ET.iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+            local = _w(tag)
+            if event == "start":
+                stack.append(local)
+                parents.append(elem)
+                if tag == _MC_FALLBACK or local in _W_SKIP:
+                    skip += 1
+                elif skip:
+                    pass
+                elif local == "p":
+                    paras.append([])
+                elif local == "tc":
+                    cells.append({"lines": [], "merged": False})
+                elif local == "tbl" and cells:
+                    # nested table: flush what the outer cell has so far
+                    text = "\n".join(cells[-1]["lines"]).strip()
+                    cells[-1]["lines"] = []
+                    if text and not cells[-1]["merged"]:
+                        yield text
+                continue
+
+            stack.pop()
+            parents.pop()
+            if parents:
+                parents[-1].remove(elem)
+            in_run = bool(stack) and stack[-1] == "r"
+
+            if tag == _MC_FALLBACK or local in _W_SKIP:
+                skip -= 1
+            elif skip or local is None:
+                pass
+            elif local == "t" and in_run and paras:
+                paras[-1].append(elem.text or "")
+            elif local in _RUN_TEXT and in_run and paras:
+                if local == "br" and _w_attr(elem, "type") not in (None, "textWrapping"):
+                    continue  # page / column break
+                paras[-1].append(_RUN_TEXT[local])
+            elif local in ("vMerge", "hMerge") and cells:
+                if (_w_attr(elem, "val") or "continue") == "continue":
+                    cells[-1]["merged"] = True
+            elif local == "p" and paras:
+                text = "".join(paras.pop())
+                if cells:
+                    cells[-1]["lines"].append(text)
+                elif text:
+                    yield text
+            elif local == "tc" and cells:
+                cell = cells.pop()
+                text = "\n".join(cell["lines"]).strip()
+                if text and not cell["merged"]:
+                    yield text
 
 
 def _read_docx_text(docx_path: str) -> str:
-    if Document is None:
-        raise RuntimeError("python-docx not available. Add it to requirements / environment.")
-    doc = Document(docx_path)
-    parts = []
-    for para in doc.paragraphs:
-        if para.text:
-            parts.append(para.text)
-    # tables too (often used in Europass)
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                txt = cell.text.strip()
-                if txt:
-                    parts.append(txt)
-    return "\n".join(parts)
+    return "\n".join(_iter_docx_blocks(docx_path))
 
 
 # -----------------------------
 # Public API
 # -----------------------------
-def text_to_cv(text: str, lang_hint: str = "en") -> Dict:
-    blocks = _extract_blocks(text)
-    exp = _extract_experience_items(text)
-    educatie = _extract_education(blocks, text)
+def _personal_fields(blocks: Dict[str, any]) -> Dict:
+    """CV name/headline/contact keys (+ contact_items) from _extract_header output."""
+    # Contacts + contact_items
+    email = blocks.get("email", "")
+    phone = blocks.get("telefon", "")
+    location = blocks.get("adresa", "")
+    linkedin = blocks.get("linkedin", "")
+    github = blocks.get("github", "")
+    website = blocks.get("website", "")
+    if email and website and website.lower().replace("www.", "") in email.lower():
+        website = ""
+
+    return {
+        "nume_prenume": blocks.get("nume", ""),
+        "full_name": blocks.get("nume", ""),
+        "profile_line": blocks.get("profile_line", ""),
+        "pozitie_vizata": blocks.get("headline", ""),
+        "email": email,
+        "telefon": phone,
+        "adresa": location,
+        "linkedin": linkedin,
+        "github": github,
+        "website": website,
+        "contact_items": _make_contact_items(email, phone, location, linkedin, github, website),
+    }
+
+
+def _stage(timing: Optional[AutofillTimer], name: str):
+    """timing.stage(name), or a no-op that still yields a row to fill in."""
+    return timing.stage(name) if timing is not None else nullcontext({})
+
+
+def text_to_cv(text: str, lang_hint: str = "en", timing: Optional[AutofillTimer] = None) -> Dict:
+    # matches: what each stage's patterns found (section headings, filled fields, entries)
+    with _stage(timing, "sections") as row:
+        sections = _SectionIndex(text)
+        row.update(chars=len(text), matches=len({pos for hits in sections.hits.values() for pos in hits}))
+    with _stage(timing, "blocks") as row:
+        blocks = _extract_blocks(text, sections)
+        row.update(chars=len(text), matches=sum(1 for v in blocks.values() if v))
+    with _stage(timing, "experience") as row:
+        exp = _extract_experience_items(text)
+        row.update(chars=len(text), matches=len(exp))
+    with _stage(timing, "education") as row:
+        educatie = _extract_education(blocks, text, sections)
+        row.update(chars=len(text), matches=len(educatie))
 
     # Summary bullets
     summary_bullets = _summary_to_bullets(blocks.get("about", ""))
@@ -550,18 +1009,6 @@ def text_to_cv(text: str, lang_hint: str = "en") -> Dict:
 
     driving = blocks.get("driving", []) or []
 
-    # Contacts + contact_items
-    email = blocks.get("email", "")
-    phone = blocks.get("telefon", "")
-    location = blocks.get("adresa", "")
-    linkedin = blocks.get("linkedin", "")
-    github = blocks.get("github", "")
-    website = blocks.get("website", "")
-    if email and website and website.lower().replace("www.", "") in email.lower():
-        website = ""
-
-    contact_items = _make_contact_items(email, phone, location, linkedin, github, website)
-
     # personal_info_extra: keep city/availability if present in text; we store location in adresa
     personal_extra = []
     # heuristic: if availability appears
@@ -570,17 +1017,7 @@ def text_to_cv(text: str, lang_hint: str = "en") -> Dict:
         personal_extra.append({"label": "Availability", "value": av})
 
     cv = {
-        "nume_prenume": blocks.get("nume", ""),
-        "full_name": blocks.get("nume", ""),
-        "profile_line": blocks.get("profile_line", ""),
-        "pozitie_vizata": blocks.get("headline", ""),
-        "email": email,
-        "telefon": phone,
-        "adresa": location,
-        "linkedin": linkedin,
-        "github": github,
-        "website": website,
-        "contact_items": contact_items,
+        **_personal_fields(blocks),
         "rezumat_bullets": summary_bullets,
         "experienta": exp,
         "educatie": educatie,
@@ -608,13 +1045,132 @@ def docx_to_cv(docx_path: str, lang_hint: str = "en") -> Dict:
     return text_to_cv(text, lang_hint=lang_hint)
 
 
-def file_to_cv(path: str, lang_hint: str = "en") -> Dict:
+def preview_fields(text: str) -> Dict:
+    """Name/headline/contact fields of a partial text (e.g. the first page)."""
+    return _personal_fields(_extract_header(text))
+
+
+def _note(timing: Optional[AutofillTimer], **info) -> None:
+    """Run facts for the timing report (file kind/size, cache outcome, chars)."""
+    if timing is not None:
+        timing.info.update(info)
+
+
+def _timing_start(timing: Optional[AutofillTimer], path: str, lang_hint: str) -> None:
+    if timing is not None:
+        kind = os.path.splitext(path)[1].lower().lstrip(".")
+        timing.info.update(kind=kind, bytes=os.path.getsize(path), lang=lang_hint)
+
+
+def file_to_cv_staged(
+    path: str, lang_hint: str = "en", use_cache: bool = True, timing: Optional[AutofillTimer] = None
+) -> Iterator[Tuple[str, Dict]]:
+    """
+    Autofill in two stages for a quick preview. For a PDF not seen before,
+    yields ("preview", fields) from the first page alone (name, headline,
+    contact fields), then reads the remaining pages and yields
+    ("full", cv) -- the same dict file_to_cv returns. DOCX files and cache
+    hits yield only ("full", cv).
+    """
+    p = (path or "").lower().strip()
+    if not p.endswith(".pdf"):
+        yield "full", file_to_cv(path, lang_hint=lang_hint, use_cache=use_cache, timing=timing)
+        return
+
+    _timing_start(timing, path, lang_hint)
+    sha = ""
+    if use_cache:
+        with _stage(timing, "cache_lookup"):
+            sha = autofill_cache.file_sha256(path)
+            cv = autofill_cache.get_cv(sha, lang_hint)
+            text = autofill_cache.get_text(sha) if cv is None else None
+        if cv is not None:
+            _note(timing, cache="cv")
+            yield "full", cv
+            return
+        if text is not None:
+            _note(timing, cache="text", chars=len(text))
+            cv = text_to_cv(text, lang_hint=lang_hint, timing=timing)
+            with _stage(timing, "cache_store"):
+                autofill_cache.put_cv(sha, lang_hint, cv)
+            yield "full", cv
+            return
+    _note(timing, cache="miss" if use_cache else "off")
+
+    with _stage(timing, "read_first_page") as row:
+        first, n_pages = _read_pdf_first_page(path, timing)
+        row["chars"] = len(first)
+    with _stage(timing, "preview") as row:
+        fields = preview_fields(first)
+        row.update(chars=len(first), matches=sum(1 for k in ("email", "telefon", "adresa") if fields[k]))
+    yield "preview", fields
+
+    pages = [first]
+    if n_pages > 1:
+        with _stage(timing, "read_rest") as row:
+            pool = _get_pool() if n_pages - 1 >= PARALLEL_MIN_PAGES else None
+            rest = _read_pdf_pages(path, 1, n_pages, pool, timing is not None)
+            if timing is not None:
+                rest = timing.add_pages(rest, first=1)
+            pages += rest
+            row["chars"] = sum(map(len, rest))
+    text = "\n".join(pages)
+    _note(timing, chars=len(text))
+    cv = text_to_cv(text, lang_hint=lang_hint, timing=timing)
+    if use_cache:
+        with _stage(timing, "cache_store"):
+            autofill_cache.put_text(sha, text)
+            autofill_cache.put_cv(sha, lang_hint, cv)
+    yield "full", cv
+
+
+def file_to_cv(
+    path: str, lang_hint: str = "en", use_cache: bool = True, timing: Optional[AutofillTimer] = None
+) -> Dict:
     """
     Dispatch based on extension. Supports .pdf and .docx
+
+    Raw text and parsed CV are cached by the file's SHA-256 (+ extractor /
+    parser version), so re-uploading a known file skips pdfplumber.
+    Pass an AutofillTimer as `timing` to get per-stage / per-page timings.
     """
     p = (path or "").lower().strip()
     if p.endswith(".pdf"):
-        return pdf_to_cv(path, lang_hint=lang_hint)
-    if p.endswith(".docx"):
-        return docx_to_cv(path, lang_hint=lang_hint)
-    raise ValueError("Unsupported file type. Please upload PDF or DOCX.")
+        is_pdf = True
+    elif p.endswith(".docx"):
+        is_pdf = False
+    else:
+        raise ValueError("Unsupported file type. Please upload PDF or DOCX.")
+
+    def read() -> str:
+        with _stage(timing, "read") as row:
+            text = _read_pdf_text(path, timing) if is_pdf else _read_docx_text(path)
+            row["chars"] = len(text)
+        return text
+
+    _timing_start(timing, path, lang_hint)
+    if not use_cache:
+        _note(timing, cache="off")
+        text = read()
+        _note(timing, chars=len(text))
+        return text_to_cv(text, lang_hint=lang_hint, timing=timing)
+
+    with _stage(timing, "cache_lookup"):
+        sha = autofill_cache.file_sha256(path)
+        cv = autofill_cache.get_cv(sha, lang_hint)
+        text = autofill_cache.get_text(sha) if cv is None else None
+    if cv is not None:
+        _note(timing, cache="cv")
+        return cv
+
+    _note(timing, cache="miss" if text is None else "text")
+    fresh = text is None
+    if fresh:
+        text = read()
+    _note(timing, chars=len(text))
+    cv = text_to_cv(text, lang_hint=lang_hint, timing=timing)
+    with _stage(timing, "cache_store"):
+        if fresh:
+            autofill_cache.put_text(sha, text)
+        autofill_cache.put_cv(sha, lang_hint, cv)
+    return cv
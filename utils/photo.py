@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+from io import BytesIO
+from typing import Dict, Optional
+
+from utils.cache_store import TieredCache
+
+try:
+    from PIL import Image, ImageOps
+except Exception:  # Pillow missing -> photos pass through untouched
+    Image = None
+    ImageOps = None
+
+
+# Bump when the pipeline output changes so cached variants are rebuilt.
+PHOTO_PIPELINE_VERSION = 2
+
+# The exporters print the photo as a square of at most 1.3 in (Europass
+# PDF/DOCX); 300 DPI covers print quality. "preview" is the on-screen thumbnail.
+PRINT_SIZE_IN = 1.3
+PRINT_DPI = 300
+VARIANTS: Dict[str, int] = {
+    "print": round(PRINT_SIZE_IN * PRINT_DPI),
+    "preview": 180,
+}
+JPEG_QUALITY = 88
+
+_cache = TieredCache(max_items=32, max_memory_bytes=16 * 1024 * 1024)
+
+
+def _has_alpha(img) -> bool:
+    return img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+
+
+def _has_metadata(img) -> bool:
+    """EXIF (incl. GPS and orientation) or XMP packets that a re-encode would drop."""
+    return bool(img.getexif()) or any(k in img.info for k in ("exif", "xmp", "XML:com.adobe.xmp"))
+
+
+def _process(raw: bytes, size: int) -> bytes:
+    img = Image.open(BytesIO(raw))
+    w, h = img.size
+    if img.format in ("JPEG", "PNG") and w == h <= size and not _has_metadata(img):
+        return raw  # already normalized (e.g. the upload pipeline's own output)
+    img = ImageOps.exif_transpose(img)  # honour the camera's orientation tag
+
+    # center crop to a square: the exporters draw the photo square
+    w, h = img.size
+    side = min(w, h)
+    left, top = (w - side) // 2, (h - side) // 2
+    img = img.crop((left, top, left + side, top + side))
+    if side > size:
+        img = img.resize((size, size), Image.LANCZOS)
+
+    # re-encode without EXIF/GPS metadata; PNG only when transparency matters
+    out = BytesIO()
+    if _has_alpha(img):
+        img.convert("RGBA").save(out, format="PNG", optimize=True)
+    else:
+        img.convert("RGB").save(
+            out, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True, dpi=(PRINT_DPI, PRINT_DPI)
+        )
+    return out.getvalue()
+
+
+def photo_variant(raw: Optional[bytes], variant: str = "print") -> Optional[bytes]:
+    """
+    Oriented, square-cropped, downscaled re-encode of an uploaded photo.
+    Results are cached by source hash, so repeated exports reuse them.
+    Falls back to the original bytes if Pillow is unavailable or cannot
+    decode the image.
+    """
+    if not raw:
+        return None
+    raw = bytes(raw)
+    if Image is None:
+        return raw
+
+    size = VARIANTS[variant]
+    key = hashlib.sha256(raw).hexdigest()
+    ck = hashlib.sha256(f"{key}|{variant}|{size}|{PHOTO_PIPELINE_VERSION}".encode("utf-8")).hexdigest()
+    data = _cache.get(ck)
+    if data is None:
+        try:
+            data = _process(raw, size)
+        except Exception:
+            return raw
+        _cache.put(ck, data)
+    return data
+
+
+def prepare_uploaded_photo(raw: bytes) -> bytes:
+    """Normalize an upload once; the session keeps only the print variant."""
+    return photo_variant(raw, "print") or raw
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import pickle
 import re
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from utils.paths import cache_dir
+
 
 ATS_PROFILES_DIR = "ats_profiles"
 
+# libyaml is several times faster; fall back to the pure-Python loader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when normalize_profile / the cached entry layout changes
+_INDEX_VERSION = 1
+
 
 class ProfileError(Exception):
     pass
@@ -49,6 +60,11 @@ def _write_text(path: str, text: str) -> None:
             f.write(text)
     except Exception as e:
         raise ProfileError(f"Failed to write profile: {e}")
+    _index_forget(os.path.basename(path))
+
+
+def _yaml_load(text: str) -> Any:
+    return yaml.load(text, Loader=_YamlLoader)
 
 
 def _safe_list(x: Any) -> List[str]:
@@ -251,6 +267,101 @@ def normalize_profile(profile: Dict[str, Any], fallback_id: str = "") -> Dict[st
     return p
 
 
+# ---- compiled profile index ----
+# Parsed + normalized profiles are pickled under the user data dir and
+# revalidated per file by (mtime, size), so reruns skip YAML entirely.
+# Entry: (stamp, title, pickled profile or None, error message or None)
+_index_lock = threading.Lock()
+_index_entries: Dict[str, Tuple[Tuple[int, int], str, Optional[bytes], Optional[str]]] = {}
+_index_dir: Optional[str] = None
+
+
+def _index_path(abs_dir: str) -> str:
+    tag = hashlib.sha1(abs_dir.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(str(cache_dir()), f"profile_index-{tag}.pickle")
+
+
+def _index_open() -> Dict[str, Tuple[Tuple[int, int], str, Optional[bytes], Optional[str]]]:
+    """In-memory index for the current ATS_PROFILES_DIR (loaded from disk once)."""
+    global _index_dir, _index_entries
+    abs_dir = os.path.abspath(ATS_PROFILES_DIR)
+    if _index_dir == abs_dir:
+        return _index_entries
+    entries = {}
+    try:
+        with open(_index_path(abs_dir), "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") == _INDEX_VERSION and data.get("dir") == abs_dir:
+            entries = data["entries"]
+    except Exception:
+        pass
+    _index_dir, _index_entries = abs_dir, entries
+    return entries
+
+
+def _index_save() -> None:
+    if _index_dir is None:
+        return
+    try:
+        path = _index_path(_index_dir)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                {"version": _INDEX_VERSION, "dir": _index_dir, "entries": _index_entries},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+    except Exception:
+        # cache only; a read-only data dir just means re-parsing next run
+        pass
+
+
+def _index_forget(filename: str) -> None:
+    with _index_lock:
+        if _index_entries.pop(filename, None) is not None:
+            _index_save()
+
+
+def _compile_entry(path: str, pid: str) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """Parse + normalize one YAML file -> (title, pickled profile, error)."""
+    from utils.ats_scoring import flatten_keywords
+
+    title = pid.replace("_", " ").title()
+    try:
+        raw = _yaml_load(_read_text(path))
+    except ProfileError as e:
+        return title, None, str(e)
+    except yaml.YAMLError as e:
+        return title, None, f"Invalid YAML: {e}"
+
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        return title, None, "Invalid YAML: root must be a mapping/object"
+    try:
+        title = (raw.get("title") or "").strip() or title
+    except Exception:
+        pass
+
+    ok, warnings = validate_profile(raw)
+    # normalize always; warnings can be shown in UI by caller
+    prof = normalize_profile(raw, fallback_id=pid)
+    prof["_warnings"] = warnings
+    prof["_source_file"] = os.path.basename(path)
+    prof["_keywords_flat"] = flatten_keywords(prof["keywords"])
+    return title, pickle.dumps(prof, protocol=pickle.HIGHEST_PROTOCOL), None
+
+
+def _index_lookup(entries, filename: str, stamp: Tuple[int, int]) -> Tuple[Tuple[int, int], str, Optional[bytes], Optional[str]]:
+    """Caller holds _index_lock. Returns a fresh entry, recompiling if the file changed."""
+    entry = entries.get(filename)
+    if entry is None or entry[0] != stamp:
+        title, blob, err = _compile_entry(os.path.join(ATS_PROFILES_DIR, filename), filename[:-len(".yaml")])
+        entry = entries[filename] = (stamp, title, blob, err)
+    return entry
+
+
 def list_profiles() -> List[Dict[str, str]]:
     """
     Returns a list of {id, filename, title}.
@@ -258,20 +369,25 @@ def list_profiles() -> List[Dict[str, str]]:
     """
     _ensure_dir()
     out: List[Dict[str, str]] = []
-    for fn in sorted(os.listdir(ATS_PROFILES_DIR)):
-        if not fn.endswith(".yaml"):
-            continue
-        pid = fn[:-5]
-        path = profile_path(pid)
-        title = pid.replace("_", " ").title()
-        # try to read title quickly (best-effort)
-        try:
-            data = yaml.safe_load(_read_text(path)) or {}
-            if isinstance(data, dict):
-                title = (data.get("title") or "").strip() or title
-        except Exception:
-            pass
-        out.append({"id": pid, "filename": fn, "title": title})
+    with _index_lock:
+        entries = _index_open()
+        before = dict(entries)
+        seen = set()
+        for de in sorted(os.scandir(ATS_PROFILES_DIR), key=lambda d: d.name):
+            fn = de.name
+            if not fn.endswith(".yaml"):
+                continue
+            try:
+                st = de.stat()
+            except OSError:
+                continue
+            seen.add(fn)
+            entry = _index_lookup(entries, fn, (st.st_mtime_ns, st.st_size))
+            out.append({"id": fn[:-5], "filename": fn, "title": entry[1]})
+        for fn in [fn for fn in entries if fn not in seen]:
+            del entries[fn]
+        if entries != before:
+            _index_save()
     return out
 
 
@@ -284,18 +400,40 @@ def load_profile(profile_id: str) -> Dict[str, Any]:
         raise ProfileError("No profile selected")
 
     path = profile_path(pid)
-    raw = yaml.safe_load(_read_text(path))
-    if raw is None:
-        raw = {}
-    if not isinstance(raw, dict):
-        raise ProfileError("Invalid YAML: root must be a mapping/object")
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise ProfileError(f"Profile not found: {path}")
+    except OSError as e:
+        raise ProfileError(f"Failed to read profile: {e}")
 
-    ok, warnings = validate_profile(raw)
-    # normalize always; warnings can be shown in UI by caller
-    prof = normalize_profile(raw, fallback_id=pid)
-    prof["_warnings"] = warnings
-    prof["_source_file"] = os.path.basename(path)
-    return prof
+    fn = os.path.relpath(path, ATS_PROFILES_DIR)
+    with _index_lock:
+        entries = _index_open()
+        stale = entries.get(fn)
+        entry = _index_lookup(entries, fn, (st.st_mtime_ns, st.st_size))
+        if entry is not stale:
+            _index_save()
+
+    _, _, blob, err = entry
+    if err is not None:
+        raise ProfileError(err)
+    # unpickling hands every caller its own copy
+    return pickle.loads(blob)
+
+
+def load_all_profiles() -> List[Dict[str, Any]]:
+    """
+    Load and normalize every profile (used for cross-profile ranking).
+    Broken YAML files are skipped.
+    """
+    out: List[Dict[str, Any]] = []
+    for p in list_profiles():
+        try:
+            out.append(load_profile(p["id"]))
+        except ProfileError:
+            continue
+    return out
 
 
 def save_profile_text(profile_id: str, yaml_text: str) -> None:
@@ -308,7 +446,7 @@ def save_profile_text(profile_id: str, yaml_text: str) -> None:
 
     # Validate YAML before writing
     try:
-        parsed = yaml.safe_load(yaml_text)
+        parsed = _yaml_load(yaml_text)
         if parsed is None:
             parsed = {}
         if not isinstance(parsed, dict):